@@ -1,6 +1,7 @@
 import logging
 import os
 
+import aiohttp
 from dotenv import load_dotenv
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_bolt.async_app import AsyncApp
@@ -22,6 +23,8 @@ app = AsyncApp(
 
 # Register all handlers from modules
 from src import register_all_handlers
+from src.common.response_cache import init_response_cache
+from src.notion.wake_up import drain_wake_up_queue
 from src.schedule import get_scheduler
 
 # Register handlers
@@ -33,15 +36,62 @@ scheduler = get_scheduler(app)
 logger.info("✅ Scheduler initialized")
 
 
+def _slack_max_concurrent_requests() -> int:
+  """
+  Slack Web API 동시 요청 수 (SLACK_MAX_CONCURRENT_REQUESTS, 기본 3)
+
+  aiohttp 커넥터는 limit=0 을 "무제한"으로 해석하므로 잘못된 값이나 0 이하는 기본값으로 대체합니다.
+  """
+  raw = os.getenv("SLACK_MAX_CONCURRENT_REQUESTS", "3")
+  try:
+    limit = int(raw)
+  except ValueError:
+    limit = 0
+
+  if limit <= 0:
+    logger.warning(f"⚠️ SLACK_MAX_CONCURRENT_REQUESTS 값이 올바르지 않아 기본값 3을 사용합니다: {raw}")
+    return 3
+  return limit
+
+
+def create_slack_http_session() -> aiohttp.ClientSession:
+  """
+  Slack Web API 호출에 공유할 aiohttp 세션 생성
+
+  세션을 지정하지 않으면 AsyncWebClient 가 호출마다 세션을 새로 만들어 TCP/TLS 연결을
+  다시 맺으므로, keep-alive 연결 풀을 하나 두고 모든 요청이 재사용합니다.
+  커넥터의 연결 수 제한이 모든 Slack 호출에 대한 전역 동시성 제한 역할을 합니다
+  (초과 요청은 연결이 빌 때까지 대기).
+  (이벤트 루프 안에서 생성해야 함)
+  """
+  connector = aiohttp.TCPConnector(
+      limit=_slack_max_concurrent_requests(),
+      keepalive_timeout=75,
+  )
+  return aiohttp.ClientSession(connector=connector)
+
+
 async def main():
   """Start the Socket Mode handler and scheduler"""
   logger.info("🚀 Starting Secretary Slack Bot...")
 
+  # 핸들러별 client 는 app.client 의 세션을 그대로 물려받으므로 여기서 한 번만 지정
+  slack_session = create_slack_http_session()
+  app.client.session = slack_session
+
+  # AI 응답 캐시 (LLM_CACHE 사용 시 diskcache 누락을 시작 시점에 경고)
+  init_response_cache()
+
   # Start scheduler
   scheduler.start()
 
   handler = AsyncSocketModeHandler(app, os.getenv("SLACK_APP_TOKEN"))
-  await handler.start_async()
+  try:
+    await handler.start_async()
+  finally:
+    # 쓰기 큐에 남은 기상 기록 저장 (실패 알림이 Slack 세션을 쓰므로 세션을 닫기 전에)
+    await drain_wake_up_queue()
+    await slack_session.close()
 
 
 if __name__ == "__main__":
@@ -13,8 +13,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
+from zoneinfo import ZoneInfo
 
-import pytz
 from dotenv import load_dotenv
 
 # Load .env file from project root
@@ -39,7 +39,7 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
 # Configuration
 BATCH_SIZE = 3  # 동시 처리 개수 (월간 리포트는 더 무거우므로 3개)
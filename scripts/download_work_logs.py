@@ -8,8 +8,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
+from zoneinfo import ZoneInfo
 
-import pytz
 from dotenv import load_dotenv
 
 # Add parent directory to path
@@ -26,7 +26,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
 
 async def download_work_logs(
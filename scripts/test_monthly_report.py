@@ -5,8 +5,8 @@ import logging
 import os
 import sys
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-import pytz
 from dotenv import load_dotenv
 
 # Add parent directory to path
@@ -22,7 +22,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
 
 async def test_monthly_report():
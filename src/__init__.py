@@ -1,5 +1,8 @@
 """Secretary Slack Bot - Main Package"""
 
+import logging
+import weakref
+
 from .chat import register_chat_handlers
 from .commands import register_slash_commands
 from .commands.work_log_webhook_handler import register_work_log_webhook_handler
@@ -18,8 +21,19 @@ __all__ = [
 ]
 
 
+logger = logging.getLogger(__name__)
+
+# 핸들러를 이미 등록한 앱 (같은 앱에 두 번 등록하면 모든 이벤트가 두 번 처리됨)
+_registered_apps: "weakref.WeakSet" = weakref.WeakSet()
+
+
 def register_all_handlers(app):
-  """Register all handlers to the app"""
+  """Register all handlers to the app (같은 앱에는 한 번만 등록)"""
+  if app in _registered_apps:
+    logger.warning("⚠️ Handlers are already registered for this app, skipping")
+    return
+  _registered_apps.add(app)
+
   register_chat_handlers(app)
   register_qa_handlers(app)
   register_slash_commands(app)
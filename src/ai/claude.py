@@ -1,6 +1,7 @@
 """Claude Code CLI 제공자 (로컬 CLI)"""
 
 import asyncio
+import json
 import logging
 import os
 import shutil
@@ -45,18 +46,18 @@ class ClaudeProvider(AIProvider):
   ) -> str:
     """Claude CLI를 사용하여 응답 생성"""
     try:
-      # Combine system prompt with user prompt if provided
-      full_prompt = prompt
+      # 시스템 프롬프트는 CLI의 시스템 프롬프트 영역에 붙여서 전달합니다.
+      # 요청마다 동일한 앞부분(지시문, 이력서 등)이 프롬프트 캐시에 적중하도록
+      # 유저 프롬프트에는 매번 바뀌는 내용만 넣습니다.
+      cmd = ["claude", "-p", prompt, "--output-format", "json"]
       if system_prompt:
-        full_prompt = f"{system_prompt}\n\n{prompt}"
+        cmd.extend(["--append-system-prompt", system_prompt])
 
       logger.info("🤖 Claude CLI 응답 생성 중...")
 
       # Run claude CLI command
       process = await asyncio.create_subprocess_exec(
-          "claude",
-          "-p",
-          full_prompt,
+          *cmd,
           stdout=asyncio.subprocess.PIPE,
           stderr=asyncio.subprocess.PIPE,
       )
@@ -67,10 +68,53 @@ class ClaudeProvider(AIProvider):
         error_msg = stderr.decode() if stderr else "Unknown error"
         raise RuntimeError(f"Claude CLI failed: {error_msg}")
 
-      result = stdout.decode().strip()
+      result = self._parse_output(stdout.decode())
       logger.info(f"✅ Claude 응답 생성 완료 ({len(result)}자)")
       return result
 
     except Exception as e:
       logger.error(f"❌ Claude 응답 생성 실패: {e}")
       raise
+
+  @staticmethod
+  def _parse_output(raw: str) -> str:
+    """
+    CLI JSON 출력에서 응답 텍스트를 꺼내고 캐시 사용량을 기록합니다.
+
+    Args:
+        raw: claude CLI stdout
+
+    Returns:
+        응답 텍스트 (JSON이 아니면 원문 그대로)
+
+    Raises:
+        RuntimeError: CLI가 에러를 보고했거나 응답이 비어 있을 때
+            (호출 측에서 Gemini fallback 이 동작하도록 빈 문자열을 반환하지 않음)
+    """
+    try:
+      data = json.loads(raw)
+    except json.JSONDecodeError:
+      text = raw.strip()
+      if not text:
+        raise RuntimeError("Claude CLI returned empty output")
+      return text
+
+    if not isinstance(data, dict):
+      raise RuntimeError(f"Claude CLI returned unexpected JSON: {type(data).__name__}")
+
+    usage = data.get("usage") or {}
+    logger.info(
+        f"📦 Claude 프롬프트 캐시: "
+        f"read={usage.get('cache_read_input_tokens', 0)}, "
+        f"write={usage.get('cache_creation_input_tokens', 0)}, "
+        f"input={usage.get('input_tokens', 0)}"
+    )
+
+    result = data.get("result")
+    if data.get("is_error"):
+      raise RuntimeError(f"Claude CLI error: {result or data.get('subtype') or 'unknown'}")
+
+    text = result.strip() if isinstance(result, str) else ""
+    if not text:
+      raise RuntimeError("Claude CLI returned an empty result")
+    return text
@@ -47,6 +47,7 @@ class GeminiProvider(AIProvider):
     """Gemini CLI를 사용하여 응답 생성"""
     try:
       # Combine system prompt with user prompt if provided
+      # (고정된 시스템 프롬프트를 앞에 두어 Gemini 암묵적 프롬프트 캐시가 적중하도록 함)
       full_prompt = prompt
       if system_prompt:
         full_prompt = f"{system_prompt}\n\n{prompt}"
@@ -0,0 +1,257 @@
+"""주간/월간 리포트 분석기 공통 로직"""
+
+import asyncio
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from .. import ai
+from ..common.notion_cache import get_cached_page_content, get_cached_resume_content
+from ..common.response_cache import (
+    get_cached_response,
+    make_response_key,
+    store_response,
+)
+
+logger = logging.getLogger(__name__)
+
+# ```markdown ... ``` 또는 ``` ... ``` 코드 블록 본문
+_MD_FENCE = re.compile(r'```(?:markdown)?\s*\n(.*?)```', re.DOTALL)
+
+# 이력서 인스턴스 캐시 TTL (초) - 이 시간 동안은 수정 여부 확인(pages.retrieve)도 생략
+_RESUME_CACHE_TTL = 600
+
+# 페이지 본문 동시 조회 수 (Notion API 는 평균 초당 3회 제한, 페이지마다 블록 페이지네이션 요청 발생)
+_PAGE_FETCH_CONCURRENCY = 3
+
+
+def _strip_code_fence(text: str) -> str:
+  """
+  AI 응답을 감싼 마크다운 코드 블록을 벗겨냅니다.
+
+  대부분의 응답은 코드 블록이 없거나 응답 전체가 ```markdown 으로 감싸져 있으므로
+  문자열 연산으로 먼저 처리하고, 그 외 형태일 때만 정규식을 사용합니다.
+
+  Args:
+      text: AI 응답 텍스트
+
+  Returns:
+      코드 블록 안의 본문 (코드 블록이 없으면 원문)
+  """
+  if "```" not in text:
+    return text
+
+  stripped = text.lstrip()
+  if stripped.startswith("```"):
+    newline = stripped.find("\n")
+    end = stripped.rfind("```")
+    if 0 < newline < end and stripped[3:newline].strip() in ("", "markdown"):
+      return stripped[newline + 1:end]
+
+  fence_match = _MD_FENCE.search(text)
+  return fence_match.group(1) if fence_match else text
+
+
+class BaseReportAnalyzer(ABC):
+  """
+  Notion 페이지 목록을 모아 AI로 분석하는 리포트 분석기 기반 클래스
+
+  페이지 본문 조회 → 항목 결합 → 이력서 로드 → 프롬프트 구성 → AI 호출 →
+  결과 정리 흐름을 공통으로 처리합니다. 서브클래스는 아래 클래스 속성과
+  extract_metadata / format_entry 만 구현합니다.
+  """
+
+  # 로그용 이름 (예: "주간", "업무일지")
+  analysis_label: str = ""
+  entry_label: str = ""
+  # 페이지 본문 추출 형식 ("text" 또는 "markdown")
+  content_format: str = "text"
+  # 시스템 지시문
+  system_prompt: str = ""
+  # format_map 용 프롬프트 템플릿 (앞부분: {resume_content}, 뒷부분: {entries_placeholder})
+  prompt_prefix: str = ""
+  prompt_suffix: str = ""
+  entries_placeholder: str = ""
+  # AI 응답을 감싼 코드 블록 제거 여부
+  strip_code_fence: bool = False
+
+  def __init__(self, ai_provider_type: str = "claude"):
+    """
+    Initialize analyzer
+
+    Args:
+        ai_provider_type: AI provider type (gemini, claude, ollama)
+    """
+    self.ai_provider_type = ai_provider_type
+    self.last_used_ai_provider: Optional[str] = None
+    # resume_page_id -> (조회 시각, 콘텐츠)
+    self._resume_cache: Dict[str, Tuple[float, str]] = {}
+
+  @abstractmethod
+  def extract_metadata(self, page: Dict) -> Dict:
+    """
+    Notion 페이지에서 분석에 필요한 메타데이터 추출
+
+    Args:
+        page: Notion page object (page_id 키 필수)
+
+    Returns:
+        메타데이터 딕셔너리
+    """
+    pass
+
+  @abstractmethod
+  def format_entry(self, metadata: Dict, content: str) -> str:
+    """
+    한 페이지를 프롬프트에 넣을 텍스트로 변환
+
+    Args:
+        metadata: extract_metadata 결과
+        content: 페이지 본문
+
+    Returns:
+        항목 텍스트
+    """
+    pass
+
+  async def get_page_content(
+      self,
+      page_id: str,
+      notion_client,
+      last_edited_time: Optional[str] = None
+  ) -> str:
+    """
+    페이지 본문 내용 가져오기 (last_edited_time 기준 캐시)
+
+    Args:
+        page_id: Notion page ID
+        notion_client: NotionClient instance
+        last_edited_time: 페이지 수정 시각 (없으면 캐시 미사용)
+
+    Returns:
+        페이지 본문 텍스트
+    """
+    return await get_cached_page_content(
+        notion_client, page_id, last_edited_time, format=self.content_format)
+
+  async def get_resume_content(self, resume_page_id: str, notion_client) -> str:
+    """
+    이력서 페이지 본문 가져오기 (10분 내 재호출 시 인스턴스 캐시, 이후에는 수정 여부 확인)
+
+    Args:
+        resume_page_id: 이력서 페이지 ID
+        notion_client: NotionClient instance
+
+    Returns:
+        이력서 본문 텍스트
+    """
+    entry = self._resume_cache.get(resume_page_id)
+    if entry and time.monotonic() - entry[0] < _RESUME_CACHE_TTL:
+      return entry[1]
+
+    content = await get_cached_resume_content(
+        notion_client, resume_page_id, format=self.content_format)
+    if content:
+      self._resume_cache[resume_page_id] = (time.monotonic(), content)
+    return content
+
+  async def _load_resume(self, resume_page_id: Optional[str], notion_client) -> str:
+    """이력서 내용 읽기 (실패해도 분석은 계속 진행)"""
+    if not resume_page_id:
+      return ""
+
+    try:
+      logger.info(f"📄 이력서 페이지 읽기: {resume_page_id}")
+      resume_content = await self.get_resume_content(resume_page_id, notion_client)
+      if resume_content:
+        logger.info(f"✅ 이력서 내용 로드 완료 ({len(resume_content)}자)")
+      else:
+        logger.warning("⚠️ 이력서 페이지가 비어있습니다")
+      return resume_content
+    except Exception as e:
+      logger.warning(f"⚠️ 이력서 읽기 실패 (선택사항): {e}")
+      return ""
+
+  async def _format_page(
+      self,
+      page: Dict,
+      notion_client,
+      semaphore: asyncio.Semaphore
+  ) -> str:
+    """페이지 하나의 메타데이터와 본문을 읽어 항목 텍스트로 변환 (본문이 비어 있어도 메타데이터는 포함)"""
+    metadata = self.extract_metadata(page)
+    async with semaphore:
+      content = await self.get_page_content(
+          metadata["page_id"], notion_client, page.get("last_edited_time"))
+    return self.format_entry(metadata, content)
+
+  async def run(
+      self,
+      pages: List[Dict],
+      notion_client,
+      resume_page_id: Optional[str] = None
+  ) -> str:
+    """
+    페이지 목록 분석
+
+    Args:
+        pages: 분석할 Notion 페이지 목록
+        notion_client: NotionClient instance
+        resume_page_id: 이력서 페이지 ID (선택)
+
+    Returns:
+        마크다운 형식의 분석 결과
+    """
+    try:
+      logger.info(f"📊 {self.analysis_label} 분석 시작: {len(pages)}개 {self.entry_label}")
+
+      # 1. 페이지 본문과 이력서를 동시에 조회 (결과 순서는 입력 순서 유지)
+      # (본문 조회는 Notion rate limit 에 걸리지 않도록 동시 요청 수 제한,
+      #  조회 실패는 일부만 분석하지 않도록 그대로 전파)
+      semaphore = asyncio.Semaphore(_PAGE_FETCH_CONCURRENCY)
+      entries, resume_content = await asyncio.gather(
+          asyncio.gather(*(self._format_page(page, notion_client, semaphore) for page in pages)),
+          self._load_resume(resume_page_id, notion_client),
+      )
+
+      # 2. 항목 결합 (앞뒤 공백은 마지막에 한 번만 정리)
+      combined = "\n\n---\n\n".join(entries).strip()
+
+      # 3. 프롬프트 생성
+      # 고정 부분(시스템 지시문 + 템플릿 앞부분 + 이력서)과 동적 부분(페이지 목록)을 분리
+      resume_text = resume_content if resume_content else "(이력서 정보 없음)"
+      stable_prefix = self.prompt_prefix.format_map({"resume_content": resume_text})
+      prompt = self.prompt_suffix.format_map({self.entries_placeholder: combined})
+      system_prompt = f"{self.system_prompt}\n\n{stable_prefix}"
+
+      logger.info(f"🤖 AI 분석 시작... (내용 길이: {len(combined)}자)")
+
+      # 4. AI 분석 (동일한 입력은 캐시된 응답 사용, LLM_CACHE 활성화 시)
+      cache_key = make_response_key(self.ai_provider_type, system_prompt, prompt)
+      cached = await get_cached_response(cache_key)
+      if cached:
+        analysis_text, used_provider = cached
+        logger.info("♻️ 캐시된 AI 분석 결과 사용")
+      else:
+        analysis_text, used_provider = await ai.generate_with_gemini_fallback(
+            self.ai_provider_type,
+            prompt=prompt,
+            system_prompt=system_prompt
+        )
+        await store_response(cache_key, analysis_text, used_provider)
+
+      self.last_used_ai_provider = used_provider
+      logger.info(f"✅ AI 분석 완료 (제공자: {used_provider})")
+
+      # 5. 마크다운 추출 (코드 블록 제거)
+      if self.strip_code_fence:
+        analysis_text = _strip_code_fence(analysis_text).strip()
+
+      logger.info("📋 분석 결과 추출 완료")
+      return analysis_text
+
+    except Exception as e:
+      logger.error(f"❌ {self.analysis_label} 분석 실패: {e}")
+      raise
@@ -3,17 +3,51 @@
 import logging
 from typing import Dict, List, Optional
 
-from ..ai import generate_with_gemini_fallback
-from ..common.prompt_utils import load_prompt
-from ..common.notion_utils import extract_page_content
+from ..common.prompt_utils import (
+    load_prompt,
+    split_prompt_template,
+    to_format_template,
+)
 from ..common.singleton import SimpleSingleton
+from .base import BaseReportAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# 월간 분석 시스템 지시문
+_SYSTEM_PROMPT_MONTHLY = """당신은 커리어 코치이자 이력서 작성 전문가입니다.
 
-class MonthlyAnalyzer:
+주간 리포트 개수와 관계없이 제공된 데이터를 기반으로 월간 리포트를 생성하세요.
+
+**중요**:
+- 마크다운 형식으로 응답하세요
+- 프롬프트의 마크다운 구조를 정확히 따르세요
+- "데이터가 부족합니다" 같은 응답은 금지입니다
+- 주간 리포트가 1개만 있어도 해당 데이터를 기반으로 최선의 월간 분석을 제공하세요"""
+
+# 프롬프트 템플릿은 import 시 한 번만 로드하여 AI 제공자별 인스턴스가 공유
+_PROMPT_TEMPLATE = load_prompt("monthly_report_analysis")
+# 매번 동일한 앞부분(지시문 + 이력서)은 시스템 프롬프트로 보내 캐시를 활용하고,
+# format_map 한 번으로 치환하도록 중괄호를 미리 이스케이프
+_prefix, _suffix = split_prompt_template(_PROMPT_TEMPLATE, "{weekly_reports}")
+_PROMPT_PREFIX = to_format_template(_prefix, ["resume_content"])
+_PROMPT_SUFFIX = to_format_template(_suffix, ["weekly_reports"])
+
+# 속성 조회용 공유 빈 dict (조회마다 {} 를 새로 만들지 않음, 수정 금지)
+_EMPTY: Dict = {}
+
+
+class MonthlyAnalyzer(BaseReportAnalyzer):
   """월간 주간 리포트 종합 분석기"""
 
+  analysis_label = "월간"
+  entry_label = "주간 리포트"
+  content_format = "markdown"
+  system_prompt = _SYSTEM_PROMPT_MONTHLY
+  prompt_prefix = _PROMPT_PREFIX
+  prompt_suffix = _PROMPT_SUFFIX
+  entries_placeholder = "weekly_reports"
+  strip_code_fence = True
+
   def __init__(self, ai_provider_type: str = "claude"):
     """
     Initialize MonthlyAnalyzer
@@ -21,12 +55,7 @@ class MonthlyAnalyzer:
     Args:
         ai_provider_type: AI provider type (gemini, claude, ollama)
     """
-    self.ai_provider_type = ai_provider_type
-    self.last_used_ai_provider: Optional[str] = None
-
-    # 프롬프트 로드
-    self.prompt_template = load_prompt("monthly_report_analysis")
-
+    super().__init__(ai_provider_type)
     logger.info(f"✅ MonthlyAnalyzer initialized (AI: {ai_provider_type})")
 
   async def analyze_monthly_reports(
@@ -46,72 +75,15 @@ class MonthlyAnalyzer:
     Returns:
         마크다운 형식의 분석 결과
     """
-    logger.info(f"📊 월간 분석 시작: {len(weekly_reports)}개 주간 리포트")
-
-    # 1. 각 주간 리포트에서 메타데이터 및 콘텐츠 추출
-    weekly_data = []
-    for page in weekly_reports:
-      metadata = self.extract_weekly_report_metadata(page)
-      content = await self.get_page_content(metadata["page_id"], notion_client)
-
-      # 주차 정보와 콘텐츠 결합
-      report_text = f"## {metadata['week']} ({metadata['start_date']} ~ {metadata['end_date']})\n\n{content}"
-      weekly_data.append(report_text.strip())
-
-    # 2. 모든 주간 리포트 결합
-    combined_reports = "\n\n---\n\n".join(weekly_data)
-
-    # 3. 이력서 내용 읽기 (있는 경우)
-    resume_content = ""
-    if resume_page_id:
-      try:
-        logger.info(f"📄 이력서 페이지 읽기: {resume_page_id}")
-        resume_content = await self.get_page_content(resume_page_id, notion_client)
-        if resume_content:
-          logger.info(f"✅ 이력서 내용 로드 완료 ({len(resume_content)}자)")
-        else:
-          logger.warning("⚠️ 이력서 페이지가 비어있습니다")
-      except Exception as e:
-        logger.warning(f"⚠️ 이력서 읽기 실패 (선택사항): {e}")
-        resume_content = ""
-
-    # 4. AI 분석 요청
-    prompt = self.prompt_template.replace("{weekly_reports}", combined_reports)
-    prompt = prompt.replace("{resume_content}", resume_content if resume_content else "(이력서 정보 없음)")
-
-    logger.info(f"🤖 AI 분석 시작... (내용 길이: {len(combined_reports)}자)")
-
-    analysis_text, used_provider = await generate_with_gemini_fallback(
-        self.ai_provider_type,
-        prompt=prompt,
-        system_prompt="""당신은 커리어 코치이자 이력서 작성 전문가입니다.
+    return await self.run(weekly_reports, notion_client, resume_page_id)
 
-주간 리포트 개수와 관계없이 제공된 데이터를 기반으로 월간 리포트를 생성하세요.
+  def extract_metadata(self, page: Dict) -> Dict:
+    """주간 리포트 메타데이터 추출"""
+    return self.extract_weekly_report_metadata(page)
 
-**중요**:
-- 마크다운 형식으로 응답하세요
-- 프롬프트의 마크다운 구조를 정확히 따르세요
-- "데이터가 부족합니다" 같은 응답은 금지입니다
-- 주간 리포트가 1개만 있어도 해당 데이터를 기반으로 최선의 월간 분석을 제공하세요"""
-    )
-
-    self.last_used_ai_provider = used_provider
-    logger.info(f"✅ AI 분석 완료 (제공자: {used_provider})")
-
-    # 4. 마크다운 추출 (코드 블록 제거)
-    import re
-    # ```markdown ... ``` 블록이 있으면 추출
-    markdown_match = re.search(r'```markdown\s*\n(.*?)```', analysis_text, re.DOTALL)
-    if markdown_match:
-      analysis_text = markdown_match.group(1).strip()
-    else:
-      # 일반 ``` ... ``` 블록이 있으면 추출
-      code_match = re.search(r'```\s*\n(.*?)```', analysis_text, re.DOTALL)
-      if code_match:
-        analysis_text = code_match.group(1).strip()
-
-    logger.info("📋 분석 결과 추출 완료")
-    return analysis_text.strip()
+  def format_entry(self, metadata: Dict, content: str) -> str:
+    """주차 정보와 콘텐츠 결합"""
+    return f"## {metadata['week']} ({metadata['start_date']} ~ {metadata['end_date']})\n\n{content}"
 
   def extract_weekly_report_metadata(self, page: Dict) -> Dict:
     """
@@ -123,22 +95,15 @@ class MonthlyAnalyzer:
     Returns:
         메타데이터 딕셔너리
     """
-    properties = page.get("properties", {})
+    properties = page.get("properties") or _EMPTY
 
     # 주차 (Title)
-    week_prop = properties.get("주차", {})
-    week_title = week_prop.get("title", [])
+    week_title = (properties.get("주차") or _EMPTY).get("title") or ()
     week = week_title[0]["text"]["content"] if week_title else "Unknown"
 
-    # 시작일
-    start_date_prop = properties.get("시작일", {})
-    start_date_obj = start_date_prop.get("date", {})
-    start_date = start_date_obj.get("start", "") if start_date_obj else ""
-
-    # 종료일
-    end_date_prop = properties.get("종료일", {})
-    end_date_obj = end_date_prop.get("date", {})
-    end_date = end_date_obj.get("start", "") if end_date_obj else ""
+    # 시작일 / 종료일
+    start_date = ((properties.get("시작일") or _EMPTY).get("date") or _EMPTY).get("start", "")
+    end_date = ((properties.get("종료일") or _EMPTY).get("date") or _EMPTY).get("start", "")
 
     return {
       "page_id": page["id"],
@@ -147,19 +112,6 @@ class MonthlyAnalyzer:
       "end_date": end_date
     }
 
-  async def get_page_content(self, page_id: str, notion_client) -> str:
-    """
-    Notion 페이지 콘텐츠 가져오기
-
-    Args:
-        page_id: Notion 페이지 ID
-        notion_client: NotionClient 인스턴스
-
-    Returns:
-        페이지 콘텐츠 (마크다운 형식)
-    """
-    return await extract_page_content(notion_client, page_id, format="markdown")
-
 
 # Singleton instance
 _singleton = SimpleSingleton(MonthlyAnalyzer, param_name="ai_provider_type")
@@ -2,23 +2,51 @@
 
 import logging
 from typing import Dict, List, Optional
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from .. import ai
-from ..common.prompt_utils import load_prompt
-from ..common.notion_utils import extract_page_content
+from ..common.prompt_utils import (
+    load_prompt,
+    split_prompt_template,
+    to_format_template,
+)
 from ..common.singleton import SimpleSingleton
+from .base import BaseReportAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# 주간 분석 시스템 지시문
+_SYSTEM_PROMPT_WEEKLY = (
+    "당신은 소프트웨어 엔지니어의 업무 기록을 분석하는 전문가입니다. "
+    "반드시 마크다운 형식으로만 응답하세요."
+)
+
+# 프롬프트 템플릿은 import 시 한 번만 로드하여 AI 제공자별 인스턴스가 공유
+_PROMPT_TEMPLATE = load_prompt("weekly_report_analysis")
+# 매번 동일한 앞부분(지시문 + 이력서)은 시스템 프롬프트로 보내 캐시를 활용하고,
+# format_map 한 번으로 치환하도록 중괄호를 미리 이스케이프
+_prefix, _suffix = split_prompt_template(_PROMPT_TEMPLATE, "{work_logs}")
+_PROMPT_PREFIX = to_format_template(_prefix, ["resume_content"])
+_PROMPT_SUFFIX = to_format_template(_suffix, ["work_logs"])
+
+# 속성 조회용 공유 빈 dict (조회마다 {} 를 새로 만들지 않음, 수정 금지)
+_EMPTY: Dict = {}
+
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
 
-class WeeklyAnalyzer:
+class WeeklyAnalyzer(BaseReportAnalyzer):
   """주간 업무일지 분석기"""
 
+  analysis_label = "주간"
+  entry_label = "업무일지"
+  content_format = "text"
+  system_prompt = _SYSTEM_PROMPT_WEEKLY
+  prompt_prefix = _PROMPT_PREFIX
+  prompt_suffix = _PROMPT_SUFFIX
+  entries_placeholder = "work_logs"
+
   def __init__(self, ai_provider_type: str = "claude"):
     """
     Initialize WeeklyAnalyzer
@@ -26,14 +54,43 @@ class WeeklyAnalyzer:
     Args:
         ai_provider_type: AI provider type (gemini, claude, ollama)
     """
-    self.ai_provider_type = ai_provider_type
+    super().__init__(ai_provider_type)
     self.ai_provider = ai.get_ai_provider(ai_provider_type)
-    self.last_used_ai_provider: Optional[str] = None
-
-    # Load prompt template
-    self.prompt_template = load_prompt("weekly_report_analysis")
     logger.info(f"✅ WeeklyAnalyzer initialized (AI: {ai_provider_type})")
 
+  async def analyze_weekly_logs(
+      self,
+      daily_logs: List[Dict],
+      notion_client,
+      resume_page_id: Optional[str] = None
+  ) -> str:
+    """
+    주간 업무일지 분석
+
+    Args:
+        daily_logs: 일일 업무일지 페이지 목록
+        notion_client: NotionClient instance
+        resume_page_id: 이력서 페이지 ID (선택)
+
+    Returns:
+        마크다운 형식의 분석 결과
+    """
+    return await self.run(daily_logs, notion_client, resume_page_id)
+
+  def extract_metadata(self, page: Dict) -> Dict:
+    """업무일지 메타데이터 추출"""
+    return self.extract_work_log_content(page)
+
+  def format_entry(self, metadata: Dict, content: str) -> str:
+    """업무일지 속성과 본문 결합"""
+    return f"""## {metadata['date']} - {metadata['title']}
+**프로젝트**: {metadata['project']}
+**성과타입**: {metadata['achievement_type']}
+**기술스택**: {', '.join(metadata['tech_stack'])}
+**정량적성과**: {metadata['quantitative']}
+
+{content}"""
+
   def extract_work_log_content(self, page: Dict) -> Dict[str, any]:
     """
     Notion 페이지에서 업무일지 내용 추출
@@ -44,34 +101,29 @@ class WeeklyAnalyzer:
     Returns:
         업무일지 메타데이터 및 콘텐츠
     """
-    properties = page.get("properties", {})
+    properties = page.get("properties") or _EMPTY
 
     # 날짜 추출
-    date_prop = properties.get("작성일", {}).get("date", {})
-    date = date_prop.get("start", "") if date_prop else ""
+    date = ((properties.get("작성일") or _EMPTY).get("date") or _EMPTY).get("start", "")
 
     # 제목 추출
-    title_prop = properties.get("Name", {}) or properties.get("제목", {})
-    title_parts = title_prop.get("title", [])
-    title = "".join([part.get("plain_text", "") for part in title_parts])
+    title_prop = properties.get("Name") or properties.get("제목") or _EMPTY
+    title = "".join(part.get("plain_text", "") for part in title_prop.get("title") or ())
 
     # 기술스택 추출
-    tech_stack_prop = properties.get("기술스택", {}).get("multi_select", [])
-    tech_stack = [item.get("name", "") for item in tech_stack_prop]
+    multi_select = (properties.get("기술스택") or _EMPTY).get("multi_select") or ()
+    tech_stack = [item.get("name", "") for item in multi_select]
 
     # 프로젝트 추출
-    project_prop = properties.get("프로젝트", {}).get("select", {})
-    project = project_prop.get("name", "") if project_prop else ""
+    project = ((properties.get("프로젝트") or _EMPTY).get("select") or _EMPTY).get("name", "")
 
     # 성과타입 추출
-    achievement_type_prop = properties.get("성과타입", {}).get("select", {})
-    achievement_type = achievement_type_prop.get(
-        "name", "") if achievement_type_prop else ""
+    achievement_type = (
+        (properties.get("성과타입") or _EMPTY).get("select") or _EMPTY).get("name", "")
 
     # 정량적성과 추출
-    quantitative_prop = properties.get("정량적성과", {}).get("rich_text", [])
-    quantitative = "".join([part.get("plain_text", "")
-                           for part in quantitative_prop])
+    quantitative_parts = (properties.get("정량적성과") or _EMPTY).get("rich_text") or ()
+    quantitative = "".join(part.get("plain_text", "") for part in quantitative_parts)
 
     return {
       "date": date,
@@ -83,97 +135,6 @@ class WeeklyAnalyzer:
       "page_id": page.get("id", "")
     }
 
-  async def get_page_content(self, page_id: str, notion_client) -> str:
-    """
-    페이지 본문 내용 가져오기
-
-    Args:
-        page_id: Notion page ID
-        notion_client: NotionClient instance
-
-    Returns:
-        페이지 본문 텍스트
-    """
-    return await extract_page_content(notion_client, page_id, format="text")
-
-  async def analyze_weekly_logs(
-      self,
-      daily_logs: List[Dict],
-      notion_client,
-      resume_page_id: Optional[str] = None
-  ) -> str:
-    """
-    주간 업무일지 분석
-
-    Args:
-        daily_logs: 일일 업무일지 페이지 목록
-        notion_client: NotionClient instance
-        resume_page_id: 이력서 페이지 ID (선택)
-
-    Returns:
-        마크다운 형식의 분석 결과
-    """
-    try:
-      logger.info(f"📊 주간 분석 시작: {len(daily_logs)}개 업무일지")
-
-      # 업무일지 내용 추출
-      work_logs_data = []
-      for page in daily_logs:
-        metadata = self.extract_work_log_content(page)
-        content = await self.get_page_content(metadata["page_id"], notion_client)
-
-        work_log_text = f"""
-## {metadata['date']} - {metadata['title']}
-**프로젝트**: {metadata['project']}
-**성과타입**: {metadata['achievement_type']}
-**기술스택**: {', '.join(metadata['tech_stack'])}
-**정량적성과**: {metadata['quantitative']}
-
-{content}
-"""
-        work_logs_data.append(work_log_text.strip())
-
-      # 전체 업무일지 텍스트 결합
-      combined_logs = "\n\n---\n\n".join(work_logs_data)
-
-      # 이력서 내용 읽기 (있는 경우)
-      resume_content = ""
-      if resume_page_id:
-        try:
-          logger.info(f"📄 이력서 페이지 읽기: {resume_page_id}")
-          resume_content = await self.get_page_content(resume_page_id, notion_client)
-          if resume_content:
-            logger.info(f"✅ 이력서 내용 로드 완료 ({len(resume_content)}자)")
-          else:
-            logger.warning("⚠️ 이력서 페이지가 비어있습니다")
-        except Exception as e:
-          logger.warning(f"⚠️ 이력서 읽기 실패 (선택사항): {e}")
-          resume_content = ""
-
-      # 프롬프트 생성
-      prompt = self.prompt_template.replace("{work_logs}", combined_logs)
-      prompt = prompt.replace("{resume_content}", resume_content if resume_content else "(이력서 정보 없음)")
-
-      logger.info(f"🤖 AI 분석 시작... (내용 길이: {len(combined_logs)}자)")
-
-      # AI 분석 실행
-      analysis_text, used_provider = await ai.generate_with_gemini_fallback(
-          self.ai_provider_type,
-          prompt=prompt,
-          system_prompt="당신은 소프트웨어 엔지니어의 업무 기록을 분석하는 전문가입니다. 반드시 마크다운 형식으로만 응답하세요."
-      )
-
-      self.last_used_ai_provider = used_provider
-      logger.info(f"✅ AI 분석 완료 (제공자: {used_provider})")
-      logger.info(f"📋 분석 결과 추출 완료")
-
-      return analysis_text
-
-    except Exception as e:
-      logger.error(f"❌ 주간 분석 실패: {e}")
-      raise
-
-
 # Singleton instance
 _singleton = SimpleSingleton(WeeklyAnalyzer, param_name="ai_provider_type")
 
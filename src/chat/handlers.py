@@ -1,66 +1,240 @@
 """Chat message event handlers"""
 
-import json
 import logging
 import os
 import re
 from datetime import datetime
+from typing import List, Optional
+from zoneinfo import ZoneInfo
 
-import pytz
+import orjson
+from cachetools import TTLCache
 
 from ..commands.work_log_webhook_handler import handle_work_log_webhook_message
 from ..commands.publish_handler import handle_publish_webhook_message
 from ..notion.wake_up import get_wake_up_manager
-from ..notion.work_log_agent import get_work_log_manager
-from ..notion.weekly_report_agent import get_weekly_report_manager
+from ..notion.work_log_agent import FIRST_PROGRESS_STATUS, get_work_log_manager
+from ..notion.weekly_report_agent import (
+  FIRST_PROGRESS_STATUS as WEEKLY_FIRST_PROGRESS_STATUS,
+  get_weekly_report_manager,
+)
+from ..notion.monthly_report_agent import get_monthly_report_manager
 from ..notion.achievement_agent import get_achievement_agent
 from ..common.slack_utils import (
-  build_initial_text,
-  build_progress_text,
-  flavor_emoji,
-  flavor_label,
+  ai_label,
+  build_flavor_line,
   get_used_ai_label,
+  make_header_progress_builder,
+  make_progress_text_builder,
+  post_thread_chunks,
+  slack_call_with_retry,
 )
+from ..common.async_utils import fire_and_forget
 from ..common.notion_utils import get_user_database_mapping
+from ..common.progress_utils import DebouncedProgress
 from ..common.text_utils import create_preview
 
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
-# Webhook channel ID
-WEBHOOK_CHANNEL_ID = os.getenv("SLACK_WORK_LOG_WEBHOOK_CHANNEL_ID")
+# Webhook channel IDs (쉼표로 여러 채널 지정 가능)
+WEBHOOK_CHANNEL_IDS = frozenset(
+    channel_id.strip()
+    for channel_id in os.getenv("SLACK_WORK_LOG_WEBHOOK_CHANNEL_ID", "").split(",")
+    if channel_id.strip()
+)
 # Report channel ID
 REPORT_CHANNEL_ID = os.getenv("SLACK_WORK_LOG_REPORT_CHANNEL_ID")
 
+# Webhook JSON 메시지 패턴 (모듈 로드 시 한 번만 컴파일, ASCII 전용 \s 매칭)
+# 메시지 전체가 JSON 이어야 하므로(json.loads 로 파싱) 앞부분만 확인: JSON 이 아닌 일반 메시지는
+# 첫 글자에서 바로 실패하여 본문 전체를 훑지 않음
+_WEBHOOK_ACTION_RE = re.compile(
+    r'\s*\{"action"\s*:\s*"(work_log_feedback|publish_work_log)"', re.ASCII)
+
+# webhook 메시지 이벤트 (일반 메시지 + incoming webhook 의 bot_message)
+_WEBHOOK_MESSAGE_EVENT = {"type": "message", "subtype": (None, "bot_message")}
+
+# action -> webhook 처리 함수
+_WEBHOOK_HANDLERS = {
+  "work_log_feedback": handle_work_log_webhook_message,
+  "publish_work_log": handle_publish_webhook_message,
+}
+
+# 처리한 webhook 메시지 키 (Slack 재전송 시 중복 처리 방지, 5분)
+_seen_webhook_messages: TTLCache = TTLCache(maxsize=4096, ttl=300)
+
+# 입력값 조회용 공유 빈 dict (수정 금지)
+_EMPTY: dict = {}
+
+
+def _pluck(values: dict, block_id: str, action_id: str, field: str = "value") -> str:
+  """
+  모달 state.values 에서 입력값 하나를 꺼냅니다.
+
+  Args:
+      values: view["state"]["values"]
+      block_id: 블록 ID
+      action_id: 액션 ID
+      field: "value"(텍스트 입력), "selected_date"(날짜), "selected_option"(선택지 value)
+
+  Returns:
+      입력값 문자열
+
+  Raises:
+      ValueError: 입력값이 없을 때
+  """
+  element = (values.get(block_id) or _EMPTY).get(action_id) or _EMPTY
+  leaf = element.get(field)
+  if field == "selected_option":
+    leaf = (leaf or _EMPTY).get("value")
+
+  if leaf is None:
+    raise ValueError(f"입력값 누락: {block_id}.{action_id}")
+  return leaf
+
+
+def _extract_message_ts(body: dict) -> Optional[str]:
+  """버튼이 달린 메시지의 ts (일반 메시지는 message.ts, 그 외에는 container.message_ts)"""
+  message = body.get("message")
+  if message and message.get("ts"):
+    return message["ts"]
+
+  container = body.get("container")
+  return container.get("message_ts") if container else None
+
+
+def _is_duplicate_webhook(message: dict) -> bool:
+  """
+  이미 처리한 webhook 메시지인지 확인하고, 처음 보는 메시지면 기록합니다.
+
+  Args:
+      message: Slack message 이벤트
+
+  Returns:
+      최근 5분 내에 같은 메시지를 처리했으면 True
+  """
+  key = message.get("client_msg_id") or f"{message.get('channel')}:{message.get('ts')}"
+  if key in _seen_webhook_messages:
+    return True
+
+  _seen_webhook_messages[key] = True
+  return False
+
+
+async def _report_error(
+    client,
+    channel_id: str,
+    ts: str,
+    title: str,
+    details: List[str],
+    error: Exception,
+    log_message: str,
+    fatal: bool = True
+) -> None:
+  """
+  진행 메시지를 실패 메시지로 바꾸고 로그를 남깁니다 (모달 제출 핸들러 공통).
+
+  Args:
+      client: Slack client
+      channel_id: 진행 메시지 채널
+      ts: 진행 메시지 ts
+      title: 첫 줄 (예: "<@U..>님의 주간 리포트 생성 실패 ❌")
+      details: 기간/AI 등 본문 줄 목록
+      error: 발생한 예외
+      log_message: 로그에 남길 설명
+      fatal: 예상하지 못한 에러 여부 (True 면 재시도 안내 + 에러 로그와 traceback,
+          False 면 검증 에러로 보고 경고 로그만)
+  """
+  text = "\n".join([title, "", *details, f"❌ 오류: {error}"])
+  if fatal:
+    text += "\n\n로그를 확인하거나 다시 시도해주세요."
+
+  await client.chat_update(channel=channel_id, ts=ts, text=text)
+
+  if fatal:
+    logger.error("❌ %s: %s", log_message, error, exc_info=True)
+  else:
+    logger.warning("⚠️ %s: %s", log_message, error)
+
+
+async def _report_handler_failure(client, user_id: str, error: Exception) -> None:
+  """모달 제출 핸들러 자체가 실패했을 때 리포트 채널로 알림"""
+  logger.error("❌ Modal submission handler failed: %s", error, exc_info=True)
+  await client.chat_postMessage(
+      channel=REPORT_CHANNEL_ID,
+      text=f"<@{user_id}>님의 요청 처리 중 오류가 발생했습니다. 다시 시도해주세요."
+  )
+
+
+async def _abandon_progress(progress: Optional[DebouncedProgress]) -> None:
+  """
+  실패 경로 정리: 대기 중인 진행 상태를 버립니다.
+
+  Args:
+      progress: 진행 상태 업데이터 (아직 만들지 않았으면 None)
+  """
+  if progress is not None:
+    await progress.cancel()
+
+
+async def _match_webhook_action(event, context) -> bool:
+  """webhook 채널의 action JSON 메시지인지 확인 (채널 확인 후에만 정규식 실행)"""
+  if event.get("channel") not in WEBHOOK_CHANNEL_IDS:
+    return False
+
+  match = _WEBHOOK_ACTION_RE.match(event.get("text") or "")
+  if not match:
+    return False
+
+  context["webhook_action"] = match.group(1)
+  return True
+
+
+def _prewarm_managers() -> None:
+  """
+  자주 쓰는 매니저를 미리 생성합니다 (첫 요청이 Notion/AI 클라이언트 초기화를 기다리지 않도록).
+
+  모달 기본값(claude)과 webhook 기본값(gemini) 제공자만 준비하며, 실패해도 요청 시
+  다시 생성되므로 경고만 남깁니다. PREWARM_MANAGERS=0 이면 건너뜁니다.
+  """
+  if os.getenv("PREWARM_MANAGERS", "1") != "1":
+    return
+
+  getters = [("wake_up", get_wake_up_manager, {})]
+  for ai_provider in ("claude", "gemini"):
+    getters.append(("work_log", get_work_log_manager, {"ai_provider_type": ai_provider}))
+    getters.append(("weekly_report", get_weekly_report_manager, {"ai_provider_type": ai_provider}))
+
+  for name, getter, kwargs in getters:
+    try:
+      getter(**kwargs)
+    except Exception as e:
+      logger.warning(f"⚠️ {name} 매니저 미리 생성 실패 ({kwargs or '-'}): {e}")
+
 
 def register_chat_handlers(app):
   """Register all chat-related event handlers"""
 
-  # Work log webhook handler - JSON format only
-  @app.message(re.compile(r'\{"action"\s*:\s*"work_log_feedback"'))
-  async def handle_work_log_webhook(message, say, client):
-    """Handle work log feedback webhook message from incoming webhook"""
-    # Check if message is from webhook channel
-    channel_id = message.get("channel")
-    if channel_id != WEBHOOK_CHANNEL_ID:
-      return
-
-    logger.info(f"📥 Received work log webhook request")
-    await handle_work_log_webhook_message(message, say, client)
-
-  # Publish work log webhook handler - JSON format only
-  @app.message(re.compile(r'\{"action"\s*:\s*"publish_work_log"'))
-  async def handle_publish_webhook(message, say, client):
-    """Handle publish work log webhook message from Notion Automation"""
-    # Check if message is from webhook channel
-    channel_id = message.get("channel")
-    if channel_id != WEBHOOK_CHANNEL_ID:
-      return
+  # Webhook handler - JSON format only (work_log_feedback / publish_work_log)
+  # app.message(pattern)는 모든 채널의 메시지에 정규식을 먼저 실행하므로,
+  # 채널을 먼저 확인하는 matcher로 등록하여 webhook 채널 외에는 정규식을 실행하지 않음
+  # webhook 채널이 설정되지 않았으면 리스너 자체를 등록하지 않음 (모든 메시지에 matcher 실행 방지)
+  if WEBHOOK_CHANNEL_IDS:
+    @app.event(_WEBHOOK_MESSAGE_EVENT, matchers=[_match_webhook_action])
+    async def handle_webhook_action(message, say, client, context):
+      """Dispatch webhook JSON messages from incoming webhooks / Notion Automation"""
+      action = context["webhook_action"]
+      if _is_duplicate_webhook(message):
+        logger.info(f"⏭️ Skipping duplicate webhook request: {action} (ts={message.get('ts')})")
+        return
 
-    logger.info(f"📤 Received publish work log request")
-    await handle_publish_webhook_message(message, say, client)
+      logger.info(f"📥 Received webhook request: {action}")
+      await _WEBHOOK_HANDLERS[action](message, say, client)
+  else:
+    logger.warning("⚠️ SLACK_WORK_LOG_WEBHOOK_CHANNEL_ID가 설정되지 않아 webhook 메시지 처리를 비활성화합니다")
 
   @app.action("wake_up_complete")
   async def handle_wake_up_complete(ack, body, client, logger):
@@ -71,17 +245,27 @@ def register_chat_handlers(app):
     user_name = body["user"].get("name", user_id)
     wake_up_time = datetime.now(KST)
 
+    # 백그라운드 저장이 실패하면 완료 메시지 이후에라도 사용자에게 알림
+    async def notify_record_failure(error: Exception):
+      await client.chat_postEphemeral(
+          channel=body["channel"]["id"],
+          user=user_id,
+          text=f"❌ 기상 기록 저장 실패: {error}\n다시 시도해주세요."
+      )
+
     try:
       wake_up_mgr = get_wake_up_manager()
-      await wake_up_mgr.record_wake_up(
+      # Notion 저장은 백그라운드 큐에서 처리 (응답이 Notion 왕복을 기다리지 않음)
+      wake_up_mgr.enqueue_wake_up(
           user_id=user_id,
           user_name=user_name,
-          wake_up_time=wake_up_time
+          wake_up_time=wake_up_time,
+          on_error=notify_record_failure
       )
 
-      logger.info(f"✅ Wake-up recorded for {user_name} ({user_id})")
+      logger.info(f"✅ Wake-up queued for {user_name} ({user_id})")
 
-      # Get total wake-up count for this user
+      # Get total wake-up count for this user (큐에 들어간 기록 포함)
       total_count = await wake_up_mgr.get_wake_up_count(user_id)
 
       # Format time as HH:MM
@@ -95,44 +279,32 @@ def register_chat_handlers(app):
 
       # Update the message to remove buttons and show completion
       # 메시지 타임스탬프 가져오기 (슬래시 커맨드 vs 일반 메시지)
-      message_ts = body.get("message", {}).get("ts") or body.get("container",
-                                                                 {}).get(
-          "message_ts")
+      message_ts = _extract_message_ts(body)
       channel_id = body["channel"]["id"]
 
-      completion_blocks = [
-        {
-          "type": "section",
-          "text": {
-            "type": "mrkdwn",
-            "text": completion_text
-          }
-        }
-      ]
-
       if message_ts:
         try:
-          # 메시지 업데이트 시도
-          await client.chat_update(
+          # 메시지 업데이트 시도 (429 / 5xx 는 잠시 후 재시도)
+          # chat.update 는 blocks 를 생략하면 기존 버튼을 그대로 두므로 빈 blocks 로 지우고
+          # text(mrkdwn)만 표시
+          await slack_call_with_retry(lambda: client.chat_update(
               channel=channel_id,
               ts=message_ts,
               text=completion_text,
-              blocks=completion_blocks
-          )
+              blocks=[]
+          ))
         except Exception as update_error:
           logger.warning(f"⚠️ 메시지 업데이트 실패, 새 메시지 발송: {update_error}")
           # 업데이트 실패 시 새 메시지 발송
           await client.chat_postMessage(
               channel=channel_id,
-              text=completion_text,
-              blocks=completion_blocks
+              text=completion_text
           )
       else:
         # 메시지 타임스탬프가 없으면 새 메시지 발송
         await client.chat_postMessage(
             channel=channel_id,
-            text=completion_text,
-            blocks=completion_blocks
+            text=completion_text
         )
 
     except Exception as e:
@@ -153,22 +325,33 @@ def register_chat_handlers(app):
       # Extract form values
       values = view["state"]["values"]
 
-      selected_date = values["date_block"]["work_log_date"]["selected_date"]
-      feedback_flavor = \
-        values["feedback_flavor_block"]["feedback_flavor"]["selected_option"][
-          "value"]
-      ai_provider = \
-        values["ai_provider_block"]["ai_provider"]["selected_option"]["value"]
+      selected_date = _pluck(values, "date_block", "work_log_date", "selected_date")
+      feedback_flavor = _pluck(values, "feedback_flavor_block", "feedback_flavor", "selected_option")
+      ai_provider = _pluck(values, "ai_provider_block", "ai_provider", "selected_option")
 
       user_id = body["user"]["id"]
 
+    except Exception as e:
+      logger.error("❌ Modal submission parsing failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+      await ack(
+          response_action="errors",
+          errors={"date_block": "입력값을 확인한 뒤 다시 시도해주세요."}
+      )
+      return
+
+    # 입력값만 읽고 바로 ack (Slack 3초 제한) - 매핑 조회/검증은 ack 이후에 처리
+    await ack()
+
+    # 피드백 맛 표기는 메시지 곳곳에서 쓰이므로 한 번만 계산
+    flavor_line = build_flavor_line(feedback_flavor)
+
+    try:
       # Get database_id from unified user mapping
       user_dbs = get_user_database_mapping(user_id)
       database_id = user_dbs.get("work_log_db") if user_dbs else None
 
       if not database_id:
         logger.error(f"❌ No database mapping found for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 업무일지 데이터베이스를 찾을 수 없습니다.\n"
@@ -177,156 +360,118 @@ def register_chat_handlers(app):
         return
 
       logger.info(
-          f"📝 Processing work log feedback: date={selected_date}, "
-          f"flavor={feedback_flavor}, ai={ai_provider}, db={database_id}"
+          "📝 Processing work log feedback: date=%s, flavor=%s, ai=%s, db=%s",
+          selected_date, feedback_flavor, ai_provider, database_id
       )
 
-      # Acknowledge modal submission immediately
-      await ack()
-
       # Send work log feedback messages to the report channel
       channel_id = REPORT_CHANNEL_ID
 
+      # 매니저 생성/초기 메시지 전송 단계에서 실패해도 정리할 수 있도록 미리 선언
+      progress = msg_ts = work_log_mgr = None
+
       try:
-        # Get work log manager upfront so initial AI label can reflect dynamic provider later
-        work_log_mgr = get_work_log_manager(ai_provider_type=ai_provider)
-        # 이전 작업 잔여 상태 초기화 (초기 메시지 표기 안정화)
-        try:
-          work_log_mgr.last_used_ai_provider = None
-        except Exception:
-          pass
-        used_ai_label = get_used_ai_label(work_log_mgr, ai_provider)
+        # 진행 메시지마다 바뀌지 않는 부분은 한 번만 만들어 둠
+        user_mention = f"<@{user_id}>님의 "
+        build_progress = make_progress_text_builder(user_mention, selected_date, flavor_line)
 
-        # Send initial progress message with dynamic AI label
+        # Send initial progress message
+        # (시작 시점에는 요청한 AI가 표시되고, fallback 발생 시 진행 메시지에서 갱신됨)
+        # (첫 단계 상태를 바로 담아 보내 별도 chat_update 한 번을 줄임)
         progress_msg = await client.chat_postMessage(
             channel=channel_id,
-            text=build_initial_text(
-              user_mention=f"<@{user_id}>님의 ",
-              date=selected_date,
-              ai_label=used_ai_label,
-              flavor_line=f"{flavor_emoji(feedback_flavor)} 피드백: {flavor_label(feedback_flavor)}",
-            )
+            text=build_progress(ai_provider, FIRST_PROGRESS_STATUS)
         )
 
         msg_ts = progress_msg["ts"]
 
-        # Update: Finding work log
-        used_ai_now = get_used_ai_label(work_log_mgr, ai_provider)
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=build_progress_text(
-              user_mention=f"<@{user_id}>님의 ",
-              date=selected_date,
-              ai_label=used_ai_now,
-              flavor_line=f"{flavor_emoji(feedback_flavor)} 피드백: {flavor_label(feedback_flavor)}",
-              status="업무일지 확인 중...",
-            )
-        )
+        # 매니저는 시작 시 미리 생성되므로 이벤트 루프에서 바로 가져옴
+        # (singleton getter 는 잠금이 없어 워커 스레드에서 동시에 호출하면 중복 생성될 수 있음)
+        work_log_mgr = get_work_log_manager(ai_provider_type=ai_provider)
+        # 이전 작업 잔여 상태 초기화 (fallback 라벨 표기 안정화)
+        try:
+          work_log_mgr.last_used_ai_provider = None
+        except Exception:
+          pass
 
         # Progress updater that reflects fallback provider if it occurs
+        # (라벨은 전송 시점에 제공자가 바뀐 경우에만 새로 만들어짐)
         async def progress_update(status: str):
-          used_ai_dyn = get_used_ai_label(work_log_mgr, ai_provider)
           return await client.chat_update(
               channel=channel_id,
               ts=msg_ts,
-              text=build_progress_text(
-                user_mention=f"<@{user_id}>님의 ",
-                date=selected_date,
-                ai_label=used_ai_dyn,
-                flavor_line=f"{flavor_emoji(feedback_flavor)} 피드백: {flavor_label(feedback_flavor)}",
-                status=status,
-              )
+              text=build_progress(work_log_mgr.last_used_ai_provider or ai_provider, status)
           )
 
+        # 연속된 진행 상태는 묶어서 최신 상태만 전송
+        # (초기 메시지에 담아 보낸 첫 상태는 다시 업데이트하지 않음)
+        progress = DebouncedProgress(progress_update, initial_status=FIRST_PROGRESS_STATUS)
+
         # Process feedback with progress updates
         result = await work_log_mgr.process_feedback(
             date=selected_date,
             database_id=database_id,
             flavor=feedback_flavor,
-            progress_callback=progress_update
+            progress_callback=progress
         )
+        await progress.cancel()
 
         # Update with final success message
-        used_ai = (result.get('used_ai_provider') if isinstance(result, dict) else None) or ai_provider
+        used_ai = ai_label(result['used_ai_provider'] or ai_provider)
         success_text = (
           f"<@{user_id}>님의 업무일지 AI 피드백 생성 완료! ✅\n\n"
           f"📅 날짜: {selected_date}\n"
-          f"{flavor_emoji(feedback_flavor)} 피드백: {flavor_label(feedback_flavor)}\n"
-          f"🤖 AI: {used_ai.upper()}\n"
+          f"{flavor_line}\n"
+          f"🤖 AI: {used_ai}\n"
           f"📝 피드백 길이: {result['feedback_length']}자\n\n"
           f"✨ Notion 페이지에서 확인하세요!"
         )
 
+        # 스레드에 생성된 피드백 전문 게시 (완료 메시지와 독립적이므로 기다리지 않음)
+        # (text 로만 보내므로 대부분 메시지 하나에 담김, 넘칠 때만 청크를 순서대로 전송)
+        feedback_text = result['feedback']
+        if feedback_text:
+          header = (
+            f"🧵 AI 피드백 전문\n"
+            f"🤖 AI: {used_ai} | {flavor_line}\n\n"
+          )
+          fire_and_forget(
+              post_thread_chunks(client, channel_id, msg_ts, header + feedback_text),
+              "스레드에 피드백 전문 게시")
+
         await client.chat_update(
             channel=channel_id,
             ts=msg_ts,
             text=success_text
         )
 
-        # 스레드에 생성된 피드백 전문 게시
-        try:
-          from ..common.slack_utils import split_text_for_slack
-          feedback_text = result.get('feedback') if isinstance(result, dict) else None
-          if feedback_text:
-            header = (
-              f"🧵 AI 피드백 전문\n"
-              f"🤖 AI: {used_ai} | {flavor_emoji(feedback_flavor)} 피드백: {flavor_label(feedback_flavor)}\n\n"
-            )
-            combined = header + feedback_text
-            for chunk in split_text_for_slack(combined):
-              await client.chat_postMessage(
-                  channel=channel_id,
-                  thread_ts=msg_ts,
-                  text=chunk
-              )
-        except Exception as e:
-          logger.warning(f"⚠️ 스레드에 피드백 전문 게시 실패: {e}")
-
-        logger.info(f"✅ Work log feedback completed: {selected_date}")
+        logger.info("✅ Work log feedback completed: %s", selected_date)
 
       except ValueError as ve:
         # Handle validation errors (page not found, already completed)
-        error_text = (
-          f"<@{user_id}>님의 업무일지 피드백 생성 실패 ⚠️\n\n"
-          f"📅 날짜: {selected_date}\n"
-          f"❌ 오류: {str(ve)}"
-        )
-
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=error_text
-        )
-        logger.warning(f"⚠️ Validation error: {ve}")
+        await _abandon_progress(progress)
+        if not msg_ts:
+          raise  # 진행 메시지가 없으면 핸들러 실패로 알림
+        await _report_error(
+            client, channel_id, msg_ts,
+            f"<@{user_id}>님의 업무일지 피드백 생성 실패 ⚠️",
+            [f"📅 날짜: {selected_date}"],
+            ve, "Validation error", fatal=False)
 
       except Exception as e:
         # Handle other errors
-        used_ai = (getattr(work_log_mgr, 'last_used_ai_provider', None) or ai_provider).upper()
-        error_text = (
-          f"<@{user_id}>님의 업무일지 피드백 생성 실패 ❌\n\n"
-          f"📅 날짜: {selected_date}\n"
-          f"{flavor_emoji(feedback_flavor)} 피드백: {flavor_label(feedback_flavor)}\n"
-          f"🤖 AI: {used_ai}\n"
-          f"❌ 오류: {str(e)}\n\n"
-          f"로그를 확인하거나 다시 시도해주세요."
-        )
-
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=error_text
-        )
-
-        logger.error(f"❌ Failed to process feedback: {e}", exc_info=True)
+        await _abandon_progress(progress)
+        if not msg_ts:
+          raise  # 진행 메시지가 없으면 핸들러 실패로 알림
+        used_ai = get_used_ai_label(work_log_mgr, ai_provider)
+        await _report_error(
+            client, channel_id, msg_ts,
+            f"<@{user_id}>님의 업무일지 피드백 생성 실패 ❌",
+            [f"📅 날짜: {selected_date}", flavor_line, f"🤖 AI: {used_ai}"],
+            e, "Failed to process feedback")
 
     except Exception as e:
-      logger.error(f"❌ Modal submission handler failed: {e}", exc_info=True)
-      # Cannot send message here as we don't have channel context
-      await ack(
-          response_action="errors",
-          errors={"date_block": "처리 중 오류가 발생했습니다. 다시 시도해주세요."}
-      )
+      await _report_handler_failure(client, user_id, e)
 
   @app.view("weekly_report_modal")
   async def handle_weekly_report_submission(ack, body, client, view, logger):
@@ -336,18 +481,29 @@ def register_chat_handlers(app):
       # Extract form values
       values = view["state"]["values"]
 
-      year = int(values["year_block"]["report_year"]["value"])
-      week = int(values["week_block"]["report_week"]["value"])
-      ai_provider = values["ai_provider_block"]["ai_provider"]["selected_option"]["value"]
+      year = int(_pluck(values, "year_block", "report_year"))
+      week = int(_pluck(values, "week_block", "report_week"))
+      ai_provider = _pluck(values, "ai_provider_block", "ai_provider", "selected_option")
 
       user_id = body["user"]["id"]
 
+    except Exception as e:
+      logger.error("❌ Modal submission parsing failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+      await ack(
+          response_action="errors",
+          errors={"year_block": "입력값을 확인한 뒤 다시 시도해주세요."}
+      )
+      return
+
+    # 입력값만 읽고 바로 ack (Slack 3초 제한) - 매핑 조회/검증은 ack 이후에 처리
+    await ack()
+
+    try:
       # Get database mappings from unified user mapping
       user_dbs = get_user_database_mapping(user_id)
 
       if not user_dbs:
         logger.error(f"❌ No database mapping found for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 데이터베이스 매핑을 찾을 수 없습니다.\n"
@@ -360,7 +516,6 @@ def register_chat_handlers(app):
 
       if not work_log_db_id or not weekly_report_db_id:
         logger.error(f"❌ Incomplete database mapping for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 데이터베이스 설정이 불완전합니다.\n"
@@ -369,54 +524,56 @@ def register_chat_handlers(app):
         return
 
       logger.info(
-          f"📅 Processing weekly report: year={year}, week={week}, "
-          f"ai={ai_provider}, user={user_id}"
+          "📅 Processing weekly report: year=%s, week=%s, ai=%s, user=%s",
+          year, week, ai_provider, user_id
       )
 
-      # Acknowledge modal submission immediately
-      await ack()
-
       # Send to report channel
       channel_id = REPORT_CHANNEL_ID
 
+      # 매니저 생성/초기 메시지 전송 단계에서 실패해도 정리할 수 있도록 미리 선언
+      progress = msg_ts = None
+
       try:
-        # Get weekly report manager
-        weekly_mgr = get_weekly_report_manager(ai_provider_type=ai_provider)
+        # Progress text builder (AI 라벨과 상태 외에는 고정이므로 헤더는 한 번만 생성)
+        build_progress = make_header_progress_builder(
+          f"<@{user_id}>님의 주간 리포트 생성 중... 📅\n\n"
+          f"📆 기간: {year}-W{week:02d}\n"
+        )
 
-        # Send initial progress message
+        # Send initial progress message (첫 진행 상태를 바로 담아 보내 업데이트 한 번 생략)
         progress_msg = await client.chat_postMessage(
             channel=channel_id,
-            text=f"<@{user_id}>님의 주간 리포트 생성 중... 📅\n\n"
-                 f"📆 기간: {year}-W{week:02d}\n"
-                 f"🤖 AI: {ai_provider.upper()}\n"
-                 f"⏳ 진행 중..."
+            text=build_progress(ai_provider, WEEKLY_FIRST_PROGRESS_STATUS)
         )
 
         msg_ts = progress_msg["ts"]
+        # 매니저는 시작 시 미리 생성되므로 이벤트 루프에서 바로 가져옴
+        # (singleton getter 는 잠금이 없어 워커 스레드에서 동시에 호출하면 중복 생성될 수 있음)
+        weekly_mgr = get_weekly_report_manager(ai_provider_type=ai_provider)
 
-        # Progress updater
         async def progress_update(status: str):
-          used_ai_label = (weekly_mgr.last_used_ai_provider or ai_provider).upper()
           return await client.chat_update(
               channel=channel_id,
               ts=msg_ts,
-              text=f"<@{user_id}>님의 주간 리포트 생성 중... 📅\n\n"
-                   f"📆 기간: {year}-W{week:02d}\n"
-                   f"🤖 AI: {used_ai_label}\n"
-                   f"⏳ {status}"
+              text=build_progress(weekly_mgr.last_used_ai_provider or ai_provider, status)
           )
 
+        # 연속된 진행 상태는 묶어서 최신 상태만 전송
+        progress = DebouncedProgress(progress_update, initial_status=WEEKLY_FIRST_PROGRESS_STATUS)
+
         # Generate weekly report with progress updates
         result = await weekly_mgr.generate_weekly_report(
             year=year,
             week=week,
             work_log_database_id=work_log_db_id,
             weekly_report_database_id=weekly_report_db_id,
-            progress_callback=progress_update
+            progress_callback=progress
         )
+        await progress.cancel()
 
         # Update with final success message
-        used_ai = result.get('used_ai_provider', ai_provider).upper()
+        used_ai = ai_label(result.get('used_ai_provider') or ai_provider)
         daily_logs_count = result.get('daily_logs_count', 0)
         page_url = result.get('page_url', '')
 
@@ -437,83 +594,77 @@ def register_chat_handlers(app):
             text=success_text
         )
 
-        # Post analysis preview in thread
-        try:
-          analysis = result.get('analysis', '')
-          if analysis and isinstance(analysis, str):
-            preview = create_preview(analysis, preview_length=1000, show_total=True)
-            thread_text = f"🧵 주간 리포트 미리보기\n\n{preview}\n자세한 내용은 Notion 페이지에서 확인하세요!"
+        # Post analysis preview in thread (사용자는 이미 완료 메시지를 보고 있으므로 기다리지 않음)
+        analysis = result.get('analysis', '')
+        if analysis and isinstance(analysis, str):
+          preview = create_preview(analysis, preview_length=1000, show_total=True)
+          thread_text = f"🧵 주간 리포트 미리보기\n\n{preview}\n자세한 내용은 Notion 페이지에서 확인하세요!"
 
-            await client.chat_postMessage(
-                channel=channel_id,
-                thread_ts=msg_ts,
-                text=thread_text
-            )
-        except Exception as e:
-          logger.warning(f"⚠️ 스레드에 미리보기 게시 실패: {e}")
+          fire_and_forget(
+              client.chat_postMessage(
+                  channel=channel_id,
+                  thread_ts=msg_ts,
+                  text=thread_text
+              ),
+              "스레드에 미리보기 게시")
 
-        logger.info(f"✅ Weekly report completed: {year}-W{week:02d}")
+        logger.info("✅ Weekly report completed: %d-W%02d", year, week)
 
       except ValueError as ve:
         # Handle validation errors
-        error_text = (
-          f"<@{user_id}>님의 주간 리포트 생성 실패 ⚠️\n\n"
-          f"📆 기간: {year}-W{week:02d}\n"
-          f"❌ 오류: {str(ve)}"
-        )
-
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=error_text
-        )
-        logger.warning(f"⚠️ Validation error: {ve}")
+        await _abandon_progress(progress)
+        if not msg_ts:
+          raise  # 진행 메시지가 없으면 핸들러 실패로 알림
+        await _report_error(
+            client, channel_id, msg_ts,
+            f"<@{user_id}>님의 주간 리포트 생성 실패 ⚠️",
+            [f"📆 기간: {year}-W{week:02d}"],
+            ve, "Validation error", fatal=False)
 
       except Exception as e:
         # Handle other errors
-        error_text = (
-          f"<@{user_id}>님의 주간 리포트 생성 실패 ❌\n\n"
-          f"📆 기간: {year}-W{week:02d}\n"
-          f"🤖 AI: {ai_provider.upper()}\n"
-          f"❌ 오류: {str(e)}\n\n"
-          f"로그를 확인하거나 다시 시도해주세요."
-        )
-
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=error_text
-        )
-
-        logger.error(f"❌ Failed to generate weekly report: {e}", exc_info=True)
+        await _abandon_progress(progress)
+        if not msg_ts:
+          raise  # 진행 메시지가 없으면 핸들러 실패로 알림
+        await _report_error(
+            client, channel_id, msg_ts,
+            f"<@{user_id}>님의 주간 리포트 생성 실패 ❌",
+            [f"📆 기간: {year}-W{week:02d}", f"🤖 AI: {ai_label(ai_provider)}"],
+            e, "Failed to generate weekly report")
 
     except Exception as e:
-      logger.error(f"❌ Modal submission handler failed: {e}", exc_info=True)
-      await ack(
-          response_action="errors",
-          errors={"year_block": "처리 중 오류가 발생했습니다. 다시 시도해주세요."}
-      )
+      await _report_handler_failure(client, user_id, e)
 
   @app.view("monthly_report_modal")
   async def handle_monthly_report_submission(ack, body, client, view, logger):
     """Handle monthly report modal submission"""
     try:
-      logger.info("📝 Monthly report modal submitted")
-
       # Extract form values
       values = view["state"]["values"]
-      year = int(values["year_block"]["report_year"]["value"])
-      month = int(values["month_block"]["report_month"]["value"])
-      ai_provider = values["ai_provider_block"]["ai_provider"]["selected_option"]["value"]
+      year = int(_pluck(values, "year_block", "report_year"))
+      month = int(_pluck(values, "month_block", "report_month"))
+      ai_provider = _pluck(values, "ai_provider_block", "ai_provider", "selected_option")
 
       user_id = body["user"]["id"]
 
+    except Exception as e:
+      logger.error("❌ Modal submission parsing failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+      await ack(
+          response_action="errors",
+          errors={"year_block": "입력값을 확인한 뒤 다시 시도해주세요."}
+      )
+      return
+
+    # 입력값만 읽고 바로 ack (Slack 3초 제한) - 매핑 조회/검증은 ack 이후에 처리
+    await ack()
+    logger.info("📝 Monthly report modal submitted")
+
+    try:
       # Get database mappings from unified user mapping
       user_dbs = get_user_database_mapping(user_id)
 
       if not user_dbs:
         logger.error(f"❌ No database mapping found for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 데이터베이스 매핑을 찾을 수 없습니다.\n"
@@ -526,7 +677,6 @@ def register_chat_handlers(app):
 
       if not weekly_report_db_id or not monthly_report_db_id:
         logger.error(f"❌ Incomplete database mapping for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 데이터베이스 설정이 불완전합니다.\n"
@@ -535,20 +685,18 @@ def register_chat_handlers(app):
         return
 
       logger.info(
-          f"✅ Database mapping found: weekly={weekly_report_db_id}, monthly={monthly_report_db_id}")
-
-      # Acknowledge modal
-      await ack()
+          "✅ Database mapping found: weekly=%s, monthly=%s",
+          weekly_report_db_id, monthly_report_db_id)
 
       # Get channel from private_metadata
-      private_metadata = json.loads(view.get("private_metadata", "{}"))
+      private_metadata = orjson.loads(view.get("private_metadata") or "{}")
       channel_id = private_metadata.get(
           "channel_id") or body.get("channel_id") or REPORT_CHANNEL_ID
 
       # Post initial message
       msg_response = await client.chat_postMessage(
           channel=channel_id,
-          text=f"📅 {year}년 {month}월 월간 리포트 생성을 시작합니다... (AI: {ai_provider.upper()})"
+          text=f"📅 {year}년 {month}월 월간 리포트 생성을 시작합니다... (AI: {ai_label(ai_provider)})"
       )
       msg_ts = msg_response["ts"]
 
@@ -563,22 +711,26 @@ def register_chat_handlers(app):
         except Exception as e:
           logger.warning(f"⚠️ Failed to update progress: {e}")
 
-      # Generate monthly report
-      from ..notion.monthly_report_agent import get_monthly_report_manager
+      # 연속된 진행 상태는 묶어서 최신 상태만 전송
+      progress = DebouncedProgress(progress_callback)
 
+      # Generate monthly report
       try:
+        # 매니저는 시작 시 미리 생성되므로 이벤트 루프에서 바로 가져옴
+        # (singleton getter 는 잠금이 없어 워커 스레드에서 동시에 호출하면 중복 생성될 수 있음)
         monthly_mgr = get_monthly_report_manager(ai_provider_type=ai_provider)
         result = await monthly_mgr.generate_monthly_report(
             year=year,
             month=month,
             weekly_report_database_id=weekly_report_db_id,
             monthly_report_database_id=monthly_report_db_id,
-            progress_callback=progress_callback
+            progress_callback=progress
         )
+        await progress.cancel()
 
         # Update message with success
         page_url = result.get('page_url', '')
-        used_provider = result.get('used_ai_provider', ai_provider).upper()
+        used_provider = ai_label(result.get('used_ai_provider') or ai_provider)
         weekly_count = result.get('weekly_reports_count', 0)
 
         success_text = (
@@ -596,47 +748,33 @@ def register_chat_handlers(app):
             text=success_text
         )
 
-        # Post analysis preview in thread
-        try:
-          analysis = result.get('analysis', '')
-          if analysis and isinstance(analysis, str):
-            preview = create_preview(analysis, preview_length=1000, show_total=True)
-            thread_text = f"🧵 월간 리포트 미리보기\n\n{preview}\n자세한 내용은 <{page_url}|Notion 페이지>에서 확인하세요!"
-
-            await client.chat_postMessage(
-                channel=channel_id,
-                thread_ts=msg_ts,
-                text=thread_text
-            )
+        # Post analysis preview in thread (사용자는 이미 완료 메시지를 보고 있으므로 기다리지 않음)
+        analysis = result.get('analysis', '')
+        if analysis and isinstance(analysis, str):
+          preview = create_preview(analysis, preview_length=1000, show_total=True)
+          thread_text = f"🧵 월간 리포트 미리보기\n\n{preview}\n자세한 내용은 <{page_url}|Notion 페이지>에서 확인하세요!"
 
-        except Exception as e:
-          logger.warning(f"⚠️ 스레드에 미리보기 게시 실패: {e}")
+          fire_and_forget(
+              client.chat_postMessage(
+                  channel=channel_id,
+                  thread_ts=msg_ts,
+                  text=thread_text
+              ),
+              "스레드에 미리보기 게시")
 
         logger.info(
-            f"✅ Monthly report generated successfully: {year}-{month:02d}")
+            "✅ Monthly report generated successfully: %d-%02d", year, month)
 
       except Exception as e:
-        error_text = (
-          f"❌ 월간 리포트 생성 실패\n\n"
-          f"📅 기간: {year}년 {month}월\n"
-          f"❌ 오류: {str(e)}\n\n"
-          f"로그를 확인하거나 다시 시도해주세요."
-        )
-
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=error_text
-        )
-
-        logger.error(f"❌ Failed to generate monthly report: {e}", exc_info=True)
+        await _abandon_progress(progress)
+        await _report_error(
+            client, channel_id, msg_ts,
+            "❌ 월간 리포트 생성 실패",
+            [f"📅 기간: {year}년 {month}월"],
+            e, "Failed to generate monthly report")
 
     except Exception as e:
-      logger.error(f"❌ Modal submission handler failed: {e}", exc_info=True)
-      await ack(
-          response_action="errors",
-          errors={"year_block": "처리 중 오류가 발생했습니다. 다시 시도해주세요."}
-      )
+      await _report_handler_failure(client, user_id, e)
 
   @app.view("achievement_analysis_modal")
   async def handle_achievement_analysis_submission(ack, body, client, view, logger):
@@ -646,18 +784,29 @@ def register_chat_handlers(app):
       # Extract form values
       values = view["state"]["values"]
 
-      start_date = values["start_date_block"]["start_date"]["selected_date"]
-      end_date = values["end_date_block"]["end_date"]["selected_date"]
-      ai_provider = values["ai_provider_block"]["ai_provider"]["selected_option"]["value"]
+      start_date = _pluck(values, "start_date_block", "start_date", "selected_date")
+      end_date = _pluck(values, "end_date_block", "end_date", "selected_date")
+      ai_provider = _pluck(values, "ai_provider_block", "ai_provider", "selected_option")
 
       user_id = body["user"]["id"]
 
+    except Exception as e:
+      logger.error("❌ Modal submission parsing failed: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+      await ack(
+          response_action="errors",
+          errors={"start_date_block": "입력값을 확인한 뒤 다시 시도해주세요."}
+      )
+      return
+
+    # 입력값만 읽고 바로 ack (Slack 3초 제한) - 매핑 조회/검증은 ack 이후에 처리
+    await ack()
+
+    try:
       # Get database mappings from unified user mapping
       user_dbs = get_user_database_mapping(user_id)
 
       if not user_dbs:
         logger.error(f"❌ No database mapping found for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 데이터베이스 매핑을 찾을 수 없습니다.\n"
@@ -670,7 +819,6 @@ def register_chat_handlers(app):
 
       if not work_log_db_id:
         logger.error(f"❌ No work_log_db found for user: {user_id}")
-        await ack()
         await client.chat_postMessage(
             channel=REPORT_CHANNEL_ID,
             text=f"<@{user_id}>님의 업무일지 데이터베이스를 찾을 수 없습니다.\n"
@@ -682,153 +830,151 @@ def register_chat_handlers(app):
         logger.warning(f"⚠️ No achievements_page found for user: {user_id}")
 
       logger.info(
-          f"🎯 Processing achievement analysis: start={start_date}, end={end_date}, "
-          f"ai={ai_provider}, user={user_id}, achievements_page={achievements_page_id}"
+          "🎯 Processing achievement analysis: start=%s, end=%s, ai=%s, user=%s, achievements_page=%s",
+          start_date, end_date, ai_provider, user_id, achievements_page_id
       )
 
-      # Acknowledge modal submission immediately
-      await ack()
-
       # Send to report channel
       channel_id = REPORT_CHANNEL_ID
 
-      try:
-        # Get achievement agent
-        achievement_agent = get_achievement_agent(ai_provider_type=ai_provider)
+      # 에이전트 생성/초기 메시지 전송 단계에서 실패해도 정리할 수 있도록 미리 선언
+      progress = msg_ts = None
 
+      try:
         # Send initial progress message
         progress_msg = await client.chat_postMessage(
             channel=channel_id,
             text=f"<@{user_id}>님의 성과 분석 중... 🎯\n\n"
                  f"📆 기간: {start_date} ~ {end_date}\n"
-                 f"🤖 AI: {ai_provider.upper()}\n"
+                 f"🤖 AI: {ai_label(ai_provider)}\n"
                  f"⏳ 진행 중..."
         )
 
         msg_ts = progress_msg["ts"]
+        # 에이전트는 시작 시 미리 생성되므로 이벤트 루프에서 바로 가져옴
+        # (singleton getter 는 잠금이 없어 워커 스레드에서 동시에 호출하면 중복 생성될 수 있음)
+        achievement_agent = get_achievement_agent(ai_provider_type=ai_provider)
+
+        # Progress updater (AI 라벨과 상태 외에는 고정이므로 헤더는 한 번만 생성)
+        build_progress = make_header_progress_builder(
+          f"<@{user_id}>님의 성과 분석 중... 🎯\n\n"
+          f"📆 기간: {start_date} ~ {end_date}\n"
+        )
 
-        # Progress updater
         async def progress_update(status: str, current: int, total: int):
-          used_ai_label = (achievement_agent.last_used_ai_provider or ai_provider).upper()
           return await client.chat_update(
               channel=channel_id,
               ts=msg_ts,
-              text=f"<@{user_id}>님의 성과 분석 중... 🎯\n\n"
-                   f"📆 기간: {start_date} ~ {end_date}\n"
-                   f"🤖 AI: {used_ai_label}\n"
-                   f"⏳ {status} [{current}/{total}]"
+              text=build_progress(
+                  achievement_agent.last_used_ai_provider or ai_provider,
+                  f"{status} [{current}/{total}]")
           )
 
+        # 연속된 진행 상태는 묶어서 최신 상태만 전송
+        progress = DebouncedProgress(progress_update)
+
         # Analyze work logs with progress updates
         result = await achievement_agent.analyze_work_logs_batch(
             database_id=work_log_db_id,
             start_date=start_date,
             end_date=end_date,
             achievements_page_id=achievements_page_id,
-            progress_callback=progress_update
-        )
-
-        # Calculate total achievements
-        total_achievements = sum(
-            r.get('achievements_count', 0)
-            for r in result.get('results', [])
-            if r.get('success')
-        )
+            progress_callback=progress
+        )
+        await progress.cancel()
+
+        # Calculate total achievements & group by success/failure (한 번 순회)
+        results_list = result.get('results', [])
+        successful, no_achievements, failed_list = [], [], []
+        total_achievements = 0
+        for r in results_list:
+          if r.get('success'):
+            count = r.get('achievements_count', 0)
+            total_achievements += count
+            (successful if count > 0 else no_achievements).append(r)
+          else:
+            failed_list.append(r)
 
         # Update with final success message
-        used_ai = (achievement_agent.last_used_ai_provider or ai_provider).upper()
+        used_ai = get_used_ai_label(achievement_agent, ai_provider)
         total_work_logs = result.get('total', 0)
         analyzed = result.get('analyzed', 0)
         failed = result.get('failed', 0)
 
-        success_text = (
+        success_parts = [
           f"<@{user_id}>님의 성과 분석 완료! ✅\n\n"
           f"📆 기간: {start_date} ~ {end_date}\n"
           f"🤖 AI: {used_ai}\n"
           f"📊 업무일지: {total_work_logs}개\n"
           f"✅ 분석 성공: {analyzed}개\n"
           f"🎯 추출된 성과: {total_achievements}개\n\n"
-        )
+        ]
 
         if achievements_page_id:
           page_url = f"https://notion.so/{achievements_page_id.replace('-', '')}"
-          success_text += f"📄 <{page_url}|통합 성과 페이지에서 확인하세요!>"
+          success_parts.append(f"📄 <{page_url}|통합 성과 페이지에서 확인하세요!>")
         else:
-          success_text += f"⚠️ 통합 성과 페이지가 설정되지 않아 결과를 저장하지 못했습니다."
+          success_parts.append("⚠️ 통합 성과 페이지가 설정되지 않아 결과를 저장하지 못했습니다.")
 
         if failed > 0:
-          success_text += f"\n⚠️ 분석 실패: {failed}개"
+          success_parts.append(f"\n⚠️ 분석 실패: {failed}개")
 
         await client.chat_update(
             channel=channel_id,
             ts=msg_ts,
-            text=success_text
+            text="".join(success_parts)
         )
 
         # Post detailed results in thread
         try:
-          results_list = result.get('results', [])
           if results_list:
-            # Group by success/failure
-            successful = [r for r in results_list if r.get('success') and r.get('achievements_count', 0) > 0]
-            no_achievements = [r for r in results_list if r.get('success') and r.get('achievements_count', 0) == 0]
-            failed_list = [r for r in results_list if not r.get('success')]
-
-            thread_text = "🧵 성과 분석 상세 결과\n\n"
+            thread_parts = ["🧵 성과 분석 상세 결과\n\n"]
 
             if successful:
-              thread_text += "✅ *성과가 추출된 업무일지*\n"
+              thread_parts.append("✅ *성과가 추출된 업무일지*\n")
               for r in successful[:10]:  # Show first 10
                 page_id = r.get('page_id', 'N/A')
                 count = r.get('achievements_count', 0)
-                thread_text += f"• {count}개 성과 추출 - <https://notion.so/{page_id}|페이지 바로가기>\n"
+                thread_parts.append(f"• {count}개 성과 추출 - <https://notion.so/{page_id}|페이지 바로가기>\n")
 
               if len(successful) > 10:
-                thread_text += f"... 외 {len(successful) - 10}개\n"
+                thread_parts.append(f"... 외 {len(successful) - 10}개\n")
 
-              thread_text += "\n"
+              thread_parts.append("\n")
 
             if no_achievements:
-              thread_text += f"📭 *성과가 추출되지 않은 업무일지: {len(no_achievements)}개*\n\n"
+              thread_parts.append(f"📭 *성과가 추출되지 않은 업무일지: {len(no_achievements)}개*\n\n")
 
             if failed_list:
-              thread_text += "❌ *분석 실패*\n"
+              thread_parts.append("❌ *분석 실패*\n")
               for r in failed_list[:5]:  # Show first 5
                 page_id = r.get('page_id', 'N/A')
                 error = r.get('error', 'Unknown error')
-                thread_text += f"• {page_id}: {error}\n"
+                thread_parts.append(f"• {page_id}: {error}\n")
 
             await client.chat_postMessage(
                 channel=channel_id,
                 thread_ts=msg_ts,
-                text=thread_text
+                text="".join(thread_parts)
             )
         except Exception as e:
           logger.warning(f"⚠️ 스레드에 상세 결과 게시 실패: {e}")
 
-        logger.info(f"✅ Achievement analysis completed: {start_date} ~ {end_date}")
+        logger.info("✅ Achievement analysis completed: %s ~ %s", start_date, end_date)
 
       except Exception as e:
         # Handle other errors
-        error_text = (
-          f"<@{user_id}>님의 성과 분석 실패 ❌\n\n"
-          f"📆 기간: {start_date} ~ {end_date}\n"
-          f"🤖 AI: {ai_provider.upper()}\n"
-          f"❌ 오류: {str(e)}\n\n"
-          f"로그를 확인하거나 다시 시도해주세요."
-        )
-
-        await client.chat_update(
-            channel=channel_id,
-            ts=msg_ts,
-            text=error_text
-        )
-
-        logger.error(f"❌ Failed to analyze achievements: {e}", exc_info=True)
+        await _abandon_progress(progress)
+        if not msg_ts:
+          raise  # 진행 메시지가 없으면 핸들러 실패로 알림
+        await _report_error(
+            client, channel_id, msg_ts,
+            f"<@{user_id}>님의 성과 분석 실패 ❌",
+            [f"📆 기간: {start_date} ~ {end_date}", f"🤖 AI: {ai_label(ai_provider)}"],
+            e, "Failed to analyze achievements")
 
     except Exception as e:
-      logger.error(f"❌ Modal submission handler failed: {e}", exc_info=True)
-      await ack(
-          response_action="errors",
-          errors={"start_date_block": "처리 중 오류가 발생했습니다. 다시 시도해주세요."}
-      )
+      await _report_handler_failure(client, user_id, e)
+
+  # 핸들러 등록 후 매니저를 미리 생성 (앱 시작 시 한 번)
+  _prewarm_managers()
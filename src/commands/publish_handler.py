@@ -4,27 +4,33 @@ Notion에서 "발행" 체크박스를 클릭하면 Slack Webhook을 통해
 업무일지를 junogarden-web GitHub 저장소에 발행합니다.
 """
 
+import asyncio
 import json
 import logging
 import os
 import re
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from slack_bolt.async_app import AsyncApp
 
 from ..github.junogarden_publisher import JunogardenPublisher
 from ..github.portfolio_updater import get_portfolio_updater
-from ..notion.client import NotionClient
+from ..notion import get_notion_client
 from ..common.notion_utils import extract_page_content
+from ..common.progress_utils import DebouncedProgress
 
 logger = logging.getLogger(__name__)
 
-# Webhook 채널 ID (Notion Automation에서 메시지를 받는 채널)
-WEBHOOK_CHANNEL_ID = os.getenv("SLACK_WORK_LOG_WEBHOOK_CHANNEL_ID")
+# 속성 조회용 공유 빈 dict (조회마다 {} 를 새로 만들지 않음, 수정 금지)
+_EMPTY: Dict = {}
+
 # 결과 리포트를 보내는 채널
 REPORT_CHANNEL_ID = os.getenv("SLACK_WORK_LOG_REPORT_CHANNEL_ID")
 
+# 날짜 형식 (YYYY-MM-DD)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+
 
 def parse_publish_message(message_text: str) -> Optional[Dict]:
   """발행 요청 메시지 파싱
@@ -56,34 +62,80 @@ def parse_publish_message(message_text: str) -> Optional[Dict]:
   return None
 
 
-def extract_title_from_page(page: Dict) -> str:
-  """Notion 페이지에서 제목 추출
+def _property_ranks(*names: str) -> Dict[str, int]:
+  """속성 이름 -> 우선순위 (앞선 이름일수록 작은 값)"""
+  return {name: rank for rank, name in enumerate(names)}
+
+
+# 일반적으로 쓰이는 속성 이름들 (앞선 이름 우선)
+_TITLE_PROPERTY_RANKS = _property_ranks("제목", "Title", "이름", "Name", "title", "name")
+_TAG_PROPERTY_RANKS = _property_ranks("기술스택", "Tags", "태그", "tags", "Tech Stack")
+_DATE_PROPERTY_RANKS = _property_ranks("작성일", "Date", "날짜", "date", "Created")
+
+# 알려진 이름이 아닌 title 속성의 우선순위 (알려진 이름보다 후순위)
+_UNKNOWN_TITLE_RANK = len(_TITLE_PROPERTY_RANKS)
+# 아직 찾지 못한 상태의 우선순위 (모든 후보보다 후순위)
+_NOT_FOUND_RANK = _UNKNOWN_TITLE_RANK + 1
+
+
+def extract_page_fields(page: Dict) -> Tuple[str, List[str], Optional[str]]:
+  """Notion 페이지에서 제목, 태그, 날짜를 속성 한 번 순회로 추출
+
+  후보 이름이 여러 개 있으면 앞선 이름을 우선합니다.
+  title 속성은 알려진 이름이 없으면 처음 나온 title 속성을 사용합니다.
 
   Args:
     page: Notion 페이지 객체
 
   Returns:
-    페이지 제목 문자열
+    (제목, 태그 문자열 목록, YYYY-MM-DD 날짜 또는 None)
   """
-  properties = page.get("properties", {})
+  properties = page.get("properties") or _EMPTY
+
+  title, title_rank = "", _NOT_FOUND_RANK
+  tags, tags_rank = [], _NOT_FOUND_RANK
+  date, date_rank = None, _NOT_FOUND_RANK
+
+  for prop_name, prop in properties.items():
+    prop_type = prop.get("type")
+
+    if prop_type == "title":
+      rank = _TITLE_PROPERTY_RANKS.get(prop_name, _UNKNOWN_TITLE_RANK)
+      if rank < title_rank:
+        title_rank = rank
+        title = "".join(t.get("plain_text", "") for t in prop.get("title") or ())
+
+    elif prop_type == "multi_select" or prop_type == "select":
+      rank = _TAG_PROPERTY_RANKS.get(prop_name, _NOT_FOUND_RANK)
+      if rank < tags_rank:
+        tags_rank = rank
+        if prop_type == "multi_select":
+          tags = [t.get("name", "") for t in prop.get("multi_select") or ()]
+        else:
+          select_val = prop.get("select")
+          tags = [select_val.get("name", "")] if select_val else []
 
-  # 일반적인 title 속성 이름들 시도
-  title_property_names = ["제목", "Title", "이름", "Name", "title", "name"]
+    elif prop_type == "date":
+      rank = _DATE_PROPERTY_RANKS.get(prop_name, _NOT_FOUND_RANK)
+      if rank < date_rank:
+        start = (prop.get("date") or _EMPTY).get("start")
+        if start:
+          date_rank = rank
+          date = start[:10]  # YYYY-MM-DD만 추출
 
-  for prop_name in title_property_names:
-    if prop_name in properties:
-      prop = properties[prop_name]
-      if prop.get("type") == "title":
-        title_array = prop.get("title", [])
-        return "".join([t.get("plain_text", "") for t in title_array])
+  return title, [t for t in tags if t], date  # 빈 태그 제거
 
-  # properties 전체에서 title 타입 찾기
-  for prop_name, prop_data in properties.items():
-    if prop_data.get("type") == "title":
-      title_array = prop_data.get("title", [])
-      return "".join([t.get("plain_text", "") for t in title_array])
 
-  return ""
+def extract_title_from_page(page: Dict) -> str:
+  """Notion 페이지에서 제목 추출
+
+  Args:
+    page: Notion 페이지 객체
+
+  Returns:
+    페이지 제목 문자열
+  """
+  return extract_page_fields(page)[0]
 
 
 def extract_tags_from_page(page: Dict) -> list:
@@ -95,25 +147,7 @@ def extract_tags_from_page(page: Dict) -> list:
   Returns:
     태그 문자열 목록
   """
-  properties = page.get("properties", {})
-  tags = []
-
-  # 일반적인 태그 속성 이름들 시도
-  tag_property_names = ["기술스택", "Tags", "태그", "tags", "Tech Stack"]
-
-  for prop_name in tag_property_names:
-    if prop_name in properties:
-      prop = properties[prop_name]
-      if prop.get("type") == "multi_select":
-        tags = [t.get("name", "") for t in prop.get("multi_select", [])]
-        break
-      elif prop.get("type") == "select":
-        select_val = prop.get("select")
-        if select_val:
-          tags = [select_val.get("name", "")]
-        break
-
-  return [t for t in tags if t]  # 빈 문자열 제거
+  return extract_page_fields(page)[1]
 
 
 def extract_date_from_page(page: Dict, fallback_date: str) -> str:
@@ -126,20 +160,7 @@ def extract_date_from_page(page: Dict, fallback_date: str) -> str:
   Returns:
     YYYY-MM-DD 형식의 날짜 문자열
   """
-  properties = page.get("properties", {})
-
-  # 일반적인 날짜 속성 이름들 시도
-  date_property_names = ["작성일", "Date", "날짜", "date", "Created"]
-
-  for prop_name in date_property_names:
-    if prop_name in properties:
-      prop = properties[prop_name]
-      if prop.get("type") == "date":
-        date_obj = prop.get("date")
-        if date_obj and date_obj.get("start"):
-          return date_obj["start"][:10]  # YYYY-MM-DD만 추출
-
-  return fallback_date
+  return extract_page_fields(page)[2] or fallback_date
 
 
 async def handle_publish_webhook_message(
@@ -158,11 +179,7 @@ async def handle_publish_webhook_message(
     client: Slack 클라이언트
   """
   try:
-    # Webhook 채널에서만 처리
-    channel_id = message.get("channel")
-    if channel_id != WEBHOOK_CHANNEL_ID:
-      return
-
+    # 채널은 chat_handlers 의 matcher 에서 이미 확인됨 (webhook 채널 메시지만 전달)
     # 메시지 파싱
     message_text = message.get("text", "")
     parsed = parse_publish_message(message_text)
@@ -194,55 +211,57 @@ async def handle_publish_webhook_message(
     )
     message_ts = status_msg["ts"]
 
-    try:
-      # 1. Notion 페이지 내용 추출
+    async def progress_update(text: str):
       await client.chat_update(
         channel=REPORT_CHANNEL_ID,
         ts=message_ts,
-        text=(
-          f"📤 {user_mention}업무일지 발행 중...\n"
-          f"📅 날짜: {date or '추출 중...'}\n\n"
-          f"⏳ Notion 페이지 로드 중..."
-        )
+        text=text
+      )
+
+    # 진행 상태는 백그라운드로 전송하고, 짧은 간격에 몰리면 최신 상태만 전송
+    # (발행 작업은 Slack 응답을 기다리지 않음, 최종 메시지 전 cancel 로 정리)
+    progress = DebouncedProgress(progress_update, min_interval=0.5)
+
+    try:
+      # 1. Notion 페이지 속성/본문(마크다운) 로드
+      # (본문 추출은 page_id 만 필요하므로 페이지 조회와 동시에 진행)
+      await progress(
+        f"📤 {user_mention}업무일지 발행 중...\n"
+        f"📅 날짜: {date or '추출 중...'}\n\n"
+        f"⏳ Notion 페이지 로드 중..."
       )
 
-      notion_client = NotionClient()
-      page = await notion_client.get_page(page_id)
+      # 공유 클라이언트 재사용 (요청마다 HTTP 연결 풀을 새로 만들지 않음)
+      notion_client = get_notion_client()
+      page, content = await asyncio.gather(
+        notion_client.get_page(page_id),
+        extract_page_content(notion_client, page_id, format="markdown"),
+      )
 
-      # 페이지 제목 추출
-      title = extract_title_from_page(page)
+      # 페이지 제목/태그/날짜 추출 (속성 한 번 순회)
+      title, tags, page_date = extract_page_fields(page)
       if not title:
         title = f"{date} 업무일지"
 
-      # 태그 추출
-      tags = extract_tags_from_page(page)
-
-      # 날짜 추출 (date 파라미터가 없으면 페이지에서 추출)
+      # 날짜 (date 파라미터가 없으면 페이지에서 추출)
       if not date:
-        date = extract_date_from_page(page, datetime.now().strftime("%Y-%m-%d"))
+        date = page_date or datetime.now().strftime("%Y-%m-%d")
 
       # 날짜 형식 검증
-      if not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
+      if not _DATE_RE.fullmatch(date):
         raise ValueError(f"잘못된 날짜 형식: {date}")
 
-      # 페이지 본문 내용 추출 (마크다운 형식)
-      content = await extract_page_content(notion_client, page_id, format="markdown")
-
       if not content:
         raise ValueError("페이지 내용이 비어있습니다")
 
       logger.info(f"📄 Notion 페이지 로드 완료: {title} ({len(content)}자)")
 
       # 2. GitHub 발행
-      await client.chat_update(
-        channel=REPORT_CHANNEL_ID,
-        ts=message_ts,
-        text=(
-          f"📤 {user_mention}업무일지 발행 중...\n"
-          f"📅 날짜: {date}\n"
-          f"📄 제목: {title}\n\n"
-          f"⏳ GitHub에 발행 중..."
-        )
+      await progress(
+        f"📤 {user_mention}업무일지 발행 중...\n"
+        f"📅 날짜: {date}\n"
+        f"📄 제목: {title}\n\n"
+        f"⏳ GitHub에 발행 중..."
       )
 
       publisher = JunogardenPublisher()
@@ -256,15 +275,11 @@ async def handle_publish_webhook_message(
       if result["success"]:
         # 3. 포트폴리오 자동 업데이트 - Claude Code 사용
         portfolio_status = ""
-        await client.chat_update(
-          channel=REPORT_CHANNEL_ID,
-          ts=message_ts,
-          text=(
-            f"📤 {user_mention}업무일지 발행 중...\n"
-            f"📅 날짜: {date}\n"
-            f"📄 제목: {title}\n\n"
-            f"⏳ 포트폴리오 업데이트 중... (Claude Code)"
-          )
+        await progress(
+          f"📤 {user_mention}업무일지 발행 중...\n"
+          f"📅 날짜: {date}\n"
+          f"📄 제목: {title}\n\n"
+          f"⏳ 포트폴리오 업데이트 중... (Claude Code)"
         )
 
         portfolio_updater = get_portfolio_updater()
@@ -300,6 +315,7 @@ async def handle_publish_webhook_message(
         commit_sha = result.get("commit_sha", "N/A")
         file_path = result.get("file_path", f"content/work-logs/daily/{date}.md")
 
+        await progress.cancel()
         await client.chat_update(
           channel=REPORT_CHANNEL_ID,
           ts=message_ts,
@@ -322,6 +338,7 @@ async def handle_publish_webhook_message(
 
     except ValueError as ve:
       # 검증 오류
+      await progress.cancel()
       await client.chat_update(
         channel=REPORT_CHANNEL_ID,
         ts=message_ts,
@@ -335,6 +352,7 @@ async def handle_publish_webhook_message(
 
     except Exception as e:
       # 일반 오류
+      await progress.cancel()
       await client.chat_update(
         channel=REPORT_CHANNEL_ID,
         ts=message_ts,
@@ -344,10 +362,10 @@ async def handle_publish_webhook_message(
           f"오류: {str(e)}"
         )
       )
-      logger.error(f"❌ Publish failed: {e}", exc_info=True)
+      logger.error("❌ Publish failed: %s", e, exc_info=True)
 
   except Exception as e:
-    logger.error(f"❌ Error in publish webhook handler: {e}", exc_info=True)
+    logger.error("❌ Error in publish webhook handler: %s", e, exc_info=True)
 
 
 def register_publish_handler(app: AsyncApp):
@@ -8,22 +8,25 @@ from typing import Dict, Optional
 
 from slack_bolt.async_app import AsyncApp
 
-from ..notion.work_log_agent import get_work_log_manager
+from ..notion.work_log_agent import FIRST_PROGRESS_STATUS, get_work_log_manager
+from ..common.async_utils import fire_and_forget
+from ..common.progress_utils import DebouncedProgress
 from ..common.slack_utils import (
-  build_initial_text,
-  build_progress_text,
+  ai_label,
+  build_flavor_line,
   get_used_ai_label,
-  flavor_emoji,
-  flavor_label,
+  make_progress_text_builder,
+  post_thread_chunks,
 )
 
 logger = logging.getLogger(__name__)
 
-# Target channel for webhook messages
-WEBHOOK_CHANNEL_ID = os.getenv("SLACK_WORK_LOG_WEBHOOK_CHANNEL_ID")
 # Target channel for report messages
 REPORT_CHANNEL_ID = os.getenv("SLACK_WORK_LOG_REPORT_CHANNEL_ID")
 
+# 날짜 형식 (YYYY-MM-DD)
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII)
+
 
 def parse_work_log_message(message_text: str) -> Optional[Dict]:
   """메시지 텍스트에서 업무일지 피드백 요청 파싱 (JSON 형식)
@@ -41,8 +44,13 @@ def parse_work_log_message(message_text: str) -> Optional[Dict]:
   필수: action, date, database_id
   선택: ai_provider(gemini 기본), flavor(normal 기본), user_id
   """
+  text = message_text.strip()
+  # JSON 객체가 아니면 파싱하지 않고 바로 거절
+  if not text.startswith("{"):
+    return None
+
   try:
-    data = json.loads(message_text.strip())
+    data = json.loads(text)
     if data.get("action") == "work_log_feedback":
       return {
         "date": data.get("date"),
@@ -71,11 +79,7 @@ async def handle_work_log_webhook_message(
       client: Slack client
   """
   try:
-    # Check if message is from the webhook channel
-    channel_id = message.get("channel")
-    if channel_id != WEBHOOK_CHANNEL_ID:
-      return
-
+    # Channel is already checked by the chat_handlers matcher (webhook channel only)
     # Parse message
     message_text = message.get("text", "")
     parsed_data = parse_work_log_message(message_text)
@@ -93,7 +97,7 @@ async def handle_work_log_webhook_message(
     database_id = parsed_data.get("database_id")  # Required
 
     # Validate date format
-    if not date or not re.match(r'^\d{4}-\d{2}-\d{2}$', date):
+    if not date or not _DATE_RE.fullmatch(date):
       await client.chat_postMessage(
           channel=REPORT_CHANNEL_ID,
           text=f"❌ 잘못된 날짜 형식입니다: {date}\n올바른 형식: YYYY-MM-DD"
@@ -128,31 +132,46 @@ async def handle_work_log_webhook_message(
       )
       return
 
-    # Prepare user mention
+    # Prepare user mention & progress text (요청 동안 고정된 부분은 한 번만 생성)
     user_mention = f"<@{user_id}>님의 " if user_id else ""
+    build_progress = make_progress_text_builder(
+        user_mention, date, build_flavor_line(flavor))
 
-    # Create manager upfront to allow dynamic AI labeling (may remain selected value until fallback occurs)
-    work_log_mgr = get_work_log_manager(ai_provider_type=ai_provider)
-    # 이전 작업 잔여 상태 초기화 (초기 메시지 표기 안정화)
-    try:
-      work_log_mgr.last_used_ai_provider = None
-    except Exception:
-      pass
-    used_ai_label = get_used_ai_label(work_log_mgr, ai_provider)
-
-    # Send initial response with dynamic AI label
+    # Send initial progress message
+    # (시작 시점에는 요청한 AI가 표시되고, fallback 발생 시 진행 메시지에서 갱신됨)
+    # (첫 진행 상태를 바로 담아 보내 별도 chat_update 한 번을 줄임)
     initial_message = await client.chat_postMessage(
         channel=REPORT_CHANNEL_ID,
-        text=build_initial_text(
-          user_mention=user_mention,
-          date=date,
-          ai_label=used_ai_label,
-          flavor_line=f"{flavor_emoji(flavor)} 피드백: {flavor_label(flavor)}",
-        )
+        text=build_progress(ai_provider, FIRST_PROGRESS_STATUS)
     )
-
     message_ts = initial_message.get("ts")
 
+    # 매니저는 시작 시 미리 생성되므로 이벤트 루프에서 바로 가져옴
+    # (singleton getter 는 잠금이 없어 워커 스레드에서 동시에 호출하면 중복 생성될 수 있음)
+    try:
+      work_log_mgr = get_work_log_manager(ai_provider_type=ai_provider)
+    except Exception as e:
+      # 이미 보낸 진행 메시지를 실패 메시지로 변경 (진행 중 상태로 남지 않도록)
+      await client.chat_update(
+          channel=REPORT_CHANNEL_ID,
+          ts=message_ts,
+          text=(
+            f"❌ {user_mention}업무일지 피드백 생성 중 오류 발생\n\n"
+            f"📅 날짜: {date}\n"
+            f"🤖 AI: {ai_label(ai_provider)}\n"
+            f"🌶️ 맛: {flavor}\n\n"
+            f"오류: {e}"
+          )
+      )
+      logger.error("❌ Failed to create work log manager: %s", e, exc_info=True)
+      return
+
+    # 이전 작업 잔여 상태 초기화 (fallback 라벨 표기 안정화)
+    try:
+      work_log_mgr.last_used_ai_provider = None
+    except Exception:
+      pass
+
     # Process feedback
     try:
       # work_log_mgr already created above
@@ -160,36 +179,47 @@ async def handle_work_log_webhook_message(
       # Progress update function (reflects fallback provider if it occurs)
       async def update_progress(status: str):
         try:
-          used_ai = get_used_ai_label(work_log_mgr, ai_provider)
           await client.chat_update(
               channel=REPORT_CHANNEL_ID,
               ts=message_ts,
-              text=build_progress_text(
-                user_mention=user_mention,
-                date=date,
-                ai_label=used_ai,
-                flavor_line=f"{flavor_emoji(flavor)} 피드백: {flavor_label(flavor)}",
-                status=status,
-              )
+              text=build_progress(work_log_mgr.last_used_ai_provider or ai_provider, status)
           )
         except Exception as e:
           logger.warning(f"⚠️ 진행 상태 업데이트 실패: {e}")
+
+      # 연속된 진행 상태는 묶어서 최신 상태만 전송 (초기 메시지에 담은 첫 상태는 생략)
+      progress = DebouncedProgress(update_progress, initial_status=FIRST_PROGRESS_STATUS)
+
       result = await work_log_mgr.process_feedback(
           date=date,
           database_id=database_id,
           flavor=flavor,
-          progress_callback=update_progress
+          progress_callback=progress
       )
+      await progress.cancel()
 
       # Success response
-      used_ai = (result.get('used_ai_provider') if isinstance(result, dict) else None) or ai_provider
+      used_ai = ai_label(result['used_ai_provider'] or ai_provider)
+
+      # 스레드에 생성된 피드백 전문 게시 (완료 메시지와 독립적이므로 기다리지 않음)
+      # (text 로만 보내므로 대부분 메시지 하나에 담김, 넘칠 때만 청크를 순서대로 전송)
+      feedback_text = result['feedback']
+      if feedback_text:
+        header = (
+          f"🧵 AI 피드백 전문\n"
+          f"🤖 AI: {used_ai} | 🌶️ 맛: {flavor}\n\n"
+        )
+        fire_and_forget(
+            post_thread_chunks(client, REPORT_CHANNEL_ID, message_ts, header + feedback_text),
+            "스레드에 피드백 전문 게시")
+
       await client.chat_update(
           channel=REPORT_CHANNEL_ID,
           ts=message_ts,
           text=(
             f"✅ {user_mention}업무일지 AI 피드백 생성 완료!\n\n"
             f"📅 날짜: {date}\n"
-            f"🤖 AI: {used_ai.upper()}\n"
+            f"🤖 AI: {used_ai}\n"
             f"🌶️ 맛: {flavor}\n"
             f"📄 페이지 ID: {result['page_id']}\n"
             f"📝 피드백 길이: {result['feedback_length']}자"
@@ -198,28 +228,10 @@ async def handle_work_log_webhook_message(
 
       logger.info(f"✅ Work log feedback completed: {result}")
 
-      # Post full feedback in thread
-      try:
-        from ..common.slack_utils import split_text_for_slack
-        feedback_text = result.get('feedback') if isinstance(result, dict) else None
-        if feedback_text:
-          header = (
-            f"🧵 AI 피드백 전문\n"
-            f"🤖 AI: {used_ai.upper()} | 🌶️ 맛: {flavor}\n\n"
-          )
-          combined = header + feedback_text
-          for chunk in split_text_for_slack(combined):
-            await client.chat_postMessage(
-                channel=REPORT_CHANNEL_ID,
-                thread_ts=message_ts,
-                text=chunk
-            )
-      except Exception as e:
-        logger.warning(f"⚠️ 스레드에 피드백 전문 게시 실패: {e}")
-
     except ValueError as ve:
       # Validation error (page not found, already completed, etc.)
-      used_ai = (getattr(work_log_mgr, 'last_used_ai_provider', None) or ai_provider).upper()
+      await progress.cancel()
+      used_ai = get_used_ai_label(work_log_mgr, ai_provider)
       await client.chat_update(
           channel=REPORT_CHANNEL_ID,
           ts=message_ts,
@@ -235,7 +247,8 @@ async def handle_work_log_webhook_message(
 
     except Exception as e:
       # Unexpected error
-      used_ai = (getattr(work_log_mgr, 'last_used_ai_provider', None) or ai_provider).upper()
+      await progress.cancel()
+      used_ai = get_used_ai_label(work_log_mgr, ai_provider)
       await client.chat_update(
           channel=REPORT_CHANNEL_ID,
           ts=message_ts,
@@ -247,10 +260,10 @@ async def handle_work_log_webhook_message(
             f"오류: {str(e)}"
           )
       )
-      logger.error(f"❌ Failed to process work log feedback: {e}", exc_info=True)
+      logger.error("❌ Failed to process work log feedback: %s", e, exc_info=True)
 
   except Exception as e:
-    logger.error(f"❌ Error in work log webhook handler: {e}", exc_info=True)
+    logger.error("❌ Error in work log webhook handler: %s", e, exc_info=True)
 
 
 def register_work_log_webhook_handler(app: AsyncApp):
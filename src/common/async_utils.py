@@ -0,0 +1,42 @@
+"""비동기 작업 관련 유틸리티"""
+
+import asyncio
+import logging
+from typing import Awaitable, Set
+
+logger = logging.getLogger(__name__)
+
+# 실행 중인 백그라운드 태스크 (이벤트 루프는 약한 참조만 가지므로 끝날 때까지 여기서 보관)
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def fire_and_forget(coro: Awaitable, description: str) -> asyncio.Task:
+  """
+  결과를 기다릴 필요 없는 작업을 백그라운드 태스크로 실행합니다.
+
+  태스크가 끝나기 전에 가비지 컬렉션되지 않도록 참조를 보관하고,
+  에러는 로그만 남깁니다 (호출 측으로 전파되지 않음).
+
+  Args:
+      coro: 실행할 코루틴
+      description: 실패 로그에 표시할 작업 설명
+
+  Returns:
+      생성된 태스크
+
+  Example:
+      >>> fire_and_forget(client.chat_postMessage(...), "스레드에 미리보기 게시")
+  """
+  task = asyncio.ensure_future(coro)
+  _background_tasks.add(task)
+
+  def _on_done(done: asyncio.Task) -> None:
+    _background_tasks.discard(done)
+    if done.cancelled():
+      return
+    error = done.exception()
+    if error is not None:
+      logger.warning(f"⚠️ {description} 실패: {error}")
+
+  task.add_done_callback(_on_done)
+  return task
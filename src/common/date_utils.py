@@ -2,9 +2,9 @@
 
 from datetime import datetime, timedelta
 from typing import List, Tuple
-import pytz
+from zoneinfo import ZoneInfo
 
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
 
 def get_week_info(date: datetime) -> Tuple[int, int]:
@@ -0,0 +1,111 @@
+"""Notion 페이지 콘텐츠 캐시
+
+월간 리포트를 다시 생성할 때마다 같은 주간 리포트 페이지와 이력서 페이지의
+블록을 다시 조회하지 않도록, (page_id, last_edited_time) 기준으로 추출된
+콘텐츠를 메모리에 보관합니다. 페이지가 수정되면 last_edited_time이 바뀌므로
+자연스럽게 새로 조회합니다.
+
+같은 페이지를 동시에 요청하면(발행/분석기의 gather 등) 진행 중인 조회 하나를 공유합니다.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from cachetools import TTLCache
+
+from .notion_utils import extract_page_content
+
+logger = logging.getLogger(__name__)
+
+# 일반 페이지 콘텐츠 캐시 (1시간)
+_page_content_cache: TTLCache = TTLCache(maxsize=512, ttl=3600)
+# 이력서 페이지 콘텐츠 캐시 (거의 바뀌지 않으므로 1일)
+_resume_content_cache: TTLCache = TTLCache(maxsize=32, ttl=86400)
+# 진행 중인 조회 (캐시 키 -> 조회 태스크, 완료 시 제거)
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def get_cached_page_content(
+    notion_client: "NotionClient",
+    page_id: str,
+    last_edited_time: Optional[str] = None,
+    format: str = "text",
+    cache: Optional[TTLCache] = None
+) -> str:
+  """
+  페이지 콘텐츠를 캐시에서 가져오거나, 없으면 추출 후 캐시에 저장합니다.
+
+  Args:
+      notion_client: NotionClient 인스턴스
+      page_id: Notion page ID
+      last_edited_time: 페이지의 last_edited_time (없으면 캐시를 사용하지 않음)
+      format: 출력 형식 ("text" 또는 "markdown")
+      cache: 사용할 캐시 (기본값: 일반 페이지 캐시)
+
+  Returns:
+      페이지 본문 텍스트
+
+  Raises:
+      Exception: Notion 조회 실패 시 (실패는 캐시하지 않음)
+  """
+  if not last_edited_time:
+    return await extract_page_content(notion_client, page_id, format=format)
+
+  if cache is None:
+    cache = _page_content_cache
+
+  key = f"{page_id}:{last_edited_time}:{format}"
+  cached = cache.get(key)
+  if cached is not None:
+    logger.info(f"♻️ 페이지 콘텐츠 캐시 사용: {page_id}")
+    return cached
+
+  # 같은 키를 이미 조회 중이면 그 결과를 함께 기다림
+  # (이벤트 루프 안에서 확인과 등록 사이에 await 가 없으므로 별도 잠금 불필요)
+  task = _inflight.get(key)
+  if task is None:
+    task = asyncio.create_task(extract_page_content(notion_client, page_id, format=format))
+    _inflight[key] = task
+    task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+  # 한 요청이 취소되어도 함께 기다리는 다른 요청의 조회는 계속되도록 shield
+  # (조회 실패는 예외로 전파되므로 여기까지 오면 빈 본문도 정상 결과로 캐시)
+  content = await asyncio.shield(task)
+  cache[key] = content
+  return content
+
+
+async def get_cached_resume_content(
+    notion_client: "NotionClient",
+    resume_page_id: str,
+    format: str = "text"
+) -> str:
+  """
+  이력서 페이지 콘텐츠를 가져옵니다.
+
+  페이지 메타데이터(pages.retrieve)만 조회해 last_edited_time을 확인하고,
+  변경되지 않았다면 블록 조회 없이 캐시된 콘텐츠를 반환합니다.
+
+  Args:
+      notion_client: NotionClient 인스턴스
+      resume_page_id: 이력서 페이지 ID
+      format: 출력 형식 ("text" 또는 "markdown")
+
+  Returns:
+      이력서 본문 텍스트
+  """
+  page = await notion_client.get_page(resume_page_id)
+  return await get_cached_page_content(
+      notion_client,
+      resume_page_id,
+      last_edited_time=page.get("last_edited_time"),
+      format=format,
+      cache=_resume_content_cache
+  )
+
+
+def clear_page_content_cache() -> None:
+  """모든 페이지 콘텐츠 캐시를 비웁니다 (테스트용)"""
+  _page_content_cache.clear()
+  _resume_content_cache.clear()
@@ -1,12 +1,35 @@
 """Notion 관련 공통 유틸리티 함수"""
 
+import functools
+import io
 import json
 import logging
 import os
-from typing import Dict, Optional
+from typing import AsyncIterator, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# 속성 조회용 공유 빈 dict (조회마다 {} 를 새로 만들지 않음, 수정 금지)
+_EMPTY: Dict = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_user_database_mapping(raw_mapping: str) -> Tuple[Dict[str, Dict[str, str]], Optional[str]]:
+  """
+  NOTION_USER_DATABASE_MAPPING 원문을 파싱합니다.
+
+  원문 문자열을 키로 캐시하므로 환경 변수가 바뀌지 않는 한 한 번만 파싱합니다.
+  파싱 실패도 캐시하여 잘못된 값으로 매 요청마다 다시 파싱하거나 에러 로그를 남기지 않습니다.
+
+  Returns:
+      (매핑, 파싱 에러 메시지 또는 None)
+  """
+  try:
+    return json.loads(raw_mapping), None
+  except json.JSONDecodeError as e:
+    logger.error(f"❌ Failed to parse NOTION_USER_DATABASE_MAPPING: {e}")
+    return {}, str(e)
+
 
 def get_user_database_mapping(user_id: str) -> Optional[Dict[str, str]]:
   """
@@ -22,13 +45,10 @@ def get_user_database_mapping(user_id: str) -> Optional[Dict[str, str]]:
   Raises:
       ValueError: JSON 파싱 실패 시
   """
-  user_db_mapping_str = os.getenv("NOTION_USER_DATABASE_MAPPING", "{}")
-
-  try:
-    user_db_mapping = json.loads(user_db_mapping_str)
-  except json.JSONDecodeError as e:
-    logger.error(f"❌ Failed to parse NOTION_USER_DATABASE_MAPPING: {e}")
-    raise ValueError(f"Invalid NOTION_USER_DATABASE_MAPPING format: {e}")
+  user_db_mapping, parse_error = _parse_user_database_mapping(
+      os.getenv("NOTION_USER_DATABASE_MAPPING", "{}"))
+  if parse_error:
+    raise ValueError(f"Invalid NOTION_USER_DATABASE_MAPPING format: {parse_error}")
 
   user_dbs = user_db_mapping.get(user_id)
 
@@ -39,6 +59,52 @@ def get_user_database_mapping(user_id: str) -> Optional[Dict[str, str]]:
   return user_dbs
 
 
+def reload_user_database_mapping() -> None:
+  """파싱된 유저 데이터베이스 매핑을 버리고 다음 조회 때 환경 변수를 다시 파싱합니다."""
+  _parse_user_database_mapping.cache_clear()
+
+
+# 마크다운 출력 시 블록 타입별 접두사 (없는 타입은 접두사 없이 본문만 출력)
+_MARKDOWN_PREFIXES = {
+  "heading_1": "# ",
+  "heading_2": "## ",
+  "heading_3": "### ",
+  "bulleted_list_item": "- ",
+  "numbered_list_item": "1. ",
+}
+
+
+async def _iter_all_blocks(
+    notion_client: "NotionClient",
+    block_id: str
+) -> AsyncIterator[Dict]:
+  """
+  블록의 모든 하위 블록을 페이지네이션하며 순서대로 반환합니다.
+
+  Args:
+      notion_client: NotionClient 인스턴스
+      block_id: 부모 블록(페이지) ID
+
+  Yields:
+      Notion block 객체
+  """
+  start_cursor = None
+  while True:
+    params = {"block_id": block_id, "page_size": 100}
+    if start_cursor:
+      params["start_cursor"] = start_cursor
+
+    response = await notion_client.client.blocks.children.list(**params)
+    for block in response.get("results", []):
+      yield block
+
+    if not response.get("has_more"):
+      return
+    start_cursor = response.get("next_cursor")
+    if not start_cursor:
+      return
+
+
 async def extract_page_content(
     notion_client: "NotionClient",
     page_id: str,
@@ -47,57 +113,54 @@ async def extract_page_content(
   """
   Notion 페이지의 본문 내용을 추출합니다.
 
+  100개를 넘는 블록도 모두 읽도록 페이지네이션하며, 블록 단위로
+  rich_text를 이어 붙여 한 번에 버퍼에 기록합니다.
+
   Args:
       notion_client: NotionClient 인스턴스
       page_id: Notion page ID
       format: 출력 형식 ("text" 또는 "markdown")
 
   Returns:
-      페이지 본문 텍스트
+      페이지 본문 텍스트 (본문이 없는 페이지는 빈 문자열)
+
+  Raises:
+      Exception: Notion 블록 조회 실패 시 (빈 페이지와 구분되도록 그대로 전파)
 
   Example:
       >>> content = await extract_page_content(client, "page-id", "text")
       >>> md_content = await extract_page_content(client, "page-id", "markdown")
   """
-  try:
-    blocks_response = await notion_client.client.blocks.children.list(
-        block_id=page_id
-    )
-    blocks = blocks_response.get("results", [])
+  markdown = format == "markdown"
+  separator = "\n\n" if markdown else "\n"
 
-    content_parts = []
+  try:
+    buf = io.StringIO()
+    first = True
 
-    for block in blocks:
+    async for block in _iter_all_blocks(notion_client, page_id):
       block_type = block.get("type")
-      block_content = block.get(block_type, {})
-
-      # Handle rich_text blocks
-      if "rich_text" in block_content:
-        for text_obj in block_content["rich_text"]:
-          if "text" in text_obj:
-            text = text_obj["text"]["content"]
-
-            # Format based on block type if markdown requested
-            if format == "markdown":
-              if block_type == "heading_1":
-                text = f"# {text}"
-              elif block_type == "heading_2":
-                text = f"## {text}"
-              elif block_type == "heading_3":
-                text = f"### {text}"
-              elif block_type == "bulleted_list_item":
-                text = f"- {text}"
-              elif block_type == "numbered_list_item":
-                text = f"1. {text}"
-
-            content_parts.append(text)
-
-    separator = "\n" if format == "text" else "\n\n"
-    return separator.join(content_parts)
+      rich_text = (block.get(block_type) or _EMPTY).get("rich_text")
+      if not rich_text:
+        continue
+
+      text = "".join(span.get("plain_text", "") for span in rich_text)
+      if not text:
+        continue
+
+      if not first:
+        buf.write(separator)
+      first = False
+
+      if markdown:
+        buf.write(_MARKDOWN_PREFIXES.get(block_type, ""))
+      buf.write(text)
+
+    return buf.getvalue()
 
   except Exception as e:
     logger.error(f"❌ Failed to extract page content: {e}")
-    return ""
+    raise
 
 
 async def find_title_property(
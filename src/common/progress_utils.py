@@ -1,10 +1,15 @@
 """진행 상태 업데이트 관련 유틸리티"""
 
+import asyncio
 import logging
-from typing import Callable, Optional
+import time
+from typing import Any, Awaitable, Callable, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# 이 단어가 포함된 상태는 기다리지 않고 바로 전송
+_TERMINAL_KEYWORDS = ("완료", "실패")
+
 
 async def safe_progress_update(
     progress_callback: Optional[Callable[[str], None]],
@@ -52,3 +57,135 @@ def create_progress_updater(
     await safe_progress_update(progress_callback, status)
 
   return update_progress
+
+
+class DebouncedProgress:
+  """
+  진행 상태 콜백을 최소 간격(min_interval)마다 한 번만 전송하는 래퍼
+
+  Slack 은 채널당 초당 1회 정도의 쓰기만 허용하므로(초과 시 429 + Retry-After)
+  기본 간격을 1초로 둡니다. chat.update 는 Tier 3 (분당 약 50회) 이므로 작업이 길어져
+  전송이 backoff_every 회 쌓일 때마다 간격을 두 배로 늘립니다 (최대 max_interval).
+
+  짧은 시간에 여러 상태가 들어오면 마지막 상태만 전송합니다.
+  "완료"/"실패"가 포함된 상태는 간격을 기다리지 않고 바로 전송합니다. 직전에 전송한 것과
+  같은 상태는 다시 전송하지 않습니다.
+
+  전송은 백그라운드 태스크로 진행되어 호출 측(AI/Notion 작업)은 Slack 응답을 기다리지
+  않습니다. 전송은 한 번에 하나씩 순서대로 진행되며, 콜백 에러(429 등)는 로그만 남기고
+  메인 플로우에는 전파하지 않습니다.
+
+  Example:
+      >>> progress = DebouncedProgress(progress_update)
+      >>> await agent.run(progress_callback=progress)
+      >>> await progress.cancel()  # 대기 중인 상태는 버리고 전송 중인 상태는 끝날 때까지 대기
+      >>> await client.chat_update(..., text=success_text)
+  """
+
+  def __init__(
+      self,
+      send: Callable[..., Awaitable[Any]],
+      min_interval: float = 1.0,
+      initial_status: Optional[str] = None,
+      backoff_every: int = 10,
+      max_interval: float = 8.0
+  ):
+    """
+    Args:
+        send: 실제로 상태를 전송하는 비동기 콜백 (예: chat_update 래퍼)
+        min_interval: 전송 사이 최소 간격 (초)
+        initial_status: 초기 메시지에 이미 담아 보낸 상태 (같은 상태로 다시 업데이트하지 않음)
+        backoff_every: 이 횟수만큼 전송할 때마다 간격을 두 배로 늘림
+        max_interval: 늘어난 간격의 상한 (초)
+    """
+    self._send = send
+    self._min_interval = min_interval
+    self._backoff_every = backoff_every
+    self._max_interval = max(max_interval, min_interval)
+    self._sent_count = 0
+    if initial_status is None:
+      self._last_sent = float("-inf")
+      self._last_payload: Optional[Tuple] = None
+    else:
+      self._last_sent = time.monotonic()
+      self._last_payload = (initial_status,)
+    self._pending: Optional[Tuple] = None
+    self._timer: Optional[asyncio.Task] = None
+    self._in_flight: Set[asyncio.Task] = set()
+    self._lock = asyncio.Lock()
+
+  async def __call__(self, status: str, *args) -> None:
+    self._pending = (status, *args)
+
+    if any(keyword in status for keyword in _TERMINAL_KEYWORDS):
+      self._cancel_timer()
+      self._dispatch()
+      return
+
+    if self._timer is not None:
+      # 이미 전송 예약됨 - 예약된 시점에 최신 상태가 전송됨
+      return
+
+    wait = self._last_sent + self._min_interval - time.monotonic()
+    if wait <= 0:
+      self._dispatch()
+    else:
+      self._timer = asyncio.create_task(self._send_later(wait))
+
+  async def _send_later(self, delay: float) -> None:
+    try:
+      await asyncio.sleep(delay)
+    except asyncio.CancelledError:
+      return
+    self._timer = None
+    self._dispatch()
+
+  def _dispatch(self) -> None:
+    """대기 중인 상태를 백그라운드 태스크로 전송 (기다리지 않음)"""
+    payload, self._pending = self._pending, None
+    if payload is None or payload == self._last_payload:
+      return
+
+    self._last_payload = payload
+    self._last_sent = time.monotonic()
+    self._sent_count += 1
+    if self._backoff_every and self._sent_count % self._backoff_every == 0:
+      self._min_interval = min(self._min_interval * 2, self._max_interval)
+    task = asyncio.create_task(self._send_payload(payload))
+    self._in_flight.add(task)
+    task.add_done_callback(self._in_flight.discard)
+
+  async def _send_payload(self, payload: Tuple) -> None:
+    # 전송은 순서대로 하나씩 (나중 상태가 먼저 도착해 덮어써지지 않도록)
+    async with self._lock:
+      try:
+        await self._send(*payload)
+      except Exception as e:
+        logger.warning(f"⚠️ Progress callback failed: {e}")
+
+  def _cancel_timer(self) -> None:
+    if self._timer is not None:
+      self._timer.cancel()
+      self._timer = None
+
+  async def _drain(self) -> None:
+    """전송 중인 상태가 모두 끝날 때까지 대기"""
+    if self._in_flight:
+      await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+  async def flush(self) -> None:
+    """대기 중인 상태가 있으면 즉시 전송하고 전송이 끝날 때까지 대기"""
+    self._cancel_timer()
+    self._dispatch()
+    await self._drain()
+
+  async def cancel(self) -> None:
+    """
+    대기 중인 상태를 전송하지 않고 버립니다 (최종 메시지 전송 직전에 호출).
+
+    이미 전송 중인 상태가 있으면 끝날 때까지 기다려, 진행 메시지가
+    최종 메시지를 덮어쓰지 않도록 합니다.
+    """
+    self._cancel_timer()
+    self._pending = None
+    await self._drain()
@@ -1,9 +1,10 @@
 """AI 프롬프트 로딩 유틸리티"""
 
+import functools
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -11,10 +12,14 @@ logger = logging.getLogger(__name__)
 PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 
 
+@functools.lru_cache(maxsize=32)
 def load_prompt(prompt_name: str, default: str = "") -> str:
   """
   프롬프트 파일을 로드합니다.
 
+  프롬프트 파일은 실행 중 바뀌지 않으므로 (파일명, 기본값)별로 한 번만 읽어
+  캐시합니다. 파일을 수정한 뒤 다시 읽으려면 load_prompt.cache_clear()를 호출하세요.
+
   Args:
       prompt_name: 프롬프트 파일명 (확장자 제외 또는 포함)
                    예: "weekly_report_analysis" 또는 "weekly_report_analysis.txt"
@@ -47,6 +52,48 @@ def load_prompt(prompt_name: str, default: str = "") -> str:
     return default
 
 
+def split_prompt_template(template: str, placeholder: str) -> Tuple[str, str]:
+  """
+  프롬프트 템플릿을 고정 앞부분과 동적 뒷부분으로 나눕니다.
+
+  요청마다 바뀌는 변수(placeholder) 앞의 내용은 매번 동일하므로
+  시스템 프롬프트로 보내 AI 제공자의 프롬프트 캐시를 활용할 수 있습니다.
+
+  Args:
+      template: 프롬프트 템플릿
+      placeholder: 동적 내용이 들어갈 변수 (예: "{weekly_reports}")
+
+  Returns:
+      (고정_앞부분, placeholder를_포함한_뒷부분)
+      placeholder가 없으면 ("", template)
+  """
+  index = template.find(placeholder)
+  if index == -1:
+    return "", template
+  return template[:index].rstrip(), template[index:]
+
+
+def to_format_template(template: str, variables: Iterable[str]) -> str:
+  """
+  프롬프트 템플릿을 str.format_map 용 템플릿으로 변환합니다.
+
+  템플릿 본문에 포함된 중괄호(JSON 예시 등)는 이스케이프하고,
+  지정한 변수 placeholder만 치환 가능한 상태로 남깁니다.
+  한 번 변환해두면 format_map 한 번으로 모든 변수를 치환할 수 있습니다.
+
+  Args:
+      template: 원본 프롬프트 템플릿
+      variables: 치환할 변수명 목록 (예: ["work_logs", "resume_content"])
+
+  Returns:
+      format_map 에 사용할 템플릿
+  """
+  escaped = template.replace("{", "{{").replace("}", "}}")
+  for name in variables:
+    escaped = escaped.replace(f"{{{{{name}}}}}", f"{{{name}}}")
+  return escaped
+
+
 def load_prompt_with_variables(
     prompt_name: str,
     variables: dict,
@@ -0,0 +1,159 @@
+"""AI 응답 캐시
+
+같은 입력(시스템 프롬프트 + 프롬프트 + 제공자)으로 분석을 다시 요청하면
+(일시적 실패 후 재실행, 결과 재생성 등) AI를 다시 호출하지 않고 이전 응답을
+돌려줍니다. 재시작 후에도 유지되도록 diskcache에 저장합니다.
+
+LLM_CACHE=true (또는 1) 일 때만 동작하며, diskcache 패키지가 필요합니다
+(선택 의존성이므로 requirements.txt 에는 없음: pip install diskcache).
+diskcache 는 sqlite/파일 I/O 를 동기로 수행하므로 조회/저장은 스레드에서 실행합니다.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 캐시 저장 위치와 기본 만료 시간 (1일)
+CACHE_DIR = os.getenv("LLM_CACHE_DIR", "./.cache/llm")
+DEFAULT_EXPIRE = 86400
+
+# 캐시 키 버전 - 프롬프트 구성/응답 후처리 방식이 바뀌어 이전 응답을 버려야 할 때 올립니다
+CACHE_VERSION = "1"
+
+# 제공자별 모델 설정 환경 변수 (claude 는 CLI 가 ANTHROPIC_MODEL 을 읽음)
+_MODEL_ENV_VARS = {
+    "gemini": "GEMINI_MODEL",
+    "claude": "ANTHROPIC_MODEL",
+    "ollama": "OLLAMA_MODEL",
+}
+
+_cache = None
+_disabled = False
+
+
+def _is_enabled() -> bool:
+  """LLM_CACHE 환경 변수로 캐시 사용 여부 확인"""
+  return os.getenv("LLM_CACHE", "false").lower() in ("1", "true")
+
+
+def _get_cache():
+  """diskcache.Cache 인스턴스를 지연 생성합니다 (비활성화 시 None)"""
+  global _cache, _disabled
+
+  if _disabled or not _is_enabled():
+    return None
+
+  if _cache is None:
+    try:
+      import diskcache
+    except ImportError:
+      logger.warning("⚠️ LLM_CACHE가 켜져 있지만 diskcache 패키지가 없어 응답 캐시를 사용하지 않습니다: pip install diskcache")
+      _disabled = True
+      return None
+
+    _cache = diskcache.Cache(CACHE_DIR)
+    logger.info(f"✅ AI 응답 캐시 사용: {CACHE_DIR}")
+
+  return _cache
+
+
+def _resolve_models(provider_type: str) -> str:
+  """
+  캐시 키에 포함할 모델 설정을 환경 변수에서 읽습니다.
+
+  기본 제공자가 실패하면 Gemini 가 대신 응답하므로 Gemini 모델 설정도 함께 포함합니다.
+  환경 변수가 없으면 빈 문자열(각 제공자의 기본 모델)로 취급합니다.
+
+  Args:
+      provider_type: 요청한 AI 제공자 타입
+
+  Returns:
+      "제공자=모델" 목록 문자열
+  """
+  types = [(provider_type or "gemini").lower()]
+  if types[0] != "gemini":
+    types.append("gemini")
+  return ",".join(
+      f"{t}={os.getenv(_MODEL_ENV_VARS[t], '')}" for t in types if t in _MODEL_ENV_VARS)
+
+
+def init_response_cache() -> None:
+  """
+  시작 시 캐시를 미리 열어 둡니다.
+
+  LLM_CACHE 가 켜져 있는데 diskcache 가 없으면 첫 분석 요청이 아니라 시작 시점에 경고가 남고,
+  캐시 파일(sqlite) 열기도 요청 처리 중 이벤트 루프에서 일어나지 않습니다.
+  """
+  _get_cache()
+
+
+def make_response_key(provider_type: str, system_prompt: str, prompt: str) -> str:
+  """
+  AI 요청 입력으로 캐시 키를 만듭니다.
+
+  캐시 버전과 현재 설정된 모델도 키에 포함하므로, 모델을 바꾸면 이전 모델의
+  응답을 재사용하지 않습니다.
+
+  Args:
+      provider_type: 요청한 AI 제공자 타입
+      system_prompt: 시스템 프롬프트
+      prompt: 사용자 프롬프트
+
+  Returns:
+      sha256 hex digest
+  """
+  hasher = hashlib.sha256()
+  for part in (CACHE_VERSION, provider_type, _resolve_models(provider_type), system_prompt, prompt):
+    hasher.update(part.encode("utf-8"))
+    hasher.update(b"\x00")
+  return hasher.hexdigest()
+
+
+async def get_cached_response(key: str) -> Optional[Tuple[str, str]]:
+  """
+  캐시된 AI 응답을 조회합니다.
+
+  Args:
+      key: make_response_key 로 만든 키
+
+  Returns:
+      (응답_텍스트, 실제_사용된_제공자) 또는 None
+  """
+  cache = _get_cache()
+  if cache is None:
+    return None
+
+  try:
+    return await asyncio.to_thread(cache.get, key)
+  except Exception as e:
+    logger.warning(f"⚠️ AI 응답 캐시 조회 실패: {e}")
+    return None
+
+
+async def store_response(
+    key: str,
+    text: str,
+    used_provider: str,
+    expire: int = DEFAULT_EXPIRE
+) -> None:
+  """
+  AI 응답을 캐시에 저장합니다.
+
+  Args:
+      key: make_response_key 로 만든 키
+      text: 응답 텍스트
+      used_provider: 실제 사용된 제공자
+      expire: 만료 시간 (초)
+  """
+  cache = _get_cache()
+  if cache is None or not text:
+    return
+
+  try:
+    await asyncio.to_thread(cache.set, key, (text, used_provider), expire=expire)
+  except Exception as e:
+    logger.warning(f"⚠️ AI 응답 캐시 저장 실패: {e}")
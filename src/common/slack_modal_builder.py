@@ -1,12 +1,46 @@
 """Slack 모달 생성 유틸리티"""
 
-import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
-import pytz
+import orjson
 
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
+
+# (만료 시각 epoch, 오늘 기준 기본값) - 다음 자정(KST)까지 재사용
+_today_defaults_cache: Optional[Tuple[float, Dict]] = None
+
+
+def _today_defaults() -> Dict:
+  """
+  오늘(KST) 기준 모달 기본값을 반환합니다.
+
+  날짜 기본값은 하루에 한 번만 바뀌므로 다음 자정까지 캐시하여
+  슬래시 커맨드마다 현재 시각 계산/포맷을 반복하지 않습니다.
+
+  Returns:
+      today, week_ago (YYYY-MM-DD), year, month, week 키를 가진 딕셔너리 (수정 금지)
+  """
+  global _today_defaults_cache
+  if _today_defaults_cache is None or time.time() >= _today_defaults_cache[0]:
+    now = datetime.now(KST)
+    next_midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    _today_defaults_cache = (next_midnight.timestamp(), {
+      "today": now.strftime("%Y-%m-%d"),
+      "week_ago": (now - timedelta(days=7)).strftime("%Y-%m-%d"),
+      "year": now.year,
+      "month": now.month,
+      "week": now.isocalendar()[1],
+    })
+  return _today_defaults_cache[1]
+
+
+def _private_metadata(channel_id: str, user_id: str) -> str:
+  """모달 private_metadata 직렬화 (Slack 은 문자열만 받으므로 decode)"""
+  return orjson.dumps({"channel_id": channel_id, "user_id": user_id}).decode()
 
 
 def create_ai_provider_select(
@@ -123,12 +157,9 @@ def create_work_log_feedback_modal(
       Modal view dictionary
   """
   if not initial_date:
-    initial_date = datetime.now(KST).strftime("%Y-%m-%d")
+    initial_date = _today_defaults()["today"]
 
-  private_metadata = json.dumps({
-    "channel_id": channel_id,
-    "user_id": user_id
-  })
+  private_metadata = _private_metadata(channel_id, user_id)
 
   return {
     "type": "modal",
@@ -211,21 +242,25 @@ def create_weekly_report_modal(
   Returns:
       Modal view dictionary
   """
-  now = datetime.now(KST)
+  today = _today_defaults()
   if not initial_year:
-    initial_year = now.year
+    initial_year = today["year"]
   if not initial_week:
-    initial_week = now.isocalendar()[1]
+    initial_week = today["week"]
 
-  private_metadata = json.dumps({
-    "channel_id": channel_id,
-    "user_id": user_id
-  })
+  # 연도/주차별 템플릿은 캐시하고 요청마다 바뀌는 private_metadata 만 덧붙임
+  return {
+    **_weekly_report_template(initial_year, initial_week),
+    "private_metadata": _private_metadata(channel_id, user_id),
+  }
 
+
+@lru_cache(maxsize=64)
+def _weekly_report_template(initial_year: int, initial_week: int) -> Dict:
+  """주간 리포트 모달 템플릿 (private_metadata 제외, 캐시되므로 수정 금지)"""
   return {
     "type": "modal",
     "callback_id": "weekly_report_modal",
-    "private_metadata": private_metadata,
     "title": {
       "type": "plain_text",
       "text": "주간 리포트 생성"
@@ -321,21 +356,25 @@ def create_monthly_report_modal(
   Returns:
       Modal view dictionary
   """
-  now = datetime.now(KST)
+  today = _today_defaults()
   if not initial_year:
-    initial_year = now.year
+    initial_year = today["year"]
   if not initial_month:
-    initial_month = now.month
+    initial_month = today["month"]
+
+  # 연도/월별 템플릿은 캐시하고 요청마다 바뀌는 private_metadata 만 덧붙임
+  return {
+    **_monthly_report_template(initial_year, initial_month),
+    "private_metadata": _private_metadata(channel_id, user_id),
+  }
 
-  private_metadata = json.dumps({
-    "channel_id": channel_id,
-    "user_id": user_id
-  })
 
+@lru_cache(maxsize=64)
+def _monthly_report_template(initial_year: int, initial_month: int) -> Dict:
+  """월간 리포트 모달 템플릿 (private_metadata 제외, 캐시되므로 수정 금지)"""
   return {
     "type": "modal",
     "callback_id": "monthly_report_modal",
-    "private_metadata": private_metadata,
     "title": {
       "type": "plain_text",
       "text": "월간 리포트 생성"
@@ -431,18 +470,13 @@ def create_achievement_analysis_modal(
   Returns:
       Modal view dictionary
   """
-  from datetime import timedelta
-
-  now = datetime.now(KST)
+  today = _today_defaults()
   if not initial_start_date:
-    initial_start_date = (now - timedelta(days=7)).strftime("%Y-%m-%d")
+    initial_start_date = today["week_ago"]
   if not initial_end_date:
-    initial_end_date = now.strftime("%Y-%m-%d")
+    initial_end_date = today["today"]
 
-  private_metadata = json.dumps({
-    "channel_id": channel_id,
-    "user_id": user_id
-  })
+  private_metadata = _private_metadata(channel_id, user_id)
 
   return {
     "type": "modal",
@@ -1,60 +1,232 @@
 """Slack 메시지 포맷터 & 라벨 유틸리티"""
 
-from typing import Optional
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional
 
+from slack_sdk.errors import SlackApiError
 
-def flavor_emoji(flavor: str) -> str:
-  mapping = {
-    "spicy": "🔥",
-    "normal": "🌶️",
-    "mild": "🍀",
+logger = logging.getLogger(__name__)
+
+# 잠시 후 다시 시도하면 성공할 수 있는 Slack API 에러
+_RETRYABLE_SLACK_ERRORS = frozenset({
+  "ratelimited",
+  "internal_error",
+  "service_unavailable",
+  "request_timeout",
+})
+
+
+# 피드백 맛별 이모지 / 라벨 (호출마다 dict 를 새로 만들지 않도록 모듈 상수로 유지)
+_FLAVOR_EMOJIS = {
+  "spicy": "🔥",
+  "normal": "🌶️",
+  "mild": "🍀",
+}
+_FLAVOR_LABELS = {
+  "spicy": "매운맛",
+  "normal": "보통맛",
+  "mild": "순한맛",
+}
+
+
+# 아침 기상 메시지 (/기상테스트 와 스케줄러가 공유, 요청마다 새로 만들지 않음 - 수정 금지)
+MORNING_MESSAGE_TEXT = "좋은 아침이에요! 오늘도 화이팅! 💪"
+MORNING_MESSAGE_BLOCKS = [
+  {
+    "type": "section",
+    "text": {
+      "type": "mrkdwn",
+      "text": MORNING_MESSAGE_TEXT
+    }
+  },
+  {
+    "type": "actions",
+    "elements": [
+      {
+        "type": "button",
+        "text": {
+          "type": "plain_text",
+          "text": "기상 완료"
+        },
+        "action_id": "wake_up_complete",
+        "style": "primary"
+      }
+    ]
   }
-  return mapping.get(flavor, "🌶️")
+]
+
+
+def flavor_emoji(flavor: str) -> str:
+  return _FLAVOR_EMOJIS.get(flavor, "🌶️")
 
 
 def flavor_label(flavor: str) -> str:
-  mapping = {
-    "spicy": "매운맛",
-    "normal": "보통맛",
-    "mild": "순한맛",
-  }
-  return mapping.get(flavor, flavor)
+  return _FLAVOR_LABELS.get(flavor, flavor)
 
 
-def get_used_ai_label(work_log_mgr: Optional[object], requested: str) -> str:
-  """WorkLogManager의 실제 사용된 AI 제공자를 대문자 라벨로 반환"""
-  used = (getattr(work_log_mgr, "last_used_ai_provider", None) or requested or "").upper()
-  return used
+@functools.lru_cache(maxsize=16)
+def build_flavor_line(flavor: str) -> str:
+  """피드백 맛 표시 줄 (맛 종류가 몇 개 안 되므로 결과를 캐시)"""
+  return f"{flavor_emoji(flavor)} 피드백: {flavor_label(flavor)}"
 
 
-def build_initial_text(user_mention: str, date: str, ai_label: str, flavor_line: str) -> str:
-  """초기 안내 메시지 포맷"""
-  return (
-    f"🚀 {user_mention}업무일지 AI 피드백 생성을 시작합니다.\n\n"
-    f"📅 날짜: {date}\n"
-    f"🤖 AI: {ai_label}\n"
-    f"{flavor_line}\n\n"
-    f"⏳ 처리 중..."
-  )
+def ai_label(provider: str) -> str:
+  """AI 제공자 이름을 대문자 라벨로 변환"""
+  return provider.upper()
 
 
-def build_progress_text(user_mention: str, date: str, ai_label: str, flavor_line: str, status: str) -> str:
-  """진행 메시지 포맷"""
+def get_used_ai_label(work_log_mgr: Optional[object], requested: str) -> str:
+  """매니저(WorkLogManager 등)가 실제 사용한 AI 제공자를 대문자 라벨로 반환"""
+  return ai_label(getattr(work_log_mgr, "last_used_ai_provider", None) or requested or "")
+
+
+def build_progress_prefix(user_mention: str, date: str, ai_label: str, flavor_line: str) -> str:
+  """진행 메시지에서 상태 줄을 뺀 고정 부분 (진행 중에는 한 번만 만들어 재사용)"""
   return (
     f"🚀 {user_mention}업무일지 AI 피드백 생성 중...\n\n"
     f"📅 날짜: {date}\n"
     f"🤖 AI: {ai_label}\n"
     f"{flavor_line}\n\n"
-    f"{status}"
   )
 
 
-def split_text_for_slack(text: str, max_len: int = 3500) -> list[str]:
+def make_progress_text_builder(user_mention: str, date: str, flavor_line: str) -> Callable[[str, str], str]:
+  """
+  한 요청 동안 재사용할 진행 메시지 빌더를 만듭니다.
+
+  날짜/멘션/피드백 맛 줄은 요청 동안 바뀌지 않으므로 고정 부분은 AI 제공자별로
+  한 번만 만들고, 호출할 때는 상태 줄만 이어붙입니다. AI 라벨(대문자)도 제공자가
+  처음 바뀔 때만 만들어지므로 호출 측은 제공자 이름을 그대로 넘기면 됩니다.
+
+  Args:
+      user_mention: "<@U..>님의 " 형태의 멘션 (없으면 빈 문자열)
+      date: 업무일지 날짜
+      flavor_line: 피드백 맛 표시 줄
+
+  Returns:
+      (provider, status) -> 진행 메시지 텍스트
+
+  Example:
+      >>> build = make_progress_text_builder(mention, date, flavor_line)
+      >>> build(work_log_mgr.last_used_ai_provider or ai_provider, status)
+  """
+  prefixes: Dict[str, str] = {}
+
+  def build(provider: str, status: str) -> str:
+    prefix = prefixes.get(provider)
+    if prefix is None:
+      prefix = prefixes[provider] = build_progress_prefix(
+          user_mention, date, ai_label(provider or ""), flavor_line)
+    return prefix + status
+
+  return build
+
+
+def make_header_progress_builder(header: str) -> Callable[[str, str], str]:
+  """
+  고정 헤더 + AI 라벨 + 상태 줄 형태의 진행 메시지 빌더를 만듭니다 (주간/성과 분석용).
+
+  Args:
+      header: 요청 동안 바뀌지 않는 앞부분 (멘션, 기간 등)
+
+  Returns:
+      (provider, status) -> 진행 메시지 텍스트
+  """
+  prefixes: Dict[str, str] = {}
+
+  def build(provider: str, status: str) -> str:
+    prefix = prefixes.get(provider)
+    if prefix is None:
+      prefix = prefixes[provider] = f"{header}🤖 AI: {ai_label(provider or '')}\n⏳ "
+    return prefix + status
+
+  return build
+
+
+# Slack 메시지 text 최대 길이 (이보다 길면 Slack 이 잘라냄). 여유를 두고 사용
+SLACK_MESSAGE_TEXT_LIMIT = 39000
+
+
+def split_text_for_slack(text: str, max_len: int = 3500) -> Iterator[str]:
   """Slack 스레드에 긴 텍스트를 안전하게 분할 (기본 3500자)
 
   - 블록 텍스트 제한(3000)보다 넉넉히 여유를 둔 3500자 사용
-  - 메시지 텍스트로 전송하므로 여유분 포함
+  - 메시지 text 로만 보내는 경우 max_len=SLACK_MESSAGE_TEXT_LIMIT 로 한 메시지에 담을 수 있음
+  - 전송하면서 한 청크씩 만들도록 제너레이터로 반환 (개수가 필요하면 list() 로 감싸기)
+  """
+  for i in range(0, len(text or ""), max_len):
+    yield text[i:i + max_len]
+
+
+async def post_thread_chunks(
+    client,
+    channel: str,
+    thread_ts: str,
+    text: str,
+    max_len: int = SLACK_MESSAGE_TEXT_LIMIT
+) -> None:
+  """
+  긴 텍스트를 나눠 스레드에 순서대로 게시합니다.
+
+  스레드 답글은 도착 순서대로 표시되므로 청크는 하나씩 차례로 보냅니다
+  (기본 길이 제한에서는 대부분 메시지 하나에 담김).
+
+  Args:
+      client: Slack AsyncWebClient
+      channel: 채널 ID
+      thread_ts: 스레드 부모 메시지 ts
+      text: 게시할 텍스트
+      max_len: 청크 최대 길이
+  """
+  for chunk in split_text_for_slack(text, max_len=max_len):
+    await client.chat_postMessage(channel=channel, thread_ts=thread_ts, text=chunk)
+
+
+def _retry_delay(error: SlackApiError, attempt: int) -> Optional[float]:
+  """재시도 가능한 에러면 대기 시간(초), 아니면 None"""
+  response = error.response
+  status_code = getattr(response, "status_code", None) or 0
+  if response.get("error") not in _RETRYABLE_SLACK_ERRORS and status_code != 429 and status_code < 500:
+    return None
+
+  retry_after = (getattr(response, "headers", None) or {}).get("Retry-After")
+  try:
+    return float(retry_after)
+  except (TypeError, ValueError):
+    return 0.5 * (2 ** attempt)
+
+
+async def slack_call_with_retry(
+    call: Callable[[], Awaitable[Any]],
+    max_attempts: int = 3
+) -> Any:
+  """
+  Slack API 호출을 일시적 에러(429 / 5xx)에 한해 재시도합니다.
+
+  Retry-After 헤더가 있으면 그만큼, 없으면 지수 백오프(0.5s, 1s, ...)로 기다립니다.
+  권한/채널 오류 같은 영구적인 에러는 바로 다시 발생시킵니다.
+
+  Args:
+      call: 호출할 때마다 새 코루틴을 만드는 함수 (예: lambda: client.chat_update(...))
+      max_attempts: 최대 시도 횟수
+
+  Returns:
+      Slack API 응답
+
+  Example:
+      >>> await slack_call_with_retry(
+      ...     lambda: client.chat_update(channel=channel_id, ts=ts, text=text))
   """
-  if not text:
-    return []
-  return [text[i:i + max_len] for i in range(0, len(text), max_len)]
+  for attempt in range(max_attempts):
+    try:
+      return await call()
+    except SlackApiError as e:
+      delay = _retry_delay(e, attempt)
+      if delay is None or attempt == max_attempts - 1:
+        raise
+      logger.warning(
+          f"⚠️ Slack API 일시적 오류, {delay:.1f}초 후 재시도 ({attempt + 1}/{max_attempts}): "
+          f"{e.response.get('error')}")
+      await asyncio.sleep(delay)
@@ -27,15 +27,17 @@ def truncate_text(
       >>> truncate_text("긴 텍스트", 50, show_total=True)
       "긴 텍스트 (총 10자)"
   """
-  if len(text) <= max_length:
+  total = len(text)
+  if total <= max_length:
+    # 자를 필요가 없으면 원문을 그대로 사용 (복사 없음)
     if show_total:
-      return f"{text} (총 {len(text)}자)"
+      return f"{text} (총 {total}자)"
     return text
 
   truncated = text[:max_length]
 
   if show_total:
-    return f"{truncated}{suffix}\n\n(총 {len(text)}자)\n"
+    return f"{truncated}{suffix}\n\n(총 {total}자)\n"
 
   return f"{truncated}{suffix}"
 
@@ -13,6 +13,15 @@ logger = logging.getLogger(__name__)
 # 재무관리 채널 ID
 FINANCE_CHANNEL_ID = os.getenv("SLACK_FINANCE_CHANNEL_ID", "C0A31MH0EHM")
 
+# 봇 멘션 (<@U...>) 패턴
+_MENTION_RE = re.compile(r'<@[A-Z0-9]+>')
+# 금액(숫자) 포함 여부
+_DIGIT_RE = re.compile(r'\d')
+# 키워드 메시지 접두어 (정규식 대신 str.startswith 로 확인)
+_FINANCE_KEYWORDS = ("지출", "수입", "소비", "결제", "구매", "쇼핑")
+# 키워드 리스너가 받는 메시지 이벤트 (app.message 와 같은 subtype, bot_message 는 무시하므로 제외)
+_FINANCE_MESSAGE_EVENT = {"type": "message", "subtype": (None, "file_share", "thread_broadcast")}
+
 # 전역 분석기 인스턴스
 _finance_analyzer = None
 
@@ -25,6 +34,13 @@ def get_finance_analyzer() -> FinanceAnalyzer:
     return _finance_analyzer
 
 
+async def _match_finance_keyword(event) -> bool:
+    """재무관리 채널의 사람이 보낸 키워드 메시지인지 확인 (채널, 접두어 순으로 빠르게 거름)"""
+    if event.get("channel") != FINANCE_CHANNEL_ID or event.get("bot_id"):
+        return False
+    return (event.get("text") or "").startswith(_FINANCE_KEYWORDS)
+
+
 def register_finance_handlers(app):
     """재무관리 핸들러 등록"""
 
@@ -42,7 +58,7 @@ def register_finance_handlers(app):
         thread_ts = event.get("thread_ts") or event.get("ts")
 
         # 봇 멘션 제거
-        text = re.sub(r'<@[A-Z0-9]+>', '', text).strip()
+        text = _MENTION_RE.sub('', text).strip()
 
         if not text:
             # 빈 멘션이면 현재 상태 표시
@@ -71,7 +87,7 @@ def register_finance_handlers(app):
 
             # 긴 응답은 스레드에 분할 전송
             if len(response) > 3000:
-                chunks = split_text_for_slack(response)
+                chunks = list(split_text_for_slack(response))
                 for i, chunk in enumerate(chunks[1:], 1):  # 첫 번째는 이미 전송됨
                     await client.chat_postMessage(
                         channel=channel_id,
@@ -214,19 +230,13 @@ def register_finance_handlers(app):
             )
 
     # 재무관리 채널 메시지 리스너 (봇 멘션 없이도 특정 패턴 감지)
-    @app.message(re.compile(r'^(지출|수입|소비|결제|구매|쇼핑)'))
+    # app.message(pattern)는 모든 채널의 메시지에 정규식을 실행하므로, 채널/봇 여부를 먼저 확인하고
+    # 접두어는 str.startswith 로 확인하는 matcher로 등록
+    @app.event(_FINANCE_MESSAGE_EVENT, matchers=[_match_finance_keyword])
     async def handle_finance_keywords(message, say, client, logger):
         """재무 관련 키워드 감지 (재무관리 채널에서만)"""
         channel_id = message.get("channel")
 
-        # 재무관리 채널에서만 처리
-        if channel_id != FINANCE_CHANNEL_ID:
-            return
-
-        # 봇 자신의 메시지는 무시
-        if message.get("bot_id"):
-            return
-
         text = message.get("text", "")
         user_id = message.get("user")
         thread_ts = message.get("thread_ts") or message.get("ts")
@@ -234,7 +244,7 @@ def register_finance_handlers(app):
         logger.info(f"📊 Finance keyword detected from {user_id}: {text}")
 
         # 금액이 포함된 경우에만 처리
-        if not re.search(r'\d+', text):
+        if not _DIGIT_RE.search(text):
             return
 
         try:
@@ -4,20 +4,22 @@ import json
 import logging
 from datetime import datetime
 from typing import Dict, List, Optional, Callable
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from .client import NotionClient
 from .. import ai
 from ..common.prompt_utils import load_prompt
 from ..common.notion_utils import extract_page_content
-from ..common.singleton import SimpleSingleton
+from ..common.singleton import singleton_getter
 from ..analyzers.achievement_extractor import get_achievement_extractor
 
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
+
+# 속성 조회용 공유 빈 dict (조회마다 {} 를 새로 만들지 않음, 수정 금지)
+_EMPTY: Dict = {}
 
 
 class AchievementAgent:
@@ -307,13 +309,13 @@ class AchievementAgent:
     page = await self.get_work_log_by_page_id(page_id)
 
     # 페이지 속성에서 정보 추출
-    properties = page.get("properties", {})
-    title_prop = properties.get("title") or properties.get("Title") or properties.get("제목", {})
+    properties = page.get("properties") or _EMPTY
+    title_prop = properties.get("title") or properties.get("Title") or properties.get("제목") or _EMPTY
     title = ""
     if title_prop.get("title"):
-      title = "".join([t.get("plain_text", "") for t in title_prop["title"]])
+      title = "".join(t.get("plain_text", "") for t in title_prop["title"])
 
-    date_prop = properties.get("작성일", {})
+    date_prop = properties.get("작성일") or _EMPTY
     date = ""
     if date_prop.get("date"):
       date = date_prop["date"].get("start", "")
@@ -468,13 +470,14 @@ class AchievementAgent:
     }
 
 
-# Singleton instance
-_singleton = SimpleSingleton(AchievementAgent, param_name="ai_provider_type")
+# Singleton instance per AI provider
+# (제공자를 번갈아 요청해도 매번 새로 만들지 않도록 제공자별로 유지)
+_get_instance = singleton_getter(AchievementAgent, key_param="ai_provider_type")
 
 
 def get_achievement_agent(ai_provider_type: str = "claude") -> AchievementAgent:
   """
-  Get or create singleton AchievementAgent instance
+  Get or create singleton AchievementAgent instance for the AI provider
 
   Args:
       ai_provider_type: AI provider type (gemini, claude, ollama)
@@ -482,4 +485,4 @@ def get_achievement_agent(ai_provider_type: str = "claude") -> AchievementAgent:
   Returns:
       AchievementAgent instance
   """
-  return _singleton.get(ai_provider_type=ai_provider_type)
+  return _get_instance(ai_provider_type=ai_provider_type)
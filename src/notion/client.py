@@ -4,11 +4,29 @@ import logging
 import os
 from typing import Any, Dict, List, Optional
 
+import httpx
+import orjson
 from notion_client import AsyncClient
 
 logger = logging.getLogger(__name__)
 
 
+class _OrjsonAsyncClient(AsyncClient):
+  """응답 JSON 디코딩에 orjson을 사용하는 notion_client AsyncClient
+
+  블록/페이지 응답은 rich_text 배열이 많아 크기가 크므로 디코딩 비용이 큽니다.
+  공개 API(dict 반환)는 그대로 유지하고 성공 응답의 파싱만 교체합니다.
+  (비공개 메서드 오버라이드이므로 requirements.txt 에서 notion-client 버전을 고정,
+   업그레이드 시 BaseClient._parse_response 시그니처/동작을 다시 확인)
+  """
+
+  def _parse_response(self, response: httpx.Response) -> Any:
+    if response.is_success:
+      return orjson.loads(response.content)
+    # 에러 응답은 라이브러리의 예외 변환 로직을 그대로 사용
+    return super()._parse_response(response)
+
+
 class NotionClient:
   """Notion 비동기 클라이언트 래퍼"""
 
@@ -18,7 +36,7 @@ class NotionClient:
     if not self.api_key:
       raise ValueError("NOTION_API_KEY 환경 변수가 설정되지 않았습니다")
 
-    self.client = AsyncClient(auth=self.api_key)
+    self.client = _OrjsonAsyncClient(auth=self.api_key)
 
     # 데이터베이스 ID (기본값, 유저별로 오버라이드 가능)
     self.wake_up_database_id = os.getenv("NOTION_WAKE_UP_DATABASE_ID")
@@ -56,7 +74,6 @@ class NotionClient:
         request_body["sorts"] = sorts
 
       # Use the correct API: POST /v1/databases/{database_id}/query
-      import httpx
       headers = {
         "Authorization": f"Bearer {self.api_key}",
         "Notion-Version": "2022-06-28",
@@ -71,7 +88,7 @@ class NotionClient:
             timeout=30.0
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
       results = data.get("results", [])
       logger.info(f"📊 데이터베이스 조회 완료: {len(results)}개 결과")
@@ -8,7 +8,7 @@ from .db_schema import get_monthly_report_schema
 from ..analyzers.monthly_analyzer import MonthlyAnalyzer
 from ..common.notion_blocks import build_ai_feedback_blocks, append_blocks_batched
 from ..common.types import ReportProcessResult
-from ..common.singleton import SimpleSingleton
+from ..common.singleton import singleton_getter
 
 logger = logging.getLogger(__name__)
 
@@ -205,13 +205,14 @@ class MonthlyReportManager:
       logger.error(f"❌ 월간 리포트 생성 실패: {e}")
       raise
 
-# Singleton instance
-_singleton = SimpleSingleton(MonthlyReportManager, param_name="ai_provider_type")
+# Singleton instance per AI provider
+# (제공자를 번갈아 요청해도 매번 새로 만들지 않도록 제공자별로 유지)
+_get_instance = singleton_getter(MonthlyReportManager, key_param="ai_provider_type")
 
 
 def get_monthly_report_manager(ai_provider_type: str = "claude") -> MonthlyReportManager:
   """
-  Get or create singleton MonthlyReportManager instance
+  Get or create singleton MonthlyReportManager instance for the AI provider
 
   Args:
       ai_provider_type: AI provider type (gemini, claude, ollama)
@@ -219,4 +220,4 @@ def get_monthly_report_manager(ai_provider_type: str = "claude") -> MonthlyRepor
   Returns:
       MonthlyReportManager instance
   """
-  return _singleton.get(ai_provider_type=ai_provider_type)
\ No newline at end of file
+  return _get_instance(ai_provider_type=ai_provider_type)
\ No newline at end of file
@@ -1,18 +1,37 @@
 """기상 관리 Notion 매니저"""
 
+import asyncio
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Optional
-
-import pytz
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
 
 from .client import NotionClient
 
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
+
+# 기상 기록 개수 캐시 TTL (초) - 이 시간 동안은 조회 없이 기록할 때마다 1씩 증가
+_COUNT_CACHE_TTL = 600
+# 캐시가 없을 때, 조회 중 같은 사용자의 새 기록이 들어오면 다시 조회하는 최대 횟수
+_COUNT_QUERY_ATTEMPTS = 3
+
+# 쓰기 큐에서 한 번에 꺼내 저장하는 최대 기록 수
+_RECORD_BATCH_SIZE = 50
+# 배치 안에서 동시에 보내는 Notion 쓰기 수 (Notion API 는 평균 초당 3회 제한, 일괄 생성 API 없음)
+_RECORD_CONCURRENCY = 3
+
+# 앱 종료 시 쓰기 큐에 남은 기록 저장을 기다리는 최대 시간 (초)
+_DRAIN_TIMEOUT = 10.0
+
+# 저장 실패 시 호출할 비동기 콜백 (예: 사용자에게 실패 안내)
+WakeUpErrorCallback = Callable[[Exception], Awaitable[None]]
+# 쓰기 큐 항목: (user_id, user_name, wake_up_time, on_error)
+WakeUpRecord = Tuple[str, Optional[str], Optional[datetime], Optional[WakeUpErrorCallback]]
 
 
 class WakeUpManager:
@@ -27,6 +46,44 @@ class WakeUpManager:
       raise ValueError(
           "NOTION_WAKE_UP_DATABASE_ID environment variable is required")
 
+    # user_id -> (기록 개수, 조회 시각)
+    self._count_cache: Dict[str, Tuple[int, float]] = {}
+    # user_id -> 큐에 들어갔지만 아직 저장되지 않은 기록 수
+    self._pending_counts: Dict[str, int] = {}
+    # user_id -> 대기 중인 기록이 모두 저장(또는 실패)되면 set 되는 이벤트
+    self._pending_done: Dict[str, asyncio.Event] = {}
+    # user_id -> 지금까지 큐에 넣은 기록 수 (조회 중 새 기록이 들어왔는지 확인용)
+    self._enqueued_counts: Dict[str, int] = {}
+    self._record_queue: Optional[asyncio.Queue] = None
+    self._flusher: Optional[asyncio.Task] = None
+
+  def _cached_count(self, user_id: str) -> Optional[int]:
+    """TTL 내의 캐시된 기록 개수 (없거나 만료되면 None)"""
+    entry = self._count_cache.get(user_id)
+    if entry and time.monotonic() - entry[1] < _COUNT_CACHE_TTL:
+      return entry[0]
+    return None
+
+  def _release_pending(self, user_id: str) -> None:
+    """저장이 끝난(성공/실패) 기록을 대기 개수에서 제외"""
+    remaining = self._pending_counts.get(user_id, 0) - 1
+    if remaining > 0:
+      self._pending_counts[user_id] = remaining
+      return
+
+    self._pending_counts.pop(user_id, None)
+    pending_done = self._pending_done.pop(user_id, None)
+    if pending_done is not None:
+      pending_done.set()
+
+  async def _wait_for_pending(self, user_id: str) -> None:
+    """사용자의 대기 중인 기록이 모두 저장(또는 실패)될 때까지 대기"""
+    while True:
+      pending_done = self._pending_done.get(user_id)
+      if pending_done is None:
+        return
+      await pending_done.wait()
+
   async def get_database_schema(self) -> dict:
     """
     Get wake-up database schema for debugging
@@ -56,12 +113,20 @@ class WakeUpManager:
     """
     특정 사용자의 기상 기록 개수 조회
 
+    큐에 들어갔지만 아직 저장되지 않은 기록도 포함합니다.
+    캐시가 없으면 저장 중인 기록이 조회 결과에 들어갈지 알 수 없으므로,
+    사용자의 대기 중인 기록이 모두 저장된 뒤에 조회합니다.
+
     Args:
       user_id: Slack user ID
 
     Returns:
       int: 기상 기록 개수
     """
+    cached = self._cached_count(user_id)
+    if cached is not None:
+      return cached + self._pending_counts.get(user_id, 0)
+
     try:
       filter_params = {
         "property": "사용자 아이디",
@@ -69,16 +134,28 @@ class WakeUpManager:
           "equals": user_id
         }
       }
-      results = await self.client.query_database(
-          database_id=self.database_id,
-          filter_params=filter_params
-      )
-      count = len(results)
+      count: Optional[int] = None
+      for _ in range(_COUNT_QUERY_ATTEMPTS):
+        await self._wait_for_pending(user_id)
+        enqueued = self._enqueued_counts.get(user_id, 0)
+        results = await self.client.query_database(
+            database_id=self.database_id,
+            filter_params=filter_params
+        )
+        if self._enqueued_counts.get(user_id, 0) == enqueued:
+          # 조회하는 동안 새 기록이 없었으므로 모든 기록이 결과에 반영됨
+          count = len(results)
+          self._count_cache[user_id] = (count, time.monotonic())
+          break
+
+      if count is None:
+        # 조회 중에 계속 새 기록이 들어옴 - 캐시하지 않고 근사값 반환
+        count = len(results)
       logger.info(f"📊 {user_id}의 기상 기록: {count}개")
-      return count
+      return count + self._pending_counts.get(user_id, 0)
     except Exception as e:
       logger.error(f"❌ Failed to get wake-up count: {e}")
-      return 0
+      return self._pending_counts.get(user_id, 0)
 
   async def record_wake_up(
       self,
@@ -99,12 +176,20 @@ class WakeUpManager:
     """
     # First, get and log the database schema
     await self.get_database_schema()
+    return await self._create_record(user_id, user_name, wake_up_time)
 
+  async def _create_record(
+      self,
+      user_id: str,
+      user_name: Optional[str],
+      wake_up_time: Optional[datetime],
+  ) -> dict:
+    """기상 기록 페이지 생성 (스키마 조회 없음)"""
     if wake_up_time is None:
       wake_up_time = datetime.now(KST)
     elif wake_up_time.tzinfo is None:
       # If no timezone info, assume it's KST
-      wake_up_time = KST.localize(wake_up_time)
+      wake_up_time = wake_up_time.replace(tzinfo=KST)
 
     # Match the actual Notion DB schema (Korean field names)
     properties = {
@@ -121,11 +206,106 @@ class WakeUpManager:
     try:
       page = await self.client.create_page(self.database_id, properties)
       logger.info(f"✅ Wake-up recorded for user {user_id} at {wake_up_time}")
+
+      # 캐시된 개수가 있으면 다시 조회하지 않고 1 증가 (조회 시각은 유지하여 TTL 후 재동기화)
+      cached = self._cached_count(user_id)
+      if cached is not None:
+        self._count_cache[user_id] = (cached + 1, self._count_cache[user_id][1])
       return page
     except Exception as e:
       logger.error(f"❌ Failed to record wake-up: {e}")
       raise
 
+  def enqueue_wake_up(
+      self,
+      user_id: str,
+      user_name: Optional[str] = None,
+      wake_up_time: Optional[datetime] = None,
+      on_error: Optional[WakeUpErrorCallback] = None,
+  ) -> None:
+    """
+    기상 기록을 쓰기 큐에 넣고 바로 반환합니다.
+
+    Notion 저장은 백그라운드 flusher 태스크가 모아서 처리하므로, 버튼 응답이
+    Notion 왕복을 기다리지 않습니다. 저장 전에도 get_wake_up_count 에는 포함됩니다.
+    실행 중인 이벤트 루프 안에서 호출해야 합니다.
+
+    Args:
+      user_id: Slack user ID
+      user_name: Slack user display name (optional)
+      wake_up_time: Wake-up timestamp (defaults to now)
+      on_error: 저장 실패 시 예외와 함께 호출할 비동기 콜백 (optional)
+    """
+    if wake_up_time is None:
+      wake_up_time = datetime.now(KST)
+
+    if self._record_queue is None:
+      self._record_queue = asyncio.Queue()
+    if self._flusher is None or self._flusher.done():
+      self._flusher = asyncio.create_task(self._flush_records())
+
+    pending = self._pending_counts.get(user_id, 0)
+    if pending == 0:
+      self._pending_done[user_id] = asyncio.Event()
+    self._pending_counts[user_id] = pending + 1
+    self._enqueued_counts[user_id] = self._enqueued_counts.get(user_id, 0) + 1
+    self._record_queue.put_nowait((user_id, user_name, wake_up_time, on_error))
+
+  async def _flush_records(self) -> None:
+    """쓰기 큐의 기록을 최대 _RECORD_BATCH_SIZE 개씩 꺼내 저장 (단일 소비자)"""
+    queue = self._record_queue
+    while True:
+      batch: List[WakeUpRecord] = [await queue.get()]
+      while not queue.empty() and len(batch) < _RECORD_BATCH_SIZE:
+        batch.append(queue.get_nowait())
+      try:
+        await self._write_batch(batch)
+      finally:
+        for _ in batch:
+          queue.task_done()
+
+  async def _write_batch(self, batch: List[WakeUpRecord]) -> None:
+    """배치의 기록을 동시 요청 수를 제한해 저장 (실패한 기록은 on_error 콜백으로 알림)"""
+    semaphore = asyncio.Semaphore(_RECORD_CONCURRENCY)
+
+    async def write(record: WakeUpRecord) -> None:
+      user_id, user_name, wake_up_time, on_error = record
+      error: Optional[Exception] = None
+      async with semaphore:
+        try:
+          await self._create_record(user_id, user_name, wake_up_time)
+        except Exception as e:
+          error = e  # _create_record 에서 이미 로그를 남김
+        finally:
+          self._release_pending(user_id)
+
+      if error is not None and on_error is not None:
+        try:
+          await on_error(error)
+        except Exception as callback_error:
+          logger.warning(f"⚠️ 기상 기록 실패 알림 실패: {callback_error}")
+
+    if len(batch) > 1:
+      logger.info(f"📝 기상 기록 {len(batch)}개 일괄 저장")
+    await asyncio.gather(*(write(record) for record in batch))
+
+  async def drain(self, timeout: float = _DRAIN_TIMEOUT) -> None:
+    """
+    쓰기 큐에 남은 기록을 모두 저장한 뒤 flusher 를 종료합니다 (앱 종료 시 호출).
+
+    Args:
+      timeout: 저장을 기다리는 최대 시간 (초)
+    """
+    if self._record_queue is None or self._flusher is None or self._flusher.done():
+      return
+
+    try:
+      await asyncio.wait_for(self._record_queue.join(), timeout)
+    except asyncio.TimeoutError:
+      logger.warning(f"⚠️ 저장하지 못한 기상 기록 {self._record_queue.qsize()}개를 두고 종료합니다")
+
+    self._flusher.cancel()
+
 
 # Singleton instance
 _wake_up_manager: Optional[WakeUpManager] = None
@@ -137,3 +317,9 @@ def get_wake_up_manager() -> WakeUpManager:
   if _wake_up_manager is None:
     _wake_up_manager = WakeUpManager()
   return _wake_up_manager
+
+
+async def drain_wake_up_queue() -> None:
+  """싱글톤 매니저가 있으면 쓰기 큐에 남은 기상 기록을 저장 (앱 종료 시 호출)"""
+  if _wake_up_manager is not None:
+    await _wake_up_manager.drain()
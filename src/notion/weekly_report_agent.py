@@ -1,8 +1,7 @@
 import logging
 from datetime import datetime, timedelta
 from typing import Callable, Dict, List, Optional
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from .client import NotionClient
 from .db_initializer import ensure_db_schema
@@ -10,12 +9,15 @@ from .db_schema import get_weekly_report_schema
 from ..analyzers import WeeklyAnalyzer
 from ..common.notion_blocks import build_ai_feedback_blocks, append_blocks_batched
 from ..common.types import ReportProcessResult
-from ..common.singleton import SimpleSingleton
+from ..common.singleton import singleton_getter
 
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
+
+# generate_weekly_report 의 첫 진행 상태 (호출 측에서 초기 메시지에 미리 담아 보낼 수 있도록 공개)
+FIRST_PROGRESS_STATUS = "🔧 주간 리포트 DB 스키마 확인 중..."
 
 
 def get_week_range(year: int, week: int) -> tuple[str, str]:
@@ -98,7 +100,7 @@ class WeeklyReportManager:
 
     try:
       # 1. DB 스키마 확인 및 초기화
-      await update_progress("🔧 주간 리포트 DB 스키마 확인 중...")
+      await update_progress(FIRST_PROGRESS_STATUS)
       schema = get_weekly_report_schema()
       schema_ok = await ensure_db_schema(
           weekly_report_database_id,
@@ -226,13 +228,14 @@ class WeeklyReportManager:
       raise
 
 
-# Singleton instance
-_singleton = SimpleSingleton(WeeklyReportManager, param_name="ai_provider_type")
+# Singleton instance per AI provider
+# (제공자를 번갈아 요청해도 매번 새로 만들지 않도록 제공자별로 유지)
+_get_instance = singleton_getter(WeeklyReportManager, key_param="ai_provider_type")
 
 
 def get_weekly_report_manager(ai_provider_type: str = "claude") -> WeeklyReportManager:
   """
-  Get or create singleton WeeklyReportManager instance
+  Get or create singleton WeeklyReportManager instance for the AI provider
 
   Args:
       ai_provider_type: AI provider type (gemini, claude, ollama)
@@ -240,4 +243,4 @@ def get_weekly_report_manager(ai_provider_type: str = "claude") -> WeeklyReportM
   Returns:
       WeeklyReportManager instance
   """
-  return _singleton.get(ai_provider_type=ai_provider_type)
\ No newline at end of file
+  return _get_instance(ai_provider_type=ai_provider_type)
\ No newline at end of file
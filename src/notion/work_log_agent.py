@@ -3,19 +3,26 @@
 import logging
 from datetime import datetime
 from typing import Callable, Dict, Optional
-
-import pytz
+from zoneinfo import ZoneInfo
 
 from .client import NotionClient
 from .. import ai
 from ..common.prompt_utils import load_prompt
+from ..common.notion_blocks import build_ai_feedback_blocks, append_blocks_batched
 from ..common.notion_utils import extract_page_content
-from ..common.singleton import SimpleSingleton
+from ..common.singleton import singleton_getter
+from ..common.types import WorkLogProcessResult
 
 logger = logging.getLogger(__name__)
 
 # KST timezone
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
+
+# 속성 조회용 공유 빈 dict (조회마다 {} 를 새로 만들지 않음, 수정 금지)
+_EMPTY: Dict = {}
+
+# process_feedback 의 첫 진행 상태 (호출 측에서 초기 메시지에 미리 담아 보낼 수 있도록 공개)
+FIRST_PROGRESS_STATUS = "📋 업무일지 검색 중..."
 
 
 class WorkLogManager:
@@ -94,10 +101,10 @@ class WorkLogManager:
     """
     try:
       page = await self.client.get_page(page_id)
-      properties = page.get("properties", {})
+      properties = page.get("properties") or _EMPTY
 
-      feedback_status = properties.get("AI 검토 완료 여부", {})
-      status_value = feedback_status.get("select") or {}
+      feedback_status = properties.get("AI 검토 완료 여부") or _EMPTY
+      status_value = feedback_status.get("select") or _EMPTY
       status_name = status_value.get("name", "")
 
       is_completed = status_name == "완료"
@@ -168,8 +175,6 @@ class WorkLogManager:
     """
     try:
       # 공통 유틸을 사용해 블록 생성 및 배치 추가
-      from ..common.notion_blocks import build_ai_feedback_blocks, append_blocks_batched
-
       blocks = build_ai_feedback_blocks(feedback)
       await append_blocks_batched(self.client.client, page_id, blocks)
 
@@ -206,7 +211,7 @@ class WorkLogManager:
       database_id: str,
       flavor: str = "normal",
       progress_callback: Optional[Callable[[str], any]] = None
-  ) -> Dict[str, any]:
+  ) -> WorkLogProcessResult:
     """
     Process feedback workflow for a specific date
 
@@ -217,7 +222,7 @@ class WorkLogManager:
         progress_callback: Optional callback function to report progress
 
     Returns:
-        Result dictionary with status and message
+        WorkLogProcessResult (used_ai_provider, feedback 항상 포함)
 
     Raises:
         ValueError: If page not found or already completed
@@ -237,7 +242,7 @@ class WorkLogManager:
           logger.warning(f"⚠️ Progress callback failed: {e}")
 
     # 1. Find work log page
-    await update_progress("📋 업무일지 검색 중...")
+    await update_progress(FIRST_PROGRESS_STATUS)
     page = await self.find_work_log_by_date(date, database_id=database_id)
     if not page:
       raise ValueError(f"업무일지를 찾을 수 없습니다: {date}")
@@ -303,13 +308,14 @@ class WorkLogManager:
     }
 
 
-# Singleton instance
-_singleton = SimpleSingleton(WorkLogManager, param_name="ai_provider_type")
+# Singleton instance per AI provider
+# (제공자를 번갈아 요청해도 매번 새로 만들지 않도록 제공자별로 유지)
+_get_instance = singleton_getter(WorkLogManager, key_param="ai_provider_type")
 
 
 def get_work_log_manager(ai_provider_type: str = "claude") -> WorkLogManager:
   """
-  Get or create singleton WorkLogManager instance
+  Get or create singleton WorkLogManager instance for the AI provider
 
   Args:
       ai_provider_type: AI provider type (gemini, claude, ollama)
@@ -317,4 +323,4 @@ def get_work_log_manager(ai_provider_type: str = "claude") -> WorkLogManager:
   Returns:
       WorkLogManager instance
   """
-  return _singleton.get(ai_provider_type=ai_provider_type)
\ No newline at end of file
+  return _get_instance(ai_provider_type=ai_provider_type)
\ No newline at end of file
@@ -5,15 +5,20 @@ import logging
 import os
 from calendar import monthrange
 from datetime import datetime
+from zoneinfo import ZoneInfo
 
-import pytz
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from ..common.progress_utils import DebouncedProgress
+from ..common.slack_utils import MORNING_MESSAGE_BLOCKS, MORNING_MESSAGE_TEXT
+from ..notion.weekly_report_agent import get_weekly_report_manager
+from ..notion.monthly_report_agent import get_monthly_report_manager
+
 logger = logging.getLogger(__name__)
 
 # KST 시간대
-KST = pytz.timezone('Asia/Seoul')
+KST = ZoneInfo("Asia/Seoul")
 
 
 class MorningScheduler:
@@ -100,34 +105,10 @@ class MorningScheduler:
     try:
       logger.info("🌅 아침 메시지 발송 시작")
 
-      blocks = [
-        {
-          "type": "section",
-          "text": {
-            "type": "mrkdwn",
-            "text": "좋은 아침이에요! 오늘도 화이팅! 💪"
-          }
-        },
-        {
-          "type": "actions",
-          "elements": [
-            {
-              "type": "button",
-              "text": {
-                "type": "plain_text",
-                "text": "기상 완료"
-              },
-              "action_id": "wake_up_complete",
-              "style": "primary"
-            }
-          ]
-        }
-      ]
-
       await self.app.client.chat_postMessage(
           channel=self.wake_up_channel_id,
-          blocks=blocks,
-          text="좋은 아침이에요! 오늘도 화이팅! 💪"
+          blocks=MORNING_MESSAGE_BLOCKS,
+          text=MORNING_MESSAGE_TEXT
       )
 
       logger.info("✅ 아침 메시지 발송 완료")
@@ -157,11 +138,9 @@ class MorningScheduler:
         logger.warning("⚠️ No user database mapping found")
         return
 
-      # Import manager
-      from ..notion.weekly_report_agent import get_weekly_report_manager
-
       # Generate reports for each user
       for user_id, user_dbs in user_db_mapping.items():
+        progress = None
         try:
           user_alias = user_dbs.get("alias", "이름없음")
           work_log_db = user_dbs.get("work_log_db")
@@ -189,6 +168,9 @@ class MorningScheduler:
                 text=f"⏳ <@{user_id}>님의 {year}-W{week:02d} 주간 리포트 생성 중...\n📍 {status}"
             )
 
+          # 연속된 진행 상태는 묶어서 최신 상태만 전송
+          progress = DebouncedProgress(progress_update)
+
           # Generate report
           manager = get_weekly_report_manager(ai_provider_type="claude")
           result = await manager.generate_weekly_report(
@@ -196,9 +178,10 @@ class MorningScheduler:
               week=week,
               work_log_database_id=work_log_db,
               weekly_report_database_id=weekly_report_db,
-              progress_callback=progress_update,
+              progress_callback=progress,
               resume_page_id=resume_page
           )
+          await progress.cancel()
 
           # Update with success message
           page_url = result.get('page_url', '')
@@ -223,6 +206,8 @@ class MorningScheduler:
           logger.info(f"✅ Weekly report generated for {user_alias}")
 
         except Exception as e:
+          if progress:
+            await progress.cancel()
           logger.error(f"❌ Failed to generate weekly report for {user_alias}: {e}")
           try:
             await self.app.client.chat_postMessage(
@@ -259,11 +244,9 @@ class MorningScheduler:
         logger.warning("⚠️ No user database mapping found")
         return
 
-      # Import manager
-      from ..notion.monthly_report_agent import get_monthly_report_manager
-
       # Generate reports for each user
       for user_id, user_dbs in user_db_mapping.items():
+        progress = None
         try:
           user_alias = user_dbs.get("alias", "이름없음")
           weekly_report_db = user_dbs.get("weekly_report_db")
@@ -291,6 +274,9 @@ class MorningScheduler:
                 text=f"⏳ <@{user_id}>님의 {year}-{month:02d} 월간 리포트 생성 중...\n📍 {status}"
             )
 
+          # 연속된 진행 상태는 묶어서 최신 상태만 전송
+          progress = DebouncedProgress(progress_update)
+
           # Generate report
           manager = get_monthly_report_manager(ai_provider_type="claude")
           result = await manager.generate_monthly_report(
@@ -298,9 +284,10 @@ class MorningScheduler:
               month=month,
               weekly_report_database_id=weekly_report_db,
               monthly_report_database_id=monthly_report_db,
-              progress_callback=progress_update,
+              progress_callback=progress,
               resume_page_id=resume_page
           )
+          await progress.cancel()
 
           # Update with success message
           page_url = result.get('page_url', '')
@@ -325,6 +312,8 @@ class MorningScheduler:
           logger.info(f"✅ Monthly report generated for {user_alias}")
 
         except Exception as e:
+          if progress:
+            await progress.cancel()
           logger.error(f"❌ Failed to generate monthly report for {user_alias}: {e}")
           try:
             await self.app.client.chat_postMessage(
@@ -0,0 +1,48 @@
+"""async_utils 유닛 테스트"""
+
+import asyncio
+import unittest
+
+from src.common import async_utils
+from src.common.async_utils import fire_and_forget
+
+
+class TestFireAndForget(unittest.TestCase):
+    """fire_and_forget 함수 테스트"""
+
+    def test_runs_coroutine_in_background(self):
+        """코루틴을 백그라운드로 실행하고 끝나면 참조를 정리"""
+        async def run_test():
+            done = []
+
+            async def work():
+                done.append(True)
+
+            task = fire_and_forget(work(), "테스트 작업")
+            self.assertIn(task, async_utils._background_tasks)
+
+            await task
+            await asyncio.sleep(0)
+
+            self.assertEqual(done, [True])
+            self.assertNotIn(task, async_utils._background_tasks)
+
+        asyncio.run(run_test())
+
+    def test_error_is_logged_not_raised(self):
+        """에러는 로그만 남기고 호출 측으로 전파하지 않음"""
+        async def run_test():
+            async def work():
+                raise RuntimeError("boom")
+
+            with self.assertLogs("src.common.async_utils", level="WARNING") as logs:
+                fire_and_forget(work(), "테스트 작업")
+                await asyncio.sleep(0.01)
+
+            self.assertIn("테스트 작업 실패: boom", logs.output[0])
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""chat handlers 유닛 테스트"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.chat import handlers
+
+
+class _FakeApp:
+    """데코레이터로 등록된 리스너를 이름으로 보관하는 가짜 Bolt 앱"""
+
+    def __init__(self):
+        self.listeners = {}
+
+    def _register(self, key):
+        def decorator(func):
+            self.listeners[key] = func
+            return func
+        return decorator
+
+    def event(self, event, matchers=None):
+        return self._register(str(event))
+
+    def action(self, action_id):
+        return self._register(action_id)
+
+    def view(self, callback_id):
+        return self._register(callback_id)
+
+
+def _register_handlers():
+    """매니저 미리 생성 없이 chat 핸들러 등록"""
+    app = _FakeApp()
+    with patch.dict(os.environ, {"PREWARM_MANAGERS": "0"}):
+        handlers.register_chat_handlers(app)
+    return app.listeners
+
+
+def _work_log_view():
+    """업무일지 피드백 모달 제출 view"""
+    return {
+        "state": {
+            "values": {
+                "date_block": {"work_log_date": {"selected_date": "2025-01-01"}},
+                "feedback_flavor_block": {"feedback_flavor": {"selected_option": {"value": "normal"}}},
+                "ai_provider_block": {"ai_provider": {"selected_option": {"value": "claude"}}},
+            }
+        }
+    }
+
+
+class TestWorkLogFeedbackSubmission(unittest.TestCase):
+    """업무일지 피드백 모달 제출 핸들러 테스트"""
+
+    def _submit(self, client):
+        listeners = _register_handlers()
+        handler = listeners["work_log_feedback_modal"]
+        return handler(
+            ack=AsyncMock(),
+            body={"user": {"id": "U1"}},
+            client=client,
+            view=_work_log_view(),
+            logger=MagicMock(),
+        )
+
+    def test_manager_init_failure_updates_progress_message(self):
+        """매니저 생성 실패 시 이미 보낸 진행 메시지를 실패 메시지로 변경"""
+        async def run_test():
+            client = MagicMock()
+            client.chat_postMessage = AsyncMock(return_value={"ts": "1.0"})
+            client.chat_update = AsyncMock()
+
+            with patch.object(handlers, "get_user_database_mapping", return_value={"work_log_db": "db"}), \
+                    patch.object(handlers, "get_work_log_manager", side_effect=ValueError("API 키 없음")):
+                await self._submit(client)
+
+            client.chat_postMessage.assert_awaited_once()
+            client.chat_update.assert_awaited_once()
+            self.assertIn("API 키 없음", client.chat_update.await_args.kwargs["text"])
+            self.assertEqual(client.chat_update.await_args.kwargs["ts"], "1.0")
+
+        asyncio.run(run_test())
+
+    def test_initial_post_failure_reports_handler_failure(self):
+        """진행 메시지 전송이 실패하면 매니저를 만들지 않고 핸들러 실패로 알림"""
+        async def run_test():
+            client = MagicMock()
+            client.chat_postMessage = AsyncMock(side_effect=[RuntimeError("slack down"), {"ts": "2.0"}])
+            client.chat_update = AsyncMock()
+
+            get_manager = MagicMock()
+            with patch.object(handlers, "get_user_database_mapping", return_value={"work_log_db": "db"}), \
+                    patch.object(handlers, "get_work_log_manager", new=get_manager):
+                await self._submit(client)
+
+            get_manager.assert_not_called()
+            self.assertEqual(client.chat_postMessage.await_count, 2)
+            self.assertIn("오류가 발생했습니다", client.chat_postMessage.await_args.kwargs["text"])
+            client.chat_update.assert_not_awaited()
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
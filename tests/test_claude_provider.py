@@ -0,0 +1,28 @@
+"""ClaudeProvider 유닛 테스트"""
+
+import unittest
+
+from src.ai.claude import ClaudeProvider
+
+
+class TestParseOutput(unittest.TestCase):
+    """ClaudeProvider._parse_output 테스트"""
+
+    def test_returns_result_text(self):
+        """JSON 출력의 result 를 반환"""
+        self.assertEqual(ClaudeProvider._parse_output('{"result": " 피드백 ", "usage": {}}'), "피드백")
+
+    def test_plain_text_output(self):
+        """JSON 이 아니면 원문 그대로 반환"""
+        self.assertEqual(ClaudeProvider._parse_output("피드백\n"), "피드백")
+
+    def test_error_or_empty_result_raises(self):
+        """에러/빈 응답/예상하지 못한 JSON 은 fallback 이 동작하도록 예외 발생"""
+        for raw in ('{"is_error": true, "result": "overloaded"}', '{"result": ""}', "[]", ""):
+            with self.subTest(raw=raw):
+                with self.assertRaises(RuntimeError):
+                    ClaudeProvider._parse_output(raw)
+
+
+if __name__ == "__main__":
+    unittest.main()
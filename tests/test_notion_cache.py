@@ -0,0 +1,115 @@
+"""notion_cache 유닛 테스트"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from src.common import notion_cache
+from src.common.notion_cache import (
+    clear_page_content_cache,
+    get_cached_page_content,
+    get_cached_resume_content,
+)
+
+
+class TestNotionCache(unittest.TestCase):
+    """페이지 콘텐츠 캐시 테스트"""
+
+    def setUp(self):
+        """테스트 환경 설정"""
+        clear_page_content_cache()
+
+    def tearDown(self):
+        """테스트 정리"""
+        clear_page_content_cache()
+
+    def test_same_edit_time_hits_cache(self):
+        """last_edited_time이 같으면 다시 조회하지 않음"""
+        async def run_test():
+            with patch.object(notion_cache, "extract_page_content",
+                              new_callable=AsyncMock) as mock_extract:
+                mock_extract.return_value = "내용"
+
+                first = await get_cached_page_content(None, "page-1", "2025-12-01T00:00:00.000Z")
+                second = await get_cached_page_content(None, "page-1", "2025-12-01T00:00:00.000Z")
+
+                self.assertEqual(first, "내용")
+                self.assertEqual(second, "내용")
+                self.assertEqual(mock_extract.await_count, 1)
+
+        asyncio.run(run_test())
+
+    def test_edited_page_is_refetched(self):
+        """페이지가 수정되면 새로 조회"""
+        async def run_test():
+            with patch.object(notion_cache, "extract_page_content",
+                              new_callable=AsyncMock) as mock_extract:
+                mock_extract.side_effect = ["이전 내용", "새 내용"]
+
+                await get_cached_page_content(None, "page-1", "2025-12-01T00:00:00.000Z")
+                content = await get_cached_page_content(None, "page-1", "2025-12-02T00:00:00.000Z")
+
+                self.assertEqual(content, "새 내용")
+                self.assertEqual(mock_extract.await_count, 2)
+
+        asyncio.run(run_test())
+
+    def test_failed_fetch_is_not_cached(self):
+        """조회 실패는 캐시하지 않고 다음 요청에서 다시 조회"""
+        async def run_test():
+            with patch.object(notion_cache, "extract_page_content",
+                              new_callable=AsyncMock) as mock_extract:
+                mock_extract.side_effect = [RuntimeError("boom"), "내용"]
+
+                with self.assertRaises(RuntimeError):
+                    await get_cached_page_content(None, "page-1", "2025-12-01T00:00:00.000Z")
+                content = await get_cached_page_content(None, "page-1", "2025-12-01T00:00:00.000Z")
+
+                self.assertEqual(content, "내용")
+
+        asyncio.run(run_test())
+
+    def test_concurrent_misses_share_one_fetch(self):
+        """같은 페이지를 동시에 요청하면 한 번만 조회"""
+        async def run_test():
+            async def extract(notion_client, page_id, format="text"):
+                await asyncio.sleep(0.01)
+                return "내용"
+
+            with patch.object(notion_cache, "extract_page_content",
+                              new_callable=AsyncMock) as mock_extract:
+                mock_extract.side_effect = extract
+
+                contents = await asyncio.gather(*(
+                    get_cached_page_content(None, "page-1", "2025-12-01T00:00:00.000Z")
+                    for _ in range(3)
+                ))
+
+                self.assertEqual(contents, ["내용"] * 3)
+                self.assertEqual(mock_extract.await_count, 1)
+                self.assertEqual(notion_cache._inflight, {})
+
+        asyncio.run(run_test())
+
+    def test_resume_uses_page_edit_time(self):
+        """이력서는 pages.retrieve의 last_edited_time으로 캐시"""
+        async def run_test():
+            notion_client = AsyncMock()
+            notion_client.get_page.return_value = {"last_edited_time": "2025-12-01T00:00:00.000Z"}
+
+            with patch.object(notion_cache, "extract_page_content",
+                              new_callable=AsyncMock) as mock_extract:
+                mock_extract.return_value = "이력서"
+
+                await get_cached_resume_content(notion_client, "resume-1")
+                content = await get_cached_resume_content(notion_client, "resume-1")
+
+                self.assertEqual(content, "이력서")
+                self.assertEqual(mock_extract.await_count, 1)
+                self.assertEqual(notion_client.get_page.await_count, 2)
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
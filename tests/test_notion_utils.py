@@ -0,0 +1,127 @@
+"""notion_utils 유닛 테스트"""
+
+import asyncio
+import json
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.common.notion_utils import (
+    _parse_user_database_mapping,
+    extract_page_content,
+    get_user_database_mapping,
+    reload_user_database_mapping,
+)
+
+
+def _block(block_type, *texts):
+    """rich_text 블록 생성"""
+    return {
+        "type": block_type,
+        block_type: {
+            "rich_text": [{"plain_text": text} for text in texts]
+        },
+    }
+
+
+def _notion_client(*responses):
+    """blocks.children.list 응답을 순서대로 돌려주는 클라이언트"""
+    notion_client = MagicMock()
+    notion_client.client.blocks.children.list = AsyncMock(side_effect=list(responses))
+    return notion_client
+
+
+class TestExtractPageContent(unittest.TestCase):
+    """extract_page_content 함수 테스트"""
+
+    def test_paginates_all_blocks(self):
+        """has_more가 true면 next_cursor로 다음 블록을 조회"""
+        async def run_test():
+            notion_client = _notion_client(
+                {"results": [_block("paragraph", "첫 페이지")], "has_more": True, "next_cursor": "cursor-2"},
+                {"results": [_block("paragraph", "두 번째 페이지")], "has_more": False, "next_cursor": None},
+            )
+
+            content = await extract_page_content(notion_client, "page-1")
+
+            self.assertEqual(content, "첫 페이지\n두 번째 페이지")
+            calls = notion_client.client.blocks.children.list.await_args_list
+            self.assertEqual(len(calls), 2)
+            self.assertNotIn("start_cursor", calls[0].kwargs)
+            self.assertEqual(calls[1].kwargs["start_cursor"], "cursor-2")
+
+        asyncio.run(run_test())
+
+    def test_markdown_prefixes(self):
+        """마크다운 형식은 블록 타입별 접두사를 붙임"""
+        async def run_test():
+            notion_client = _notion_client({
+                "results": [
+                    _block("heading_2", "오늘 한 일"),
+                    _block("bulleted_list_item", "API ", "개선"),
+                    _block("paragraph", "본문"),
+                    {"type": "divider", "divider": {}},
+                ],
+                "has_more": False,
+            })
+
+            content = await extract_page_content(notion_client, "page-1", format="markdown")
+
+            self.assertEqual(content, "## 오늘 한 일\n\n- API 개선\n\n본문")
+
+        asyncio.run(run_test())
+
+    def test_error_is_raised(self):
+        """조회 실패는 빈 페이지와 구분되도록 예외 전파"""
+        async def run_test():
+            notion_client = MagicMock()
+            notion_client.client.blocks.children.list = AsyncMock(side_effect=RuntimeError("boom"))
+
+            with self.assertRaises(RuntimeError):
+                await extract_page_content(notion_client, "page-1")
+
+        asyncio.run(run_test())
+
+
+
+class TestGetUserDatabaseMapping(unittest.TestCase):
+    """get_user_database_mapping 함수 테스트"""
+
+    def setUp(self):
+        reload_user_database_mapping()
+
+    def tearDown(self):
+        reload_user_database_mapping()
+
+    def test_parses_mapping_once(self):
+        """환경 변수가 같으면 다시 파싱하지 않음"""
+        mapping = json.dumps({"U1": {"work_log_db": "db-1"}})
+        with patch.dict(os.environ, {"NOTION_USER_DATABASE_MAPPING": mapping}):
+            self.assertEqual(get_user_database_mapping("U1"), {"work_log_db": "db-1"})
+            self.assertIsNone(get_user_database_mapping("U2"))
+
+        info = _parse_user_database_mapping.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_env_change_is_picked_up(self):
+        """환경 변수가 바뀌면 새 값으로 파싱"""
+        with patch.dict(os.environ, {"NOTION_USER_DATABASE_MAPPING": "{}"}):
+            self.assertIsNone(get_user_database_mapping("U1"))
+        with patch.dict(os.environ, {"NOTION_USER_DATABASE_MAPPING": '{"U1": {"work_log_db": "db-1"}}'}):
+            self.assertEqual(get_user_database_mapping("U1"), {"work_log_db": "db-1"})
+
+    def test_invalid_json_raises_value_error(self):
+        """JSON 형식이 잘못되면 ValueError"""
+        with patch.dict(os.environ, {"NOTION_USER_DATABASE_MAPPING": "{invalid"}):
+            with self.assertRaises(ValueError):
+                get_user_database_mapping("U1")
+            with self.assertRaises(ValueError):
+                get_user_database_mapping("U2")
+
+        # 파싱 실패도 캐시되어 다시 파싱하지 않음
+        self.assertEqual(_parse_user_database_mapping.cache_info().misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
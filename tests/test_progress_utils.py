@@ -0,0 +1,134 @@
+"""progress_utils 유닛 테스트"""
+
+import asyncio
+import unittest
+
+from src.common.progress_utils import DebouncedProgress
+
+
+class TestDebouncedProgress(unittest.TestCase):
+    """DebouncedProgress 테스트"""
+
+    def test_coalesces_to_latest_status(self):
+        """간격 내에 들어온 상태는 마지막 것만 전송"""
+        async def run_test():
+            sent = []
+
+            async def send(status):
+                sent.append(status)
+
+            progress = DebouncedProgress(send, min_interval=0.05)
+            await progress("1단계")
+            await progress("2단계")
+            await progress("3단계")
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(sent, ["1단계", "3단계"])
+
+        asyncio.run(run_test())
+
+    def test_terminal_status_is_sent_immediately(self):
+        """완료/실패 상태는 즉시 전송"""
+        async def run_test():
+            sent = []
+
+            async def send(status):
+                sent.append(status)
+
+            progress = DebouncedProgress(send, min_interval=10)
+            await progress("시작")
+            await progress("진행 중")
+            await progress("조회 완료")
+            await progress.cancel()
+
+            self.assertEqual(sent, ["시작", "조회 완료"])
+
+        asyncio.run(run_test())
+
+    def test_cancel_drops_pending_status(self):
+        """cancel 후에는 대기 중인 상태를 전송하지 않음"""
+        async def run_test():
+            sent = []
+
+            async def send(status, current, total):
+                sent.append((status, current, total))
+
+            progress = DebouncedProgress(send, min_interval=0.05)
+            await progress("분석 중", 1, 3)
+            await progress("분석 중", 2, 3)
+            await progress.cancel()
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(sent, [("분석 중", 1, 3)])
+
+        asyncio.run(run_test())
+
+    def test_initial_status_is_not_resent(self):
+        """초기 메시지에 담아 보낸 상태와 같은 상태는 다시 전송하지 않음"""
+        async def run_test():
+            sent = []
+
+            async def send(status):
+                sent.append(status)
+
+            progress = DebouncedProgress(send, min_interval=0.05, initial_status="검색 중")
+            await progress("검색 중")
+            await asyncio.sleep(0.1)
+            await progress("분석 중")
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(sent, ["분석 중"])
+
+        asyncio.run(run_test())
+
+    def test_send_does_not_block_caller(self):
+        """전송은 백그라운드로 진행되어 호출 측은 기다리지 않음"""
+        async def run_test():
+            release = asyncio.Event()
+            sent = []
+
+            async def send(status):
+                await release.wait()
+                sent.append(status)
+
+            progress = DebouncedProgress(send, min_interval=0)
+            await asyncio.wait_for(progress("시작"), timeout=0.1)
+            self.assertEqual(sent, [])
+
+            release.set()
+            await progress.cancel()
+            self.assertEqual(sent, ["시작"])
+
+        asyncio.run(run_test())
+
+    def test_interval_backs_off_after_many_sends(self):
+        """전송이 backoff_every 회 쌓이면 간격이 두 배로 늘어남 (상한 max_interval)"""
+        async def run_test():
+            async def send(status):
+                pass
+
+            progress = DebouncedProgress(send, min_interval=1.0, backoff_every=2, max_interval=3.0)
+            for i in range(6):
+                progress._pending = (f"상태 {i}",)
+                progress._dispatch()
+            await progress.cancel()
+
+            self.assertEqual(progress._min_interval, 3.0)
+
+        asyncio.run(run_test())
+
+    def test_send_error_does_not_propagate(self):
+        """전송 실패는 메인 플로우에 전파되지 않음"""
+        async def run_test():
+            async def send(status):
+                raise RuntimeError("rate limited")
+
+            progress = DebouncedProgress(send)
+            await progress("시작")
+            await progress.flush()
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
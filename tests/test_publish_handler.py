@@ -7,6 +7,7 @@ from src.commands.publish_handler import (
     extract_title_from_page,
     extract_tags_from_page,
     extract_date_from_page,
+    extract_page_fields,
 )
 
 
@@ -252,5 +253,44 @@ class TestExtractDateFromPage(unittest.TestCase):
         self.assertEqual(result, "2025-01-01")
 
 
+class TestExtractPageFields(unittest.TestCase):
+    """extract_page_fields 함수 테스트"""
+
+    def test_extracts_all_fields(self):
+        """제목, 태그, 날짜를 함께 추출"""
+        page = {
+            "properties": {
+                "작성일": {"type": "date", "date": {"start": "2025-12-08"}},
+                "기술스택": {"type": "multi_select", "multi_select": [{"name": "Python"}]},
+                "제목": {"type": "title", "title": [{"plain_text": "업무일지"}]},
+            }
+        }
+
+        result = extract_page_fields(page)
+
+        self.assertEqual(result, ("업무일지", ["Python"], "2025-12-08"))
+
+    def test_prefers_earlier_property_names(self):
+        """후보 이름이 여러 개면 순서와 관계없이 앞선 이름을 우선"""
+        page = {
+            "properties": {
+                "tags": {"type": "multi_select", "multi_select": [{"name": "B"}]},
+                "Date": {"type": "date", "date": {"start": "2025-12-15"}},
+                "Tags": {"type": "select", "select": {"name": "A"}},
+                "작성일": {"type": "date", "date": {"start": "2025-12-08"}},
+            }
+        }
+
+        title, tags, date = extract_page_fields(page)
+
+        self.assertEqual(title, "")
+        self.assertEqual(tags, ["A"])
+        self.assertEqual(date, "2025-12-08")
+
+    def test_missing_date_is_none(self):
+        """날짜 속성이 없으면 None"""
+        self.assertIsNone(extract_page_fields({"properties": {}})[2])
+
+
 if __name__ == "__main__":
     unittest.main()
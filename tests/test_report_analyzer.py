@@ -0,0 +1,96 @@
+"""BaseReportAnalyzer 유닛 테스트"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from src.analyzers.base import BaseReportAnalyzer
+
+
+class _Analyzer(BaseReportAnalyzer):
+    """테스트용 분석기"""
+
+    entry_label = "업무일지"
+    prompt_suffix = "{work_logs}"
+    entries_placeholder = "work_logs"
+
+    def extract_metadata(self, page):
+        return {"page_id": page["id"]}
+
+    def format_entry(self, metadata, content):
+        return content
+
+
+class _EntryAnalyzer(_Analyzer):
+    """페이지 ID 를 항목 헤더로 붙이는 테스트용 분석기"""
+
+    def format_entry(self, metadata, content):
+        return f"[{metadata['page_id']}] {content}"
+
+
+class TestReportAnalyzerRun(unittest.TestCase):
+    """BaseReportAnalyzer.run 테스트"""
+
+    def test_page_fetches_are_bounded(self):
+        """페이지 본문은 최대 3개까지만 동시에 조회"""
+        async def run_test():
+            active = 0
+            peak = 0
+
+            async def fetch(notion_client, page_id, last_edited_time, format):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return f"본문 {page_id}"
+
+            pages = [{"id": str(i)} for i in range(8)]
+            with patch("src.analyzers.base.get_cached_page_content", new=fetch), \
+                    patch("src.analyzers.base.get_cached_response", return_value=("분석", "claude")):
+                result = await _Analyzer().run(pages, notion_client=None)
+
+            self.assertEqual(result, "분석")
+            self.assertEqual(peak, 3)
+
+        asyncio.run(run_test())
+
+    def test_empty_page_is_still_analyzed(self):
+        """본문이 비어 있는 페이지도 메타데이터와 함께 분석에 포함"""
+        async def run_test():
+            async def fetch(notion_client, page_id, last_edited_time, format):
+                return "" if page_id == "1" else "본문"
+
+            generate = AsyncMock(return_value=("분석", "claude"))
+            with patch("src.analyzers.base.get_cached_page_content", new=fetch), \
+                    patch("src.analyzers.base.ai.generate_with_gemini_fallback", new=generate):
+                result = await _EntryAnalyzer().run([{"id": "0"}, {"id": "1"}], notion_client=None)
+
+            self.assertEqual(result, "분석")
+            prompt = generate.await_args.kwargs["prompt"]
+            self.assertIn("[0] 본문", prompt)
+            self.assertIn("---\n\n[1]", prompt)
+
+        asyncio.run(run_test())
+
+    def test_fetch_error_fails_run(self):
+        """본문 조회가 실패하면 일부만 분석하지 않고 예외 전파"""
+        async def run_test():
+            async def fetch(notion_client, page_id, last_edited_time, format):
+                if page_id == "1":
+                    raise RuntimeError("rate limited")
+                return "본문"
+
+            generate = AsyncMock()
+            with patch("src.analyzers.base.get_cached_page_content", new=fetch), \
+                    patch("src.analyzers.base.ai.generate_with_gemini_fallback", new=generate):
+                with self.assertRaises(RuntimeError):
+                    await _Analyzer().run([{"id": "0"}, {"id": "1"}], notion_client=None)
+
+            generate.assert_not_awaited()
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
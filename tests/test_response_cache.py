@@ -0,0 +1,76 @@
+"""AI 응답 캐시 키 유닛 테스트"""
+
+import asyncio
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from src.common import response_cache
+from src.common.response_cache import make_response_key
+
+
+class TestMakeResponseKey(unittest.TestCase):
+    """make_response_key 테스트"""
+
+    def test_same_input_same_key(self):
+        """같은 입력과 설정이면 같은 키"""
+        self.assertEqual(
+            make_response_key("claude", "system", "prompt"),
+            make_response_key("claude", "system", "prompt"),
+        )
+
+    def test_model_change_changes_key(self):
+        """기본 제공자나 fallback(Gemini) 모델이 바뀌면 다른 키"""
+        for env_var in ("ANTHROPIC_MODEL", "GEMINI_MODEL"):
+            with self.subTest(env_var=env_var):
+                with patch.dict(os.environ, {env_var: "model-a"}):
+                    key_a = make_response_key("claude", "system", "prompt")
+                with patch.dict(os.environ, {env_var: "model-b"}):
+                    key_b = make_response_key("claude", "system", "prompt")
+                self.assertNotEqual(key_a, key_b)
+
+    def test_cache_version_changes_key(self):
+        """캐시 버전을 올리면 다른 키"""
+        key = make_response_key("gemini", "system", "prompt")
+        with patch.object(response_cache, "CACHE_VERSION", "next"):
+            self.assertNotEqual(make_response_key("gemini", "system", "prompt"), key)
+
+
+
+class _FakeCache:
+    """호출된 스레드를 기록하는 dict 기반 가짜 diskcache"""
+
+    def __init__(self):
+        self.data = {}
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.threads.append(threading.current_thread())
+        self.data[key] = value
+
+
+class TestCachedResponse(unittest.TestCase):
+    """get_cached_response / store_response 테스트"""
+
+    def test_round_trip_runs_off_event_loop(self):
+        """저장한 응답을 다시 읽고, diskcache I/O 는 이벤트 루프 스레드 밖에서 실행"""
+        async def run_test():
+            cache = _FakeCache()
+            with patch.object(response_cache, "_get_cache", return_value=cache):
+                await response_cache.store_response("key", "분석", "claude")
+                cached = await response_cache.get_cached_response("key")
+
+            self.assertEqual(cached, ("분석", "claude"))
+            self.assertEqual(len(cache.threads), 2)
+            self.assertNotIn(threading.current_thread(), cache.threads)
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
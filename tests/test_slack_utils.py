@@ -0,0 +1,114 @@
+"""slack_utils 유닛 테스트"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from slack_sdk.errors import SlackApiError
+
+from src.common.slack_utils import (
+    post_thread_chunks,
+    slack_call_with_retry,
+    split_text_for_slack,
+)
+
+
+def _slack_error(error, status_code=200, headers=None):
+    """SlackApiError 생성"""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.get = lambda key, default=None: {"ok": False, "error": error}.get(key, default)
+    return SlackApiError(error, response)
+
+
+class TestSlackCallWithRetry(unittest.TestCase):
+    """slack_call_with_retry 함수 테스트"""
+
+    def test_retries_rate_limited_call(self):
+        """429 응답은 Retry-After 만큼 기다린 뒤 재시도"""
+        async def run_test():
+            call = AsyncMock(side_effect=[
+                _slack_error("ratelimited", 429, {"Retry-After": "2"}),
+                {"ok": True},
+            ])
+
+            with patch("src.common.slack_utils.asyncio.sleep", new=AsyncMock()) as sleep:
+                result = await slack_call_with_retry(call)
+
+            self.assertEqual(result, {"ok": True})
+            self.assertEqual(call.await_count, 2)
+            sleep.assert_awaited_once_with(2.0)
+
+        asyncio.run(run_test())
+
+    def test_permanent_error_is_not_retried(self):
+        """영구적인 에러는 바로 발생"""
+        async def run_test():
+            call = AsyncMock(side_effect=_slack_error("channel_not_found"))
+
+            with self.assertRaises(SlackApiError):
+                await slack_call_with_retry(call)
+
+            self.assertEqual(call.await_count, 1)
+
+        asyncio.run(run_test())
+
+    def test_gives_up_after_max_attempts(self):
+        """최대 시도 횟수를 넘으면 마지막 에러 발생"""
+        async def run_test():
+            call = AsyncMock(side_effect=_slack_error("internal_error", 500))
+
+            with patch("src.common.slack_utils.asyncio.sleep", new=AsyncMock()):
+                with self.assertRaises(SlackApiError):
+                    await slack_call_with_retry(call, max_attempts=3)
+
+            self.assertEqual(call.await_count, 3)
+
+        asyncio.run(run_test())
+
+
+class TestSplitTextForSlack(unittest.TestCase):
+    """split_text_for_slack 함수 테스트"""
+
+    def test_splits_by_max_len(self):
+        """max_len 단위로 분할"""
+        self.assertEqual(list(split_text_for_slack("abcde", max_len=2)), ["ab", "cd", "e"])
+
+    def test_empty_text(self):
+        """빈 텍스트는 청크 없음"""
+        self.assertEqual(list(split_text_for_slack("")), [])
+
+
+
+class TestPostThreadChunks(unittest.TestCase):
+    """post_thread_chunks 함수 테스트"""
+
+    def test_single_chunk_is_posted_as_is(self):
+        """한 메시지에 담기면 그대로 게시"""
+        async def run_test():
+            client = MagicMock()
+            client.chat_postMessage = AsyncMock()
+
+            await post_thread_chunks(client, "C1", "1.0", "hello")
+
+            client.chat_postMessage.assert_awaited_once_with(channel="C1", thread_ts="1.0", text="hello")
+
+        asyncio.run(run_test())
+
+    def test_multiple_chunks_are_posted_in_order(self):
+        """여러 청크는 앞에서부터 순서대로 게시"""
+        async def run_test():
+            client = MagicMock()
+            client.chat_postMessage = AsyncMock()
+
+            await post_thread_chunks(client, "C1", "1.0", "aaaaabbbbbc", max_len=5)
+
+            texts = [call.kwargs["text"] for call in client.chat_postMessage.await_args_list]
+            self.assertEqual(texts, ["aaaaa", "bbbbb", "c"])
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""WakeUpManager 쓰기 큐 유닛 테스트"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.notion.wake_up import WakeUpManager
+
+
+def _manager(client):
+    """테스트용 WakeUpManager 생성"""
+    with patch.dict(os.environ, {"NOTION_WAKE_UP_DATABASE_ID": "db"}):
+        return WakeUpManager(client=client)
+
+
+class TestEnqueueWakeUp(unittest.TestCase):
+    """enqueue_wake_up 테스트"""
+
+    def test_queued_records_are_written_in_background(self):
+        """큐에 넣은 기록은 백그라운드에서 모두 저장"""
+        async def run_test():
+            client = MagicMock()
+            client.create_page = AsyncMock(return_value={"id": "page"})
+            manager = _manager(client)
+
+            for user_id in ("U1", "U2", "U1"):
+                manager.enqueue_wake_up(user_id)
+            self.assertEqual(client.create_page.await_count, 0)
+
+            await asyncio.sleep(0.01)
+
+            self.assertEqual(client.create_page.await_count, 3)
+            self.assertEqual(manager._pending_counts, {})
+            manager._flusher.cancel()
+
+        asyncio.run(run_test())
+
+    def test_count_includes_pending_records(self):
+        """저장 전인 기록도 기상 횟수에 포함"""
+        async def run_test():
+            client = MagicMock()
+            client.create_page = AsyncMock(return_value={"id": "page"})
+            client.query_database = AsyncMock(return_value=[{}, {}])
+            manager = _manager(client)
+            self.assertEqual(await manager.get_wake_up_count("U1"), 2)
+
+            manager.enqueue_wake_up("U1")
+            self.assertEqual(await manager.get_wake_up_count("U1"), 3)
+
+            await asyncio.sleep(0.01)
+            self.assertEqual(await manager.get_wake_up_count("U1"), 3)
+            self.assertEqual(client.query_database.await_count, 1)
+            manager._flusher.cancel()
+
+        asyncio.run(run_test())
+
+    def test_failed_write_is_not_counted(self):
+        """저장에 실패한 기록은 대기 개수에서 빠지고 on_error 로 알린 뒤 flusher 는 계속 동작"""
+        async def run_test():
+            client = MagicMock()
+            client.create_page = AsyncMock(side_effect=[RuntimeError("boom"), {"id": "page"}])
+            manager = _manager(client)
+            on_error = AsyncMock()
+
+            manager.enqueue_wake_up("U1", on_error=on_error)
+            await asyncio.sleep(0.01)
+            self.assertEqual(manager._pending_counts, {})
+            on_error.assert_awaited_once()
+            self.assertEqual(str(on_error.await_args.args[0]), "boom")
+
+            manager.enqueue_wake_up("U1")
+            await asyncio.sleep(0.01)
+            self.assertEqual(client.create_page.await_count, 2)
+            manager._flusher.cancel()
+
+        asyncio.run(run_test())
+
+    def test_count_after_cache_miss_includes_concurrent_write(self):
+        """캐시가 없을 때 조회와 저장이 겹쳐도 방금 넣은 기록을 한 번만 셈"""
+        async def run_test():
+            rows = [{}, {}]
+            client = MagicMock()
+
+            async def create_page(database_id, properties):
+                await asyncio.sleep(0.01)
+                rows.append({})
+                return {"id": "page"}
+
+            async def query_database(database_id, filter_params):
+                snapshot = list(rows)
+                await asyncio.sleep(0.02)
+                return snapshot
+
+            client.create_page = AsyncMock(side_effect=create_page)
+            client.query_database = AsyncMock(side_effect=query_database)
+            manager = _manager(client)
+
+            manager.enqueue_wake_up("U1")
+            self.assertEqual(await manager.get_wake_up_count("U1"), 3)
+            self.assertEqual(await manager.get_wake_up_count("U1"), 3)
+            manager._flusher.cancel()
+
+        asyncio.run(run_test())
+
+    def test_drain_writes_queued_records(self):
+        """drain 은 큐에 남은 기록을 모두 저장한 뒤 flusher 를 종료"""
+        async def run_test():
+            client = MagicMock()
+
+            async def create_page(database_id, properties):
+                await asyncio.sleep(0.01)
+                return {"id": "page"}
+
+            client.create_page = AsyncMock(side_effect=create_page)
+            manager = _manager(client)
+
+            for _ in range(5):
+                manager.enqueue_wake_up("U1")
+            await manager.drain()
+
+            self.assertEqual(client.create_page.await_count, 5)
+            await asyncio.sleep(0)
+            self.assertTrue(manager._flusher.done())
+
+        asyncio.run(run_test())
+
+
+if __name__ == "__main__":
+    unittest.main()